@@ -20,14 +20,17 @@ class PokemonDataService {
     final listData = json.decode(listJson) as List;
     _pokemonList = listData.map((e) => Pokemon.fromJson(e as Map<String, dynamic>)).toList();
 
+    // Index values are positions in pokemon.json; older builds embedded full entries.
+    Pokemon resolve(dynamic value) => value is int
+        ? _pokemonList![value]
+        : Pokemon.fromJson(value as Map<String, dynamic>);
+
     final byNumberJson = await rootBundle.loadString(_pokemonByNumberPath);
     final byNumberData = json.decode(byNumberJson) as Map<String, dynamic>;
     _pokemonByNumber = {};
     for (final entry in byNumberData.entries) {
       final number = int.parse(entry.key);
-      final list = (entry.value as List)
-          .map((e) => Pokemon.fromJson(e as Map<String, dynamic>))
-          .toList();
+      final list = (entry.value as List).map(resolve).toList();
       _pokemonByNumber![number] = list;
     }
 
@@ -35,16 +38,14 @@ class PokemonDataService {
     final byNameData = json.decode(byNameJson) as Map<String, dynamic>;
     _pokemonByName = {};
     for (final entry in byNameData.entries) {
-      _pokemonByName![entry.key] = Pokemon.fromJson(entry.value as Map<String, dynamic>);
+      _pokemonByName![entry.key] = resolve(entry.value);
     }
 
     final byBaseNameJson = await rootBundle.loadString(_pokemonByBaseNamePath);
     final byBaseNameData = json.decode(byBaseNameJson) as Map<String, dynamic>;
     _pokemonByBaseName = {};
     for (final entry in byBaseNameData.entries) {
-      final list = (entry.value as List)
-          .map((e) => Pokemon.fromJson(e as Map<String, dynamic>))
-          .toList();
+      final list = (entry.value as List).map(resolve).toList();
       _pokemonByBaseName![entry.key] = list;
     }
   }
@@ -1,63 +1,49 @@
 #!/usr/bin/env python3
-import json
-
-with open('assets/data/pokemon.json') as f:
-    pokemon_list = json.load(f)
-
-with open('data/abilities.json') as f:
-    abilities = json.load(f)
-
-# Collect all pokemon names in abilities file
-all_ability_pokemon = set()
-for ability_data in abilities.values():
-    all_ability_pokemon.update(ability_data['pokemon']['regular'])
-    all_ability_pokemon.update(ability_data['pokemon']['hidden'])
-
-# The 9 remaining forms without abilities
-missing = [
-    'Dragonite Mega Dragonite',
-    'Eevee Partner Eevee',
-    'Eternatus Eternamax',
-    'Hawlucha Mega Hawlucha',
-    'Malamar Mega Malamar',
-    'Pikachu Partner Pikachu',
-    'Tatsugiri Droopy Form',
-    'Tatsugiri Stretchy Form',
-    'Victreebel Mega Victreebel'
-]
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "scripts"))
+
+from add_abilities_to_pokemon import build_pokemon_abilities, match_ability_key
+from championdex_data import pokemon, scraped
+
+pokemon_list = pokemon()
+# add_abilities_to_pokemon.py maps the scraped ability pages, so compare against those
+abilities = scraped("abilities.json")
+
+# Pokemon name (as abilities.json spells it) -> {"regular": [...], "hidden": [...]}
+pokemon_abilities = build_pokemon_abilities(abilities)
+
+# Forms that none of add_abilities_to_pokemon's name strategies map to the abilities file
+missing = [p for p in pokemon_list if match_ability_key(p, pokemon_abilities) is None]
 
 print("POKEMON FORMS NOT IN ABILITIES FILE")
 print("=" * 80)
 print()
 
-for target_name in missing:
-    for p in pokemon_list:
-        if p['name'] == target_name:
-            base_name = p.get('base_name')
-            variant = p.get('variant')
-            
-            print(f"NAME: {target_name}")
-            print(f"  base_name: {base_name}")
-            print(f"  variant: {variant}")
-            
-            # Check what's available for the base form
-            base_abilities = []
-            for ability_data in abilities.values():
-                if base_name in ability_data['pokemon']['regular']:
-                    base_abilities.append((ability_data['name'], 'regular'))
-                elif base_name in ability_data['pokemon']['hidden']:
-                    base_abilities.append((ability_data['name'], 'hidden'))
-            
-            if base_abilities:
-                print(f"  Base form '{base_name}' abilities:")
-                for ability, ability_type in base_abilities:
-                    print(f"    - {ability} ({ability_type})")
-            else:
-                print(f"  Base form '{base_name}' has NO abilities in file")
-            
-            # Check what's available for the variant specifically
-            variant_in_file = variant in all_ability_pokemon if variant else False
-            print(f"  Variant '{variant}' in abilities file: {variant_in_file}")
-            
-            print()
-            break
+for p in missing:
+    base_name = p.get('base_name')
+    variant = p.get('variant')
+
+    print(f"NAME: {p['name']}")
+    print(f"  base_name: {base_name}")
+    print(f"  variant: {variant}")
+
+    # Check what's available for the base form
+    base_slots = pokemon_abilities.get(base_name, {"regular": [], "hidden": []})
+    base_abilities = [(ability, 'regular') for ability in base_slots['regular']]
+    base_abilities += [(ability, 'hidden') for ability in base_slots['hidden']
+                       if ability not in base_slots['regular']]
+
+    if base_abilities:
+        print(f"  Base form '{base_name}' abilities:")
+        for ability, ability_type in base_abilities:
+            print(f"    - {ability} ({ability_type})")
+    else:
+        print(f"  Base form '{base_name}' has NO abilities in file")
+
+    # Check what's available for the variant specifically
+    variant_in_file = variant in pokemon_abilities if variant else False
+    print(f"  Variant '{variant}' in abilities file: {variant_in_file}")
+
+    print()
@@ -4,21 +4,24 @@ Add abilities mapping to pokemon.json from abilities.json
 Maps each pokemon form to its regular and hidden abilities for fast bidirectional lookup.
 """
 import json
+import sys
 from pathlib import Path
 
-def main():
-    # Load files
-    project_root = Path(__file__).parent.parent
-    abilities_path = project_root / "data" / "abilities.json"
-    pokemon_path = project_root / "assets" / "data" / "pokemon.json"
-    
-    with open(abilities_path) as f:
-        abilities_data = json.load(f)
-    
-    with open(pokemon_path) as f:
-        pokemon_data = json.load(f)
-    
-    # Create reverse mapping: pokemon name -> abilities
+# Add scripts directory to path for relative imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from asset_writer import write_json
+from pokemon_indexes import repair_mojibake
+
+# Cosmetic forms the ability pages only list under one of their siblings
+FORM_ALIASES = {
+    "Tatsugiri Droopy Form": "Tatsugiri Curly Form",
+    "Tatsugiri Stretchy Form": "Tatsugiri Curly Form",
+}
+
+
+def build_pokemon_abilities(abilities_data):
+    """Reverse mapping: pokemon name (as abilities.json spells it) -> {"regular": [...], "hidden": [...]}."""
     pokemon_abilities = {}
     
     for ability_name, ability_info in abilities_data.items():
@@ -35,6 +38,52 @@ def main():
                 pokemon_abilities[pokemon_name] = {"regular": [], "hidden": []}
             if ability_name not in pokemon_abilities[pokemon_name]["hidden"]:
                 pokemon_abilities[pokemon_name]["hidden"].append(ability_name)
+
+    # The ability pages list some hidden abilities under both slots; keep those as hidden only
+    for slots in pokemon_abilities.values():
+        slots["regular"] = [a for a in slots["regular"] if a not in slots["hidden"]]
+    return pokemon_abilities
+
+
+def match_ability_key(pokemon, pokemon_abilities):
+    """The pokemon_abilities key a pokemon.json entry maps to, or None."""
+    pokemon_name = pokemon["name"]
+    pokemon_variant = pokemon.get("variant")
+    pokemon_base_name = pokemon.get("base_name")
+    
+    # Strategy 1: Exact match on full name (pokemon.json spells a few as mojibake, "Nidoranâ™€")
+    if pokemon_name in pokemon_abilities:
+        return pokemon_name
+    if repair_mojibake(pokemon_name) in pokemon_abilities:
+        return repair_mojibake(pokemon_name)
+    # Strategy 2: Match on variant name only
+    if pokemon_variant and pokemon_variant in pokemon_abilities:
+        return pokemon_variant
+    # Strategy 3: Match on "base_name variant" format
+    if pokemon_base_name and pokemon_variant and f'{pokemon_base_name} {pokemon_variant}' in pokemon_abilities:
+        return f'{pokemon_base_name} {pokemon_variant}'
+    # Strategy 4: Match on "variant base_name" format (for reversed order like "Trash Cloak Burmy")
+    if pokemon_base_name and pokemon_variant and f'{pokemon_variant} {pokemon_base_name}' in pokemon_abilities:
+        return f'{pokemon_variant} {pokemon_base_name}'
+    # Strategy 5: Cosmetic form listed under a sibling
+    if FORM_ALIASES.get(pokemon_name) in pokemon_abilities:
+        return FORM_ALIASES[pokemon_name]
+    return None
+
+
+def main():
+    # Load files
+    project_root = Path(__file__).parent.parent
+    abilities_path = project_root / "data" / "abilities.json"
+    pokemon_path = project_root / "assets" / "data" / "pokemon.json"
+    
+    with open(abilities_path) as f:
+        abilities_data = json.load(f)
+    
+    with open(pokemon_path) as f:
+        pokemon_data = json.load(f)
+    
+    pokemon_abilities = build_pokemon_abilities(abilities_data)
     
     # Add abilities to each pokemon in pokemon.json
     updated_count = 0
@@ -43,24 +92,7 @@ def main():
     
     for pokemon in pokemon_data:
         pokemon_name = pokemon["name"]
-        pokemon_variant = pokemon.get("variant")
-        pokemon_base_name = pokemon.get("base_name")
-        
-        # Try multiple matching strategies
-        matched_name = None
-        
-        # Strategy 1: Exact match on full name
-        if pokemon_name in pokemon_abilities:
-            matched_name = pokemon_name
-        # Strategy 2: Match on variant name only
-        elif pokemon_variant and pokemon_variant in pokemon_abilities:
-            matched_name = pokemon_variant
-        # Strategy 3: Match on "base_name variant" format
-        elif pokemon_base_name and pokemon_variant and f'{pokemon_base_name} {pokemon_variant}' in pokemon_abilities:
-            matched_name = f'{pokemon_base_name} {pokemon_variant}'
-        # Strategy 4: Match on "variant base_name" format (for reversed order like "Trash Cloak Burmy")
-        elif pokemon_base_name and pokemon_variant and f'{pokemon_variant} {pokemon_base_name}' in pokemon_abilities:
-            matched_name = f'{pokemon_variant} {pokemon_base_name}'
+        matched_name = match_ability_key(pokemon, pokemon_abilities)
         
         if matched_name:
             # Add abilities field
@@ -79,8 +111,7 @@ def main():
             not_found_pokemon.append(pokemon_name)
     
     # Save updated pokemon.json
-    with open(pokemon_path, 'w') as f:
-        json.dump(pokemon_data, f, indent=2, ensure_ascii=False)
+    write_json(pokemon_path, pokemon_data, ensure_ascii=True)
     
     print(f"✅ Successfully updated pokemon.json")
     print(f"   - {updated_count} pokemon updated with abilities")
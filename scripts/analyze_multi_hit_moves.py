@@ -1,18 +1,21 @@
 #!/usr/bin/env python3
 """Analyze and categorize multi-hit moves from moves.json."""
 
-import json
+import sys
+from pathlib import Path
 
-# Load moves data
-with open('assets/data/moves.json', 'r') as f:
-    moves = json.load(f)
+# Add scripts directory to path for relative imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from championdex_data import moves
 
 # Find multi-hit moves by analyzing in_depth_effect and secondary_effect
 multi_hit_moves = []
 
-for move in moves:
-    name = move.get('name', '')
+for name, move in moves().items():
     in_depth = move.get('in_depth_effect', '') or ''
+    if isinstance(in_depth, dict):  # Moves with tables (e.g. Fling's power tiers) keep the prose in "text"
+        in_depth = in_depth.get('text', '')
     secondary = move.get('secondary_effect', '') or ''
     effect = move.get('effect', '') or ''
     
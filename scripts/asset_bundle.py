@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Pack a directory of per-entity JSON assets into one bundle file with an offset index.
+
+The app ships ~1,800 small files across pokemon_moves/ and moves_pokemon/. A
+bundle concatenates those payloads behind a fixed header and a sorted offset
+table, so a single asset replaces a directory and loading one entity is a
+table lookup, one ranged read and a small JSON decode.
+
+Layout (all integers little-endian, offsets from the start of the file):
+
+    Header, 24 bytes
+        0   4  magic          b"CDXB"
+        4   2  version        1
+        6   2  flags          bit 0: payloads re-encoded as compact JSON
+        8   4  entry_count    N
+        12  4  names_offset   start of the name blob
+        16  4  data_offset    start of the payload area
+        20  4  reserved       0
+
+    Offset table, N x 16 bytes starting at byte 24, sorted by UTF-8 name bytes
+        0   4  name_offset    relative to names_offset
+        4   2  name_length
+        6   2  reserved       0
+        8   4  payload_offset relative to data_offset
+        12  4  payload_length
+
+    Name blob (UTF-8 entity names, no separators), then the payload area
+    (UTF-8 JSON documents, back to back).
+
+Names are the source file stems (e.g. "Bulbasaur", "Thunderbolt"). A reader
+fetches the first 24 bytes, then the table and name blob
+(data_offset - 24 bytes), binary-searches the names and reads payload_length
+bytes at data_offset + payload_offset.
+
+Usage:
+    from asset_bundle import BundleReader
+
+    with BundleReader("assets/data/pokemon_moves.bundle") as bundle:
+        learnset = bundle.load("Bulbasaur")
+
+Run (packs pokemon_moves/ and moves_pokemon/, or the given directory):
+    python scripts/asset_bundle.py [--verify]
+    python scripts/asset_bundle.py assets/data/pokemon_moves out.bundle --raw
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import pathlib
+import struct
+import sys
+import time
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
+
+# Add scripts directory to path for relative imports
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+
+from asset_writer import AssetWriter
+from championdex_data import ASSETS_DIR
+from json_io import dumps, loads
+
+# Source directory -> bundle file built by default
+DEFAULT_BUNDLES = {
+    ASSETS_DIR / "pokemon_moves": ASSETS_DIR / "pokemon_moves.bundle",
+    ASSETS_DIR / "moves_pokemon": ASSETS_DIR / "moves_pokemon.bundle",
+}
+
+MAGIC = b"CDXB"
+VERSION = 1
+FLAG_COMPACT = 1
+
+HEADER = struct.Struct("<4sHHIIII")
+ENTRY = struct.Struct("<IHHII")
+
+PathLike = Union[str, pathlib.Path]
+
+
+def pack(entries: Dict[str, bytes], compact: bool = True) -> bytes:
+    """Build bundle bytes from name -> payload (payloads are stored as given)."""
+    items = sorted((name.encode("utf-8"), payload) for name, payload in entries.items())
+    names_offset = HEADER.size + ENTRY.size * len(items)
+    name_blob = b"".join(name for name, _ in items)
+    data_offset = names_offset + len(name_blob)
+
+    table = bytearray()
+    name_pos = payload_pos = 0
+    for name, payload in items:
+        if len(name) > 0xFFFF:
+            raise ValueError(f"Entity name too long for bundle: {name[:40]!r}...")
+        table += ENTRY.pack(name_pos, len(name), 0, payload_pos, len(payload))
+        name_pos += len(name)
+        payload_pos += len(payload)
+    if data_offset + payload_pos > 0xFFFFFFFF:
+        raise ValueError("Bundle exceeds 4 GiB")
+
+    flags = FLAG_COMPACT if compact else 0
+    header = HEADER.pack(MAGIC, VERSION, flags, len(items), names_offset, data_offset, 0)
+    return b"".join([header, bytes(table), name_blob] + [payload for _, payload in items])
+
+
+def pack_directory(src_dir: PathLike, compact: bool = True) -> bytes:
+    """Bundle every *.json file in src_dir, keyed by file stem."""
+    entries = {}
+    for path in sorted(pathlib.Path(src_dir).glob("*.json")):
+        raw = path.read_bytes()
+        if compact:
+            try:
+                raw = dumps(loads(raw), indent=None)
+            except ValueError as e:
+                print(f"Storing {path.name} verbatim: failed to parse JSON: {e}")
+        entries[path.stem] = raw
+    return pack(entries, compact=compact)
+
+
+class BundleReader:
+    """Random access to the entities in a bundle file."""
+
+    def __init__(self, path: PathLike):
+        self.path = pathlib.Path(path)
+        self._fh: Optional[BinaryIO] = open(self.path, "rb")
+        magic, version, self.flags, count, names_offset, self.data_offset, _ = HEADER.unpack(
+            self._fh.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not an asset bundle")
+        if version != VERSION:
+            raise ValueError(f"{self.path}: unsupported bundle version {version}")
+
+        index = self._fh.read(self.data_offset - HEADER.size)
+        names_start = names_offset - HEADER.size
+        self._names: List[str] = []
+        self._spans: List[Tuple[int, int]] = []
+        for i in range(count):
+            name_pos, name_len, _, payload_pos, payload_len = ENTRY.unpack_from(index, i * ENTRY.size)
+            start = names_start + name_pos
+            self._names.append(index[start:start + name_len].decode("utf-8"))
+            self._spans.append((payload_pos, payload_len))
+        self._sort_keys = [name.encode("utf-8") for name in self._names]
+
+    def __enter__(self) -> "BundleReader":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        return self._find(name) is not None
+
+    def names(self) -> List[str]:
+        return list(self._names)
+
+    def _find(self, name: str) -> Optional[int]:
+        key = name.encode("utf-8")
+        i = bisect.bisect_left(self._sort_keys, key)
+        if i < len(self._sort_keys) and self._sort_keys[i] == key:
+            return i
+        return None
+
+    def read_bytes(self, name: str) -> bytes:
+        i = self._find(name)
+        if i is None:
+            raise KeyError(name)
+        payload_pos, payload_len = self._spans[i]
+        self._fh.seek(self.data_offset + payload_pos)
+        return self._fh.read(payload_len)
+
+    def load(self, name: str) -> Any:
+        return loads(self.read_bytes(name))
+
+
+def verify(bundle_path: PathLike, src_dir: PathLike) -> int:
+    """Check every source file decodes identically from the bundle. Returns the entity count."""
+    with BundleReader(bundle_path) as bundle:
+        sources = sorted(pathlib.Path(src_dir).glob("*.json"))
+        if len(bundle) != len(sources):
+            raise SystemExit(f"{bundle_path}: {len(bundle)} entries, {len(sources)} source files")
+        for path in sources:
+            raw = path.read_bytes()
+            try:
+                expected = loads(raw)
+            except ValueError:
+                if bundle.read_bytes(path.stem) != raw:
+                    raise SystemExit(f"{bundle_path}: verbatim payload mismatch for {path.stem}")
+                continue
+            if bundle.load(path.stem) != expected:
+                raise SystemExit(f"{bundle_path}: payload mismatch for {path.stem}")
+        return len(sources)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Pack per-entity JSON assets into offset-indexed bundles")
+    parser.add_argument("src_dir", nargs="?", help="Directory of *.json files (default: pokemon_moves and moves_pokemon)")
+    parser.add_argument("out", nargs="?", help="Bundle path (default: <src_dir>.bundle)")
+    parser.add_argument("--raw", action="store_true", help="Store file bytes verbatim instead of compact JSON")
+    parser.add_argument("--verify", action="store_true", help="Read back every entity and compare with its source")
+    args = parser.parse_args()
+
+    if args.src_dir:
+        src_dir = pathlib.Path(args.src_dir)
+        jobs = {src_dir: pathlib.Path(args.out) if args.out else src_dir.with_suffix(".bundle")}
+    else:
+        jobs = DEFAULT_BUNDLES
+
+    writer = AssetWriter()
+    for src_dir, out in jobs.items():
+        if not src_dir.is_dir():
+            raise SystemExit(f"Source directory not found: {src_dir}")
+        start = time.perf_counter()
+        data = pack_directory(src_dir, compact=not args.raw)
+        writer.write_bytes(out, data)
+        files = list(src_dir.glob("*.json"))
+        source_bytes = sum(p.stat().st_size for p in files)
+        print(f"{src_dir.name}: {len(files)} files, {source_bytes / 1024 / 1024:.2f} MB -> "
+              f"{out.name} {len(data) / 1024 / 1024:.2f} MB ({time.perf_counter() - start:.2f}s)")
+        if args.verify:
+            print(f"✓ Verified {verify(out, src_dir)} entities in {out.name}")
+    writer.print_summary("bundles")
+
+
+if __name__ == "__main__":
+    main()
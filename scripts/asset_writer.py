@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Atomic, write-if-changed output layer for generated assets.
+
+Every payload is serialized in memory first and its content hash compared with
+the file already on disk. Identical files are left untouched (keeping their
+mtime, Flutter's asset cache and rsync/OTA diffs stable); changed files are
+written to a temporary file in the same directory and swapped in with
+os.replace, so readers never observe a partially written asset.
+
+Usage:
+    from asset_writer import AssetWriter
+
+    writer = AssetWriter()
+    for name, payload in outputs.items():
+        writer.write_json(out_dir / f"{name}.json", payload, sort_keys=True)
+    writer.remove_stale(out_dir, "*.json")
+    writer.print_summary("move files")
+
+    with writer.stream_json_object(path) as stream:   # large maps, see json_io
+        for key, value in items:
+            stream.write(key, value)
+
+AssetTransaction extends this to a group of files: all of a stage's outputs
+are staged and validated first, then moved into place as a unit that a crash
+cannot leave half-applied (see its docstring for what readers can observe).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pathlib
+import shutil
+import sys
+import tempfile
+import uuid
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Union
+
+# Add scripts directory to path for relative imports
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+
+from json_io import JsonObjectWriter, dumps, loads
+
+PathLike = Union[str, pathlib.Path]
+
+# Transactions stage under <root>/.staging/<pid>-<id>/; the journal marks a committed one
+STAGING_DIR_NAME = ".staging"
+JOURNAL_NAME = "journal.json"
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_hash(path: PathLike) -> Optional[str]:
+    """Hash of the file on disk, or None if it does not exist."""
+    try:
+        with open(path, "rb") as fh:
+            return content_hash(fh.read())
+    except FileNotFoundError:
+        return None
+
+
+def _default_mode(path: pathlib.Path) -> int:
+    """Mode for a replacement file: keep the existing file's, else what open() would create."""
+    try:
+        return path.stat().st_mode & 0o777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def atomic_write_bytes(path: PathLike, data: bytes) -> None:
+    """Write data to a temp file next to path and atomically replace path with it."""
+    path = pathlib.Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        os.chmod(tmp_name, _default_mode(path))  # mkstemp creates files as 0600
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+class AssetWriter:
+    """Writes only changed outputs and counts what it wrote, skipped and removed."""
+
+    def __init__(self, dry_run: bool = False):
+        self.dry_run = dry_run
+        self.written: List[pathlib.Path] = []
+        self.skipped = 0
+        self.removed: List[pathlib.Path] = []
+        self._seen: Set[pathlib.Path] = set()
+
+    def write_bytes(self, path: PathLike, data: bytes) -> bool:
+        """Write data if it differs from the file on disk. Returns True if written."""
+        path = pathlib.Path(path)
+        self._seen.add(path.resolve())
+        if file_hash(path) == content_hash(data):
+            self.skipped += 1
+            return False
+        if not self.dry_run:
+            self._store(path, data)
+        self.written.append(path)
+        return True
+
+    def write_json(self, path: PathLike, obj: Any, indent: Optional[int] = 2, sort_keys: bool = False,
+                   ensure_ascii: bool = False) -> bool:
+        return self.write_bytes(path, dumps(obj, indent=indent, sort_keys=sort_keys, ensure_ascii=ensure_ascii))
+
+    @contextmanager
+    def stream_json_object(self, path: PathLike, sort_keys: bool = False) -> Iterator[JsonObjectWriter]:
+        """Stream a large top-level object to a temp file, then keep or swap it in by hash."""
+        path = pathlib.Path(path)
+        self._seen.add(path.resolve())
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=self._temp_dir(path))
+        os.close(fd)
+        try:
+            with JsonObjectWriter(tmp_name, sort_keys=sort_keys) as stream:
+                yield stream
+            if file_hash(path) == file_hash(tmp_name):
+                self.skipped += 1
+                os.unlink(tmp_name)
+            else:
+                self.written.append(path)
+                if self.dry_run:
+                    os.unlink(tmp_name)
+                else:
+                    self._store_file(path, tmp_name)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+
+    def remove_stale(self, directory: PathLike, pattern: str = "*") -> List[pathlib.Path]:
+        """Delete files in directory matching pattern that were not written or skipped by this writer."""
+        stale = [p for p in sorted(pathlib.Path(directory).glob(pattern))
+                 if p.is_file() and p.resolve() not in self._seen]
+        for path in stale:
+            if not self.dry_run:
+                self._delete(path)
+            self.removed.append(path)
+        return stale
+
+    # Where writes land; AssetTransaction redirects these into its staging directory
+    def _temp_dir(self, path: pathlib.Path) -> pathlib.Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path.parent
+
+    def _store(self, path: pathlib.Path, data: bytes) -> None:
+        atomic_write_bytes(path, data)
+
+    def _store_file(self, path: pathlib.Path, tmp_name: str) -> None:
+        os.chmod(tmp_name, _default_mode(path))
+        os.replace(tmp_name, path)
+
+    def _delete(self, path: pathlib.Path) -> None:
+        path.unlink()
+
+    def summary(self) -> str:
+        parts = [f"{len(self.written)} written", f"{self.skipped} unchanged"]
+        if self.removed:
+            parts.append(f"{len(self.removed)} removed")
+        return ", ".join(parts)
+
+    def print_summary(self, label: str = "files") -> None:
+        prefix = "[dry-run] " if self.dry_run else ""
+        print(f"{prefix}{label}: {self.summary()}")
+
+
+def write_json(path: PathLike, obj: Any, indent: Optional[int] = 2, sort_keys: bool = False,
+               ensure_ascii: bool = False) -> bool:
+    """Atomically write a single JSON asset if its content changed. Returns True if written."""
+    return AssetWriter().write_json(path, obj, indent=indent, sort_keys=sort_keys, ensure_ascii=ensure_ascii)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _apply_journal(staging_dir: pathlib.Path) -> None:
+    """Finish a committed transaction: move staged files into place, delete removals, drop the staging dir."""
+    journal = loads((staging_dir / JOURNAL_NAME).read_bytes())
+    for relative, target in journal["replace"]:
+        staged = staging_dir / relative
+        if staged.exists():  # already moved if a previous attempt got this far
+            pathlib.Path(target).parent.mkdir(parents=True, exist_ok=True)
+            os.replace(staged, target)
+    for target in journal["delete"]:
+        try:
+            os.unlink(target)
+        except FileNotFoundError:
+            pass
+    shutil.rmtree(staging_dir, ignore_errors=True)
+
+
+def recover_transactions(root: PathLike) -> int:
+    """Settle transactions left under root by dead processes. Returns how many were found.
+
+    A transaction that wrote its journal had committed and is rolled forward;
+    one that did not had not committed and its staging dir is deleted.
+    """
+    staging_root = pathlib.Path(root) / STAGING_DIR_NAME
+    if not staging_root.is_dir():
+        return 0
+    found = 0
+    for staging_dir in sorted(staging_root.iterdir()):
+        pid = staging_dir.name.split("-", 1)[0]
+        if pid.isdigit() and _pid_alive(int(pid)):
+            continue  # open transaction of a running process
+        found += 1
+        if (staging_dir / JOURNAL_NAME).exists():
+            _apply_journal(staging_dir)
+        else:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+    try:
+        staging_root.rmdir()
+    except OSError:
+        pass
+    return found
+
+
+class AssetTransaction(AssetWriter):
+    """An AssetWriter whose writes and removals are applied in full or not at all.
+
+    Changed outputs (including stream_json_object temp files) are written under
+    <root>/.staging/<pid>-<id>/ instead of in place. On commit every staged
+    JSON file is decoded (catching truncated output), the optional
+    validate(transaction) callback runs against the staged files (read them
+    through staged_path), and a journal listing the moves is written; the
+    staged files are then moved over their targets with os.replace.
+
+    Guarantees:
+    - If anything raises before the journal exists, the staging dir is deleted
+      and the targets were never touched.
+    - Once the journal exists the transaction is committed: a crash while
+      moving files is rolled forward by recover_transactions(), which every
+      new transaction on the same root runs first.
+    - Each file is replaced atomically, but the files are replaced one after
+      another. A process reading the outputs while a commit runs can see some
+      new files next to old ones; run readers after the writing stage, as the
+      build graph does.
+
+    Usage:
+        with AssetTransaction(ASSETS_DIR, validate=check) as tx:
+            for name, payload in outputs.items():
+                tx.write_json(out_dir / f"{name}.json", payload)
+            tx.remove_stale(out_dir, "*.json")
+        tx.print_summary("move files")
+    """
+
+    def __init__(self, root: PathLike, validate: Optional[Callable[["AssetTransaction"], None]] = None,
+                 dry_run: bool = False):
+        super().__init__(dry_run)
+        self.root = pathlib.Path(root).resolve()
+        self.validate = validate
+        recover_transactions(self.root)
+        self.staging_dir = self.root / STAGING_DIR_NAME / f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.staged: Dict[pathlib.Path, pathlib.Path] = {}  # target -> staged file
+        self.deleted: List[pathlib.Path] = []
+        self.closed = False
+
+    def __enter__(self) -> "AssetTransaction":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+
+    def _staging_path(self, path: pathlib.Path) -> pathlib.Path:
+        if self.closed:
+            raise RuntimeError("Transaction is already committed or aborted")
+        target = path.resolve()
+        try:
+            relative = target.relative_to(self.root)
+        except ValueError:
+            raise ValueError(f"{path} is outside the transaction root {self.root}") from None
+        self.deleted = [p for p in self.deleted if p != target]
+        staged = self.staging_dir / "files" / relative
+        staged.parent.mkdir(parents=True, exist_ok=True)
+        self.staged[target] = staged
+        return staged
+
+    def _temp_dir(self, path: pathlib.Path) -> pathlib.Path:
+        temp_dir = self.staging_dir / "tmp"
+        temp_dir.mkdir(parents=True, exist_ok=True)
+        return temp_dir
+
+    def _store(self, path: pathlib.Path, data: bytes) -> None:
+        staged = self._staging_path(path)
+        staged.write_bytes(data)
+        os.chmod(staged, _default_mode(path))
+
+    def _store_file(self, path: pathlib.Path, tmp_name: str) -> None:
+        staged = self._staging_path(path)
+        os.chmod(tmp_name, _default_mode(path))
+        shutil.move(tmp_name, staged)
+
+    def _delete(self, path: pathlib.Path) -> None:
+        target = path.resolve()
+        self.staged.pop(target, None)
+        self.deleted.append(target)
+
+    def staged_path(self, path: PathLike) -> pathlib.Path:
+        """Where path's content for this transaction is: its staged file if written, else path itself."""
+        return self.staged.get(pathlib.Path(path).resolve(), pathlib.Path(path))
+
+    def commit(self) -> None:
+        if self.closed:
+            return
+        try:
+            for target, staged in self.staged.items():
+                if staged.suffix == ".json":
+                    try:
+                        loads(staged.read_bytes())
+                    except ValueError as e:
+                        raise ValueError(f"Staged {target} is not valid JSON: {e}") from e
+            if self.validate is not None and not self.dry_run:
+                self.validate(self)
+        except BaseException:
+            self.abort()
+            raise
+        if self.staged or self.deleted:
+            journal = {
+                "replace": [[staged.relative_to(self.staging_dir).as_posix(), str(target)]
+                            for target, staged in self.staged.items()],
+                "delete": [str(target) for target in self.deleted],
+            }
+            atomic_write_bytes(self.staging_dir / JOURNAL_NAME, dumps(journal, indent=None))
+            _apply_journal(self.staging_dir)
+        self._close()
+
+    def abort(self) -> None:
+        """Discard everything staged; the targets are untouched."""
+        if self.closed:
+            return
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+        self.written.clear()
+        self.removed.clear()
+        self._close()
+
+    def _close(self) -> None:
+        self.closed = True
+        shutil.rmtree(self.staging_dir, ignore_errors=True)  # left behind when nothing changed
+        try:
+            self.staging_dir.parent.rmdir()  # only succeeds if no other transaction is open
+        except OSError:
+            pass
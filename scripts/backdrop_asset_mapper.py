@@ -1,14 +1,15 @@
 import os
+import sys
 from pathlib import Path
-import json
 
-assets_dir = Path(__file__).parent.parent / "assets" / "images" / "backdrops"
-pokemon_json_file = Path(__file__).parent.parent / "assets" / "data" / "pokemon.json"
+# Add scripts directory to path for relative imports
+sys.path.insert(0, str(Path(__file__).parent))
 
-with open(pokemon_json_file, "r", encoding="utf-8") as f:
-    pokemon_data = json.load(f)
+from asset_writer import write_json
+from championdex_data import ASSETS_DIR, BACKDROPS_DIR, load_copy
 
-image_assets = [item.name for item in assets_dir.iterdir() if item.is_file()]
+assets_dir = BACKDROPS_DIR
+pokemon_json_file = ASSETS_DIR / "pokemon.json"
 
 # Water types to fix later:
 # - Kyogre (stormy special backdrop)
@@ -305,11 +306,12 @@ def map_backdrop_assets(pokemon_data, image_assets):
 
 
 if __name__ == "__main__":
+    pokemon_data = load_copy(pokemon_json_file.name)
+    image_assets = [item.name for item in assets_dir.iterdir() if item.is_file()]
     map_backdrop_assets(pokemon_data, image_assets)
     list_missing = [p for p in pokemon_data if "backdrop" not in p]
     if list_missing:
         print("\nPokemon without mapped images:")
         for p in list_missing:
             print(f"- {p.get('base_name')} (variant: {p.get('variant')})")
-    with open(pokemon_json_file, "w", encoding="utf-8") as f:
-        json.dump(pokemon_data, f, indent=2, ensure_ascii=False)
\ No newline at end of file
+    write_json(pokemon_json_file, pokemon_data, ensure_ascii=True)
\ No newline at end of file
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Encode the pokemon_moves learnsets into a compact, dictionary-encoded format.
+
+Move names, games, generations and learn methods are replaced by stable integer
+IDs from a persistent registry. Each (form, generation, game, method) list is
+stored as a sorted array of move IDs with the remaining entry fields (level,
+tm_id, level_plus, mastery_level, type) in parallel arrays, and empty columns
+dropped. decode_learnset() rebuilds the exact structure of the source file.
+
+Registry (assets/data/learnset_ids.json):
+    {"moves": [...], "games": [...], "gens": [...], "methods": [...]}
+    An ID is the position of the name in its list. Names are only ever
+    appended, so IDs stay stable across rebuilds. Move IDs are only given to
+    moves.json names: learnset spellings ("Double-edge") resolve to their
+    moves.json move through move_names.MoveNameIndex, and learnset entries
+    naming no moves.json move get no ID.
+
+Compact learnset (one per base Pokémon):
+    {
+      "v": 1,
+      "forms": {
+        "<form name>": {
+          "sets": [[gen_id, game_id, method_id, [move_id, ...], {column: [...]}], ...],
+          "extra": {"url_gen8": "...", ...}      # non-learnset keys, verbatim
+        }
+      }
+    }
+    Columns are parallel to the sorted move IDs. "order" gives each entry's
+    position in the source list and is omitted when it is the identity.
+    "name" holds the learnset spelling where it differs from the registry name
+    (null elsewhere). "unlisted" holds [position, entry] pairs, verbatim, for
+    entries whose move is not in moves.json. Integer-like level strings are
+    stored as ints. A value that does not fit this shape is kept verbatim under
+    "raw". JSON nulls inside entries are treated as absent keys (the scraper
+    never writes them).
+
+Outputs:
+- assets/data/learnset_ids.json : ID registry
+- assets/data/pokemon_moves_compact/<Pokemon>.json : compact learnset per base Pokémon
+- assets/data/learnsets_compact.json : every compact learnset in one file (for tools)
+
+Run:
+    python scripts/build_compact_learnsets.py [--verify]
+"""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import sys
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+# Add scripts directory to path for relative imports
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+
+from asset_writer import AssetWriter
+from championdex_data import ASSETS_DIR, LEARNSET_DIR
+from json_io import dumps, load
+from learnset_loader import load_learnsets
+from move_names import MoveNameIndex
+
+MOVES_JSON = ASSETS_DIR / "moves.json"
+REGISTRY_FILE = ASSETS_DIR / "learnset_ids.json"
+COMPACT_DIR = ASSETS_DIR / "pokemon_moves_compact"
+CORPUS_FILE = ASSETS_DIR / "learnsets_compact.json"
+
+FORMAT_VERSION = 2
+SECTIONS = ("moves", "games", "gens", "methods")
+
+
+class IdRegistry:
+    """Append-only name <-> integer ID tables."""
+
+    def __init__(self, tables: Optional[Dict[str, List[str]]] = None):
+        self.tables: Dict[str, List[str]] = {s: list((tables or {}).get(s, [])) for s in SECTIONS}
+        self.index: Dict[str, Dict[str, int]] = {
+            s: {name: i for i, name in enumerate(names)} for s, names in self.tables.items()
+        }
+
+    @classmethod
+    def load(cls, path: pathlib.Path = REGISTRY_FILE) -> "IdRegistry":
+        return cls(load(path) if path.exists() else None)
+
+    def extend(self, section: str, names: Iterable[str]) -> int:
+        """Register unseen names (in sorted order); returns how many were added."""
+        new = sorted(set(names) - self.index[section].keys())
+        for name in new:
+            self.index[section][name] = len(self.tables[section])
+            self.tables[section].append(name)
+        return len(new)
+
+    def id(self, section: str, name: str) -> int:
+        return self.index[section][name]
+
+    def name(self, section: str, id_: int) -> str:
+        return self.tables[section][id_]
+
+
+def _is_learnset_form(form_data: Any) -> bool:
+    """True if form_data has the gen -> game -> method -> [entry dicts] shape."""
+    if not isinstance(form_data, dict):
+        return False
+    for gen_val in form_data.values():
+        if not isinstance(gen_val, dict):
+            continue
+        for game_data in gen_val.values():
+            if not isinstance(game_data, dict):
+                return False
+            for entries in game_data.values():
+                if not isinstance(entries, list):
+                    return False
+                if not all(isinstance(e, dict) and isinstance(e.get("name"), str) for e in entries):
+                    return False
+    return True
+
+
+def collect_names(data: Dict, names: Dict[str, set]) -> None:
+    for form_data in data.values():
+        if not _is_learnset_form(form_data):
+            continue
+        for gen_key, gen_val in form_data.items():
+            if not isinstance(gen_val, dict):
+                continue
+            names["gens"].add(gen_key)
+            for game_name, game_data in gen_val.items():
+                names["games"].add(game_name)
+                names["methods"].update(game_data)
+
+
+def _encode_value(key: str, value: Any) -> Any:
+    if key == "level" and isinstance(value, str) and value.isdigit() and str(int(value)) == value:
+        return int(value)
+    return value
+
+
+def _decode_value(key: str, value: Any) -> Any:
+    if key == "level" and isinstance(value, int):
+        return str(value)
+    return value
+
+
+def encode_entries(entries: List[Dict], registry: IdRegistry, index: MoveNameIndex) -> List:
+    listed = []  # (move ID, source position)
+    unlisted = []
+    for pos, e in enumerate(entries):
+        move = index.lookup(e["name"])
+        if move is None:
+            unlisted.append([pos, e])
+        else:
+            listed.append((registry.id("moves", move), pos))
+    listed.sort()
+    ids = [move_id for move_id, _ in listed]
+    order = [pos for _, pos in listed]
+    columns: Dict[str, List] = {}
+    spellings = [entries[pos]["name"] if entries[pos]["name"] != registry.name("moves", move_id) else None
+                 for move_id, pos in listed]
+    if any(spellings):
+        columns["name"] = spellings
+    keys = []
+    for pos in order:
+        for k in entries[pos]:
+            if k != "name" and k not in keys:
+                keys.append(k)
+    for k in keys:
+        values = [_encode_value(k, entries[i].get(k)) for i in order]
+        if k == "type" and all(v == "" for v in values):
+            continue  # Scraped type is blank on every row so far; restored on decode
+        columns[k] = values
+    if order != list(range(len(order))):
+        columns["order"] = order
+    if unlisted:
+        columns["unlisted"] = unlisted
+    return [ids, columns]
+
+
+def decode_entries(ids: List[int], columns: Dict[str, List], registry: IdRegistry) -> List[Dict]:
+    unlisted = columns.get("unlisted", [])
+    decoded: List[Optional[Dict]] = [None] * (len(ids) + len(unlisted))
+    order = columns.get("order", range(len(ids)))
+    for pos, (move_id, src_index) in enumerate(zip(ids, order)):
+        entry: Dict[str, Any] = {"name": registry.name("moves", move_id)}
+        if "type" not in columns:
+            entry["type"] = ""
+        for k, values in columns.items():
+            if k in ("order", "unlisted") or values[pos] is None:
+                continue
+            entry[k] = _decode_value(k, values[pos])
+        decoded[src_index] = entry
+    for src_index, entry in unlisted:
+        decoded[src_index] = entry
+    return decoded
+
+
+def encode_learnset(data: Dict, registry: IdRegistry, index: MoveNameIndex) -> Dict:
+    forms: Dict[str, Dict] = {}
+    for form_name, form_data in data.items():
+        if not _is_learnset_form(form_data):
+            forms[form_name] = {"raw": form_data}
+            continue
+        sets = []
+        extra = {}
+        for gen_key, gen_val in form_data.items():
+            if not isinstance(gen_val, dict) or not gen_val:
+                extra[gen_key] = gen_val
+                continue
+            for game_name, game_data in gen_val.items():
+                if not game_data:
+                    sets.append([registry.id("gens", gen_key), registry.id("games", game_name), None, [], {}])
+                for method_name, entries in game_data.items():
+                    move_ids, columns = encode_entries(entries, registry, index)
+                    sets.append([
+                        registry.id("gens", gen_key),
+                        registry.id("games", game_name),
+                        registry.id("methods", method_name),
+                        move_ids,
+                        columns,
+                    ])
+        form = {"sets": sets}
+        if extra:
+            form["extra"] = extra
+        forms[form_name] = form
+    return {"v": FORMAT_VERSION, "forms": forms}
+
+
+def decode_learnset(payload: Dict, registry: IdRegistry) -> Dict:
+    """Rebuild the pokemon_moves/<base>.json structure from a compact learnset."""
+    if payload.get("v") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported compact learnset version: {payload.get('v')}")
+    data: Dict[str, Any] = {}
+    for form_name, form in payload["forms"].items():
+        if "raw" in form:
+            data[form_name] = form["raw"]
+            continue
+        form_data: Dict[str, Any] = {}
+        for gen_id, game_id, method_id, move_ids, columns in form["sets"]:
+            game_data = form_data.setdefault(registry.name("gens", gen_id), {}).setdefault(
+                registry.name("games", game_id), {})
+            if method_id is None:
+                continue
+            game_data[registry.name("methods", method_id)] = decode_entries(move_ids, columns, registry)
+        form_data.update(form.get("extra", {}))
+        data[form_name] = form_data
+    return data
+
+
+def load_compact_learnset(base_name: str, registry: Optional[IdRegistry] = None) -> Dict:
+    """Load and decode assets/data/pokemon_moves_compact/<base_name>.json."""
+    registry = registry or IdRegistry.load()
+    return decode_learnset(load(COMPACT_DIR / f"{base_name}.json"), registry)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build dictionary-encoded compact learnsets")
+    parser.add_argument("--verify", action="store_true", help="Decode every output and compare with its source")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    corpus = load_learnsets(LEARNSET_DIR, strict=True)
+
+    registry = IdRegistry.load()
+    names: Dict[str, set] = {s: set() for s in SECTIONS}
+    for data in corpus.values():
+        collect_names(data, names)
+    moves = load(MOVES_JSON)
+    names["moves"] = set(moves)
+    added = {s: registry.extend(s, names[s]) for s in SECTIONS}
+    # Resolve learnset spellings to registered names (the registry's, so moves dropped
+    # from moves.json keep their ID)
+    index = MoveNameIndex(registry.tables["moves"])
+
+    writer = AssetWriter()
+    encoded: Dict[str, Dict] = {}
+    for base_name, data in corpus.items():
+        payload = encode_learnset(data, registry, index)
+        encoded[base_name] = payload
+        writer.write_json(COMPACT_DIR / f"{base_name}.json", payload, indent=None)
+    writer.remove_stale(COMPACT_DIR, "*.json")
+    writer.write_json(CORPUS_FILE, encoded, indent=None)
+    writer.write_json(REGISTRY_FILE, registry.tables)
+
+    if args.verify:
+        for base_name, payload in encoded.items():
+            if decode_learnset(payload, registry) != corpus[base_name]:
+                raise SystemExit(f"Round-trip mismatch for {base_name}")
+        print(f"✓ Round-trip verified for {len(encoded)} learnsets")
+
+    source_bytes = sum(p.stat().st_size for p in LEARNSET_DIR.glob("*.json"))
+    compact_bytes = sum(len(dumps(p, indent=None)) for p in encoded.values())
+    print(f"Registered IDs: " + ", ".join(f"{len(registry.tables[s])} {s} (+{added[s]})" for s in SECTIONS))
+    print(f"Encoded {len(encoded)} learnsets: {source_bytes / 1024 / 1024:.2f} MB -> "
+          f"{compact_bytes / 1024 / 1024:.2f} MB ({compact_bytes / source_bytes:.1%})")
+    writer.print_summary("compact learnset files")
+    print(f"Done in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
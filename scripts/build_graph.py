@@ -0,0 +1,768 @@
+#!/usr/bin/env python3
+"""
+Incremental build graph for the post-scrape processing scripts.
+
+Each stage declares the files (or directories) it reads and writes. A stage is
+re-run only when the content hash of one of its inputs, its outputs or its own
+script differs from what the last successful build recorded, so editing one
+asset rebuilds only the stages downstream of it. Stages whose dependencies are
+satisfied run in parallel in a process pool.
+
+Several stages rewrite an asset in place (e.g. every pokemon.json mapper).
+Those stages run in declaration order and must be idempotent: re-applying one
+to its own output must not change it further.
+
+Watch mode (--watch) keeps running after the first build. Each burst of file
+events is mapped to the stages that track the changed paths; only those stages
+and the stages downstream of them are checked and re-run. Stages run in
+long-lived workers, so imported modules stay loaded and learnset_loader keeps
+decoded learnset files in memory between rebuilds (only edited files are
+re-read). Events come from watchdog (inotify on Linux) when it is installed,
+otherwise from polling mtimes.
+
+Outputs:
+- .build/state.json : recorded input/output hashes of the last successful build
+
+Run:
+    python scripts/build_graph.py                 # rebuild whatever is stale
+    python scripts/build_graph.py --list          # show stages and their state
+    python scripts/build_graph.py build_move_indexes --force
+    python scripts/build_graph.py --adopt         # record the current tree as built
+    python scripts/build_graph.py --fetch         # also run the web scrapers
+    python scripts/build_graph.py --watch         # rebuild on every save
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import hashlib
+import json
+import os
+import pathlib
+import queue
+import runpy
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # pragma: no cover - optional, watch mode falls back to polling
+    FileSystemEventHandler = object
+    Observer = None
+
+# Add scripts directory to path for relative imports
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+
+from championdex_data import ROOT
+
+SCRIPTS_DIR = ROOT / "scripts"
+STATE_DIR = ROOT / ".build"
+STATE_FILE = STATE_DIR / "state.json"
+
+MISSING = "missing"
+WATCH_DEBOUNCE = 0.1  # Seconds of quiet that end a burst of file events
+POLL_INTERVAL = 0.25
+
+# Shared modules imported by stage scripts; editing one re-runs every stage
+HELPER_MODULES = (
+    "scripts/json_io.py",
+    "scripts/asset_writer.py",
+    "scripts/learnset_loader.py",
+    "scripts/championdex_data/paths.py",
+)
+
+# The championdex_data package and the module it imports, for stages that read through it
+DATA_PACKAGE = (
+    "scripts/championdex_data/__init__.py",
+    "scripts/championdex_data/accessors.py",
+    "scripts/championdex_data/cache.py",
+    "scripts/championdex_data/paths.py",
+    "scripts/pokemon_indexes.py",  # resolve
+)
+
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    script: str  # Script file name inside scripts/
+    inputs: Tuple[str, ...]  # Paths relative to the repo root
+    outputs: Tuple[str, ...]
+    args: Tuple[str, ...] = ()
+    fetch: bool = False  # Hits the network; only run with --fetch or when named
+
+    @property
+    def script_path(self) -> str:
+        return f"scripts/{self.script}"
+
+    @property
+    def sources(self) -> Tuple[str, ...]:
+        return (self.script_path,) + HELPER_MODULES
+
+    @property
+    def tracked(self) -> Tuple[str, ...]:
+        return self.sources + self.inputs + self.outputs
+
+
+STAGES: List[Stage] = [
+    Stage(
+        name="build_pokemon_data",
+        script="build_pokemon_data.py",
+        inputs=(),
+        outputs=(
+            "data/pokemon.json",
+            "data/pokemon_by_number.json",
+            "data/pokemon_by_name.json",
+            "data/pokemon_by_base_name.json",
+        ),
+        fetch=True,
+    ),
+    Stage(
+        name="add_abilities_to_pokemon",
+        script="add_abilities_to_pokemon.py",
+        inputs=("data/abilities.json", "assets/data/pokemon.json"),
+        outputs=("assets/data/pokemon.json",),
+    ),
+    Stage(
+        name="image_asset_mapper",
+        script="image_asset_mapper.py",
+        inputs=("assets/data/pokemon.json", "assets/images/pokemon", "assets/images_large/pokemon", *DATA_PACKAGE),
+        outputs=(),
+    ),
+    Stage(
+        name="backdrop_asset_mapper",
+        script="backdrop_asset_mapper.py",
+        inputs=("assets/data/pokemon.json", "assets/images/backdrops", *DATA_PACKAGE),
+        outputs=("assets/data/pokemon.json",),
+    ),
+    Stage(
+        name="migrate_pokemon_fields",
+        script="migrate_pokemon_fields.py",
+        inputs=("data/pokemon.json", "assets/data/pokemon.json", *DATA_PACKAGE),
+        outputs=("assets/data/pokemon.json",),
+    ),
+    Stage(
+        name="pokemon_indexes",
+        script="pokemon_indexes.py",
+        inputs=("assets/data/pokemon.json",),
+        outputs=(
+            "assets/data/pokemon_by_number.json",
+            "assets/data/pokemon_by_name.json",
+            "assets/data/pokemon_by_base_name.json",
+        ),
+    ),
+    Stage(
+        name="moves_pipeline",
+        script="moves_pipeline.py",
+        inputs=("data/moves_enhanced.json", "assets/data/moves.json"),
+        outputs=("assets/data/moves.json",),
+    ),
+    Stage(
+        name="build_move_indexes",
+        script="build_move_indexes.py",
+        inputs=(
+            "assets/data/pokemon_moves",
+            "assets/data/moves.json",
+            "scripts/move_names.py",  # MoveNameIndex
+            "scripts/validate_assets.py",  # compile_validator
+            "scripts/schemas/move_learners.schema.json",
+        ),
+        outputs=(
+            "assets/data/moves_pokemon",
+            "assets/data/moves_by_pokemon.json",
+            "assets/data/moves_by_method",
+        ),
+    ),
+    Stage(
+        name="build_compact_learnsets",
+        script="build_compact_learnsets.py",
+        inputs=(
+            "assets/data/pokemon_moves",
+            "assets/data/moves.json",
+            "assets/data/learnset_ids.json",
+            "scripts/move_names.py",  # MoveNameIndex
+        ),
+        outputs=(
+            "assets/data/learnset_ids.json",
+            "assets/data/pokemon_moves_compact",
+            "assets/data/learnsets_compact.json",
+        ),
+    ),
+    Stage(
+        name="export_sqlite",
+        script="export_sqlite.py",
+        inputs=(
+            "assets/data/pokemon.json",
+            "assets/data/moves.json",
+            "assets/data/abilities.json",
+            "assets/data/type_chart.json",
+            "assets/data/natures.json",
+            "assets/data/pokemon_moves",
+            "scripts/build_move_indexes.py",  # iter_learn_rows
+            "scripts/pokemon_indexes.py",  # repair_mojibake
+            "scripts/move_text.py",  # effect_text
+        ),
+        outputs=("data/championdex.sqlite",),
+    ),
+    Stage(
+        name="build_text_index",
+        script="build_text_index.py",
+        inputs=("assets/data/moves.json", "assets/data/abilities.json", "scripts/move_text.py"),
+        outputs=("assets/data/text_index.json",),
+    ),
+    Stage(
+        name="build_name_index",
+        script="build_name_index.py",
+        inputs=(
+            "assets/data/pokemon.json",
+            "assets/data/moves.json",
+            "assets/data/abilities.json",
+            "scripts/pokemon_indexes.py",  # repair_mojibake
+        ),
+        outputs=("assets/data/name_index.json",),
+    ),
+    Stage(
+        name="build_type_profiles",
+        script="build_type_profiles.py",
+        inputs=("assets/data/type_chart.json", "assets/data/pokemon.json", "assets/data/abilities.json"),
+        outputs=("assets/data/type_profiles.json",),
+    ),
+    Stage(
+        name="build_stat_table",
+        script="build_stat_table.py",
+        inputs=("assets/data/pokemon.json", "assets/data/natures.json"),
+        outputs=("assets/data/stat_table.json",),
+    ),
+    Stage(
+        name="build_learnset_bitsets",
+        script="build_learnset_bitsets.py",
+        inputs=(
+            "assets/data/pokemon_moves",
+            "assets/data/learnset_ids.json",
+            "scripts/build_compact_learnsets.py",  # IdRegistry
+            "scripts/build_move_indexes.py",  # learn_rows, listed_moves
+            "scripts/move_names.py",  # MoveNameIndex
+        ),
+        outputs=("assets/data/learnset_bitsets.json",),
+    ),
+    Stage(
+        name="learnset_shards",
+        script="learnset_shards.py",
+        inputs=("assets/data/pokemon_moves",),
+        outputs=("assets/data/pokemon_moves_by_game",),
+    ),
+    Stage(
+        name="split_moves",
+        script="split_moves.py",
+        inputs=(
+            "assets/data/moves.json",
+            "assets/data/learnset_ids.json",
+            "scripts/build_compact_learnsets.py",  # IdRegistry
+        ),
+        outputs=("assets/data/moves_summary.json", "assets/data/moves_detail"),
+    ),
+    Stage(
+        name="join_learnset_moves",
+        script="join_learnset_moves.py",
+        inputs=(
+            "assets/data/pokemon_moves",
+            "assets/data/moves.json",
+            "assets/data/learnset_ids.json",
+            "scripts/build_compact_learnsets.py",  # IdRegistry
+            "scripts/build_move_indexes.py",  # learn_rows
+            "scripts/move_names.py",
+        ),
+        outputs=("assets/data/learnset_move_table.json",),
+    ),
+    Stage(
+        name="validate_assets",
+        script="validate_assets.py",
+        inputs=(
+            "assets/data/pokemon.json",
+            "assets/data/moves.json",
+            "assets/data/abilities.json",
+            "assets/data/pokemon_by_name.json",
+            "assets/data/pokemon_by_number.json",
+            "assets/data/pokemon_by_base_name.json",
+            "assets/data/pokemon_moves",
+            "assets/data/moves_pokemon",
+            "scripts/schemas",
+        ),
+        outputs=(),
+    ),
+    Stage(
+        name="check_integrity",
+        script="check_integrity.py",
+        inputs=(
+            "assets/data/pokemon.json",
+            "assets/data/moves.json",
+            "assets/data/abilities.json",
+            "assets/data/pokemon_by_name.json",
+            "assets/data/pokemon_by_number.json",
+            "assets/data/pokemon_by_base_name.json",
+            "assets/data/pokemon_moves",
+            "assets/images/pokemon",
+            "assets/images_large/pokemon",
+            "assets/images/backdrops",
+            "scripts/add_abilities_to_pokemon.py",  # build_pokemon_abilities, match_ability_key
+            "scripts/build_move_indexes.py",  # iter_learn_rows
+            "scripts/move_names.py",
+            "scripts/pokemon_indexes.py",  # build_indexes
+        ),
+        outputs=("data/integrity_report.json",),
+        args=("--report", "data/integrity_report.json"),
+    ),
+    Stage(
+        name="validate_move_effects",
+        script="validate_move_effects.py",
+        inputs=("assets/data/moves.json",),
+        outputs=("assets/data/move_effects_analysis.txt",),
+    ),
+    Stage(
+        name="asset_bundle",
+        script="asset_bundle.py",
+        inputs=("assets/data/pokemon_moves", "assets/data/moves_pokemon"),
+        outputs=("assets/data/pokemon_moves.bundle", "assets/data/moves_pokemon.bundle"),
+    ),
+]
+
+
+class ContentHasher:
+    """Content hashes for files and directories, cached by (size, mtime)."""
+
+    def __init__(self, stat_cache: Optional[Dict[str, List]] = None):
+        self.stat_cache: Dict[str, List] = stat_cache or {}
+
+    def file_hash(self, path: pathlib.Path) -> str:
+        st = path.stat()
+        key = str(path.relative_to(ROOT))
+        cached = self.stat_cache.get(key)
+        if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+            return cached[2]
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        self.stat_cache[key] = [st.st_size, st.st_mtime_ns, digest]
+        return digest
+
+    def hash(self, rel_path: str) -> str:
+        """Hash a repo-relative file, or every file below a directory."""
+        path = ROOT / rel_path
+        if path.is_file():
+            return self.file_hash(path)
+        if not path.is_dir():
+            return MISSING
+        h = hashlib.sha256()
+        for child in sorted(p for p in path.rglob("*") if p.is_file()):
+            h.update(str(child.relative_to(path)).encode("utf-8"))
+            h.update(b"\0")
+            h.update(self.file_hash(child).encode("ascii"))
+            h.update(b"\n")
+        return h.hexdigest()
+
+
+def load_state() -> Dict:
+    if STATE_FILE.exists():
+        with open(STATE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return {"stages": {}, "files": {}, "stat": {}}
+
+
+def save_state(state: Dict) -> None:
+    STATE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = STATE_FILE.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(tmp, STATE_FILE)
+
+
+def stage_dependencies(stages: List[Stage]) -> Dict[str, Set[str]]:
+    """
+    Map each stage to the earlier stages it must wait for.
+
+    A stage depends on every earlier-declared stage that writes a path it reads
+    or writes, or that reads a path it writes. Declaration order therefore
+    decides the order of in-place rewrites of the same asset.
+    """
+    deps: Dict[str, Set[str]] = {s.name: set() for s in stages}
+    for i, stage in enumerate(stages):
+        touches = set(stage.inputs) | set(stage.outputs)
+        for earlier in stages[:i]:
+            if set(earlier.outputs) & touches or set(earlier.inputs) & set(stage.outputs):
+                deps[stage.name].add(earlier.name)
+    return deps
+
+
+def select_stages(stages: List[Stage], targets: List[str], deps: Dict[str, Set[str]]) -> List[Stage]:
+    """Restrict the graph to the named targets and everything upstream of them."""
+    if not targets:
+        return stages
+    by_name = {s.name: s for s in stages}
+    unknown = [t for t in targets if t not in by_name]
+    if unknown:
+        raise SystemExit(f"Unknown stage(s): {', '.join(unknown)}")
+    wanted: Set[str] = set()
+    frontier = list(targets)
+    while frontier:
+        name = frontier.pop()
+        if name not in wanted:
+            wanted.add(name)
+            frontier.extend(deps[name])
+    return [s for s in stages if s.name in wanted]
+
+
+def covers(tracked: str, path: str) -> bool:
+    return path == tracked or path.startswith(tracked + "/")
+
+
+def affected_stages(stages: List[Stage], paths: Iterable[str], deps: Dict[str, Set[str]]) -> Set[str]:
+    """Stages tracking any of the changed paths, plus every stage downstream of them."""
+    paths = list(paths)
+    wanted = {s.name for s in stages if any(covers(t, p) for t in s.tracked for p in paths)}
+    for stage in stages:  # Declaration order: a stage's dependencies come before it
+        if deps[stage.name] & wanted:
+            wanted.add(stage.name)
+    return wanted
+
+
+def run_stage(script: str, args: Tuple[str, ...]) -> float:
+    """Execute a stage script as __main__ inside a pool worker."""
+    os.chdir(ROOT)
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    sys.argv = [script, *args]
+    start = time.perf_counter()
+    try:
+        runpy.run_path(str(SCRIPTS_DIR / script), run_name="__main__")
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            raise RuntimeError(f"{script} exited with {e.code}") from None
+    return time.perf_counter() - start
+
+
+_module_mtimes: Dict[str, int] = {}  # Imported scripts/ module -> source mtime when first seen
+
+
+def _drop_edited_modules() -> None:
+    """Forget every imported scripts/ module if any of their sources changed since import."""
+    modules = {name: m.__file__ for name, m in list(sys.modules.items())
+               if name != "__main__" and (getattr(m, "__file__", None) or "").startswith(str(SCRIPTS_DIR))}
+    edited = False
+    for name, path in modules.items():
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime = -1
+        edited |= _module_mtimes.setdefault(name, mtime) != mtime
+    if edited:
+        # Modules hold references into each other (from x import y), so reload them all
+        for name in modules:
+            del sys.modules[name]
+        _module_mtimes.clear()
+
+
+def run_stage_warm(script: str, args: Tuple[str, ...]) -> float:
+    """run_stage in a long-lived watch worker: keep imports and decoded learnsets between runs."""
+    _drop_edited_modules()
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    import learnset_loader
+
+    learnset_loader.enable_cache()
+    try:
+        return run_stage(script, args)
+    finally:
+        _drop_edited_modules()  # Record the mtimes of modules this run imported
+
+
+class BuildGraph:
+    def __init__(self, stages: List[Stage], state: Dict):
+        self.stages = stages
+        self.state = state
+        self.hasher = ContentHasher(state.get("stat"))
+        self.deps = stage_dependencies(stages)
+        self.changed: Set[str] = set()  # Paths rewritten with new content during this build
+        self.final_files: Dict[str, str] = dict(state.get("files", {}))
+
+    def _written_from(self, stage: Stage) -> Set[str]:
+        """Paths written by this stage or any stage declared after it."""
+        idx = self.stages.index(stage)
+        paths: Set[str] = set()
+        for later in self.stages[idx:]:
+            paths.update(later.outputs)
+        return paths
+
+    def stale_reason(self, stage: Stage) -> Optional[str]:
+        record = self.state["stages"].get(stage.name)
+        if record is None:
+            return "never built"
+        owned = self._written_from(stage)
+        for path in stage.tracked:
+            if path in self.changed:
+                return f"{path} rebuilt upstream"
+            current = self.hasher.hash(path)
+            if path in owned:
+                expected = self.final_files.get(path)
+            else:
+                expected = record["inputs"].get(path)
+            if current != expected:
+                return f"{path} changed"
+        return None
+
+    def record(self, stage: Stage, input_hashes: Dict[str, str]) -> None:
+        outputs = {p: self.hasher.hash(p) for p in stage.outputs}
+        for path, digest in outputs.items():
+            if self.final_files.get(path) != digest:
+                self.changed.add(path)
+            self.final_files[path] = digest
+        self.state["stages"][stage.name] = {"inputs": input_hashes, "outputs": outputs}
+
+    def snapshot_inputs(self, stage: Stage) -> Dict[str, str]:
+        return {p: self.hasher.hash(p) for p in stage.sources + stage.inputs}
+
+    def adopt(self) -> None:
+        """Record the current tree as the result of a complete build."""
+        for stage in self.stages:
+            self.record(stage, self.snapshot_inputs(stage))
+        self._finish()
+
+    def _finish(self, stages: Optional[List[Stage]] = None) -> None:
+        for stage in self.stages if stages is None else stages:
+            for path in stage.tracked:
+                self.final_files[path] = self.hasher.hash(path)
+        self.state["files"] = self.final_files
+        self.state["stat"] = self.hasher.stat_cache
+        save_state(self.state)
+
+    def build(self, jobs: int, force: Set[str], fetch: bool, dry_run: bool,
+              only: Optional[Set[str]] = None, pool: Optional[Executor] = None) -> bool:
+        """
+        Run every stale stage. With only, stages outside it are neither checked nor
+        run; with pool, stages run through run_stage_warm in that (long-lived) pool.
+        """
+        selected = [s for s in self.stages if only is None or s.name in only]
+        pending = list(selected)
+        done: Set[str] = {s.name for s in self.stages} - {s.name for s in selected}
+        failed: Set[str] = set()
+        running: Dict[Future, Tuple[Stage, Dict[str, str]]] = {}
+        counts = {"ran": 0, "skipped": 0, "failed": 0}
+        self.changed = set()
+        start = time.perf_counter()
+        runner = run_stage if pool is None else run_stage_warm
+
+        with contextlib.nullcontext(pool) if pool is not None else ProcessPoolExecutor(max_workers=jobs) as pool:
+            while pending or running:
+                progressed = False
+                for stage in list(pending):
+                    if not self.deps[stage.name] <= done | failed:
+                        continue
+                    pending.remove(stage)
+                    progressed = True
+                    if self.deps[stage.name] & failed:
+                        print(f"  ✗ {stage.name}: blocked by failed dependency")
+                        failed.add(stage.name)
+                        continue
+                    reason = "forced" if stage.name in force else self.stale_reason(stage)
+                    if reason and stage.fetch and not fetch and stage.name not in force:
+                        print(f"  - {stage.name}: network stage, skipped ({reason}; pass --fetch)")
+                        reason = None
+                    if reason is None or dry_run:
+                        if reason:
+                            print(f"  • {stage.name}: would run ({reason})")
+                        else:
+                            counts["skipped"] += 1
+                        done.add(stage.name)
+                        continue
+                    print(f"  ▶ {stage.name}: running ({reason})")
+                    future = pool.submit(runner, stage.script, stage.args)
+                    running[future] = (stage, self.snapshot_inputs(stage))
+
+                if progressed and not running:
+                    continue
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    stage, input_hashes = running.pop(future)
+                    try:
+                        elapsed = future.result()
+                    except Exception as e:
+                        print(f"  ✗ {stage.name}: {e}")
+                        self.state["stages"].pop(stage.name, None)
+                        failed.add(stage.name)
+                        counts["failed"] += 1
+                        continue
+                    self.record(stage, input_hashes)
+                    done.add(stage.name)
+                    counts["ran"] += 1
+                    print(f"  ✓ {stage.name} ({elapsed:.2f}s)")
+
+        if not dry_run:
+            self._finish(selected)
+        if only is None or counts["ran"] or counts["failed"]:
+            print(f"\nRan {counts['ran']}, skipped {counts['skipped']} up-to-date, failed {counts['failed']} "
+                  f"in {time.perf_counter() - start:.2f}s")
+        return not failed
+
+
+def _watch_path(path: str) -> Optional[str]:
+    """Repo-relative path of an event, or None for files no stage could track."""
+    parts = os.path.relpath(path, ROOT).split(os.sep)
+    if parts[0] == ".." or any(p.startswith(".") or p == "__pycache__" for p in parts):
+        return None  # Outside the repo, .build/.staging/.git, or an AssetWriter temp file
+    return "/".join(parts)
+
+
+class PollingWatcher:
+    """Change events from comparing the (mtime, size) of every tracked file between polls."""
+
+    def __init__(self, paths: Iterable[str], interval: float = POLL_INTERVAL):
+        self.paths = sorted(set(paths))
+        self.interval = interval
+        self.seen = self._scan()
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        stamps: Dict[str, Tuple[int, int]] = {}
+        for rel in self.paths:
+            path = ROOT / rel
+            if path.is_dir():
+                files = [os.path.join(d, name) for d, _, names in os.walk(path) for name in names]
+            else:
+                files = [str(path)]
+            for file in files:
+                try:
+                    st = os.stat(file)
+                except OSError:
+                    continue
+                stamps[file] = (st.st_mtime_ns, st.st_size)
+        return stamps
+
+    def changes(self) -> Set[str]:
+        """Block until tracked files change; their repo-relative paths."""
+        while True:
+            time.sleep(self.interval)
+            current = self._scan()
+            changed = {f for f in current.keys() | self.seen.keys() if current.get(f) != self.seen.get(f)}
+            self.seen = current
+            paths = {rel for rel in map(_watch_path, changed) if rel}
+            if paths:
+                return paths
+
+    def close(self) -> None:
+        pass
+
+
+class _EventQueue(FileSystemEventHandler):
+    CONTENT_EVENTS = ("created", "modified", "deleted", "moved")  # Not opened/closed: stages read files
+
+    def __init__(self, events: "queue.Queue[str]"):
+        super().__init__()
+        self.events = events
+
+    def on_any_event(self, event) -> None:
+        if event.is_directory or event.event_type not in self.CONTENT_EVENTS:
+            return
+        self.events.put(event.src_path)
+        if getattr(event, "dest_path", None):
+            self.events.put(event.dest_path)
+
+
+class EventWatcher:
+    """Change events from watchdog (inotify on Linux), debounced into bursts."""
+
+    def __init__(self, paths: Iterable[str], debounce: float = WATCH_DEBOUNCE):
+        self.debounce = debounce
+        self.events: "queue.Queue[str]" = queue.Queue()
+        roots: Set[pathlib.Path] = set()
+        for rel in paths:
+            path = ROOT / rel
+            root = path if path.is_dir() else path.parent
+            if root.is_dir():
+                roots.add(root)
+        self.observer = Observer()
+        handler = _EventQueue(self.events)
+        for root in sorted(roots):
+            if not any(parent in roots for parent in root.parents):
+                self.observer.schedule(handler, str(root), recursive=True)
+        self.observer.start()
+
+    def changes(self) -> Set[str]:
+        """Block until a burst of events ends; the repo-relative paths it touched."""
+        while True:
+            touched = {self.events.get()}
+            while True:
+                try:
+                    touched.add(self.events.get(timeout=self.debounce))
+                except queue.Empty:
+                    break
+            paths = {rel for rel in map(_watch_path, touched) if rel}
+            if paths:
+                return paths
+
+    def close(self) -> None:
+        self.observer.stop()
+        self.observer.join()
+
+
+def watch(graph: BuildGraph, jobs: int, fetch: bool) -> None:
+    """Build, then rebuild the stages affected by every later burst of file changes."""
+    tracked = {p for stage in graph.stages for p in stage.tracked}
+    watcher = EventWatcher(tracked) if Observer is not None else PollingWatcher(tracked)
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        try:
+            graph.build(jobs, set(), fetch, False, pool=pool)
+            print(f"\nWatching {len(tracked)} paths ({type(watcher).__name__}); Ctrl-C to stop")
+            while True:
+                only = affected_stages(graph.stages, watcher.changes(), graph.deps)
+                if only:
+                    graph.build(jobs, set(), fetch, False, only=only, pool=pool)
+        except KeyboardInterrupt:
+            print("\nStopped watching")
+        finally:
+            watcher.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Incrementally rebuild generated data assets")
+    parser.add_argument("stages", nargs="*", help="Build only these stages (and their upstream stages)")
+    parser.add_argument("--jobs", "-j", type=int,
+                        help="Parallel stage workers (default: CPU count; 1 with --watch, keeping one warm worker)")
+    parser.add_argument("--force", action="store_true", help="Re-run the named stages (or all) even if up to date")
+    parser.add_argument("--fetch", action="store_true", help="Also run stages that scrape the web")
+    parser.add_argument("--dry-run", action="store_true", help="Only report which stages are stale")
+    parser.add_argument("--adopt", action="store_true", help="Record the current tree as built without running anything")
+    parser.add_argument("--list", action="store_true", help="List stages, their dependencies and staleness")
+    parser.add_argument("--watch", action="store_true", help="Keep running and rebuild affected stages on every change")
+    args = parser.parse_args()
+
+    deps = stage_dependencies(STAGES)
+    stages = select_stages(STAGES, args.stages, deps)
+    graph = BuildGraph(stages, load_state())
+
+    if args.list:
+        for stage in stages:
+            reason = graph.stale_reason(stage) or "up to date"
+            after = ", ".join(sorted(graph.deps[stage.name])) or "-"
+            print(f"{stage.name:34} after: {after}\n{'':34} {reason}")
+        return
+
+    if args.adopt:
+        graph.adopt()
+        print(f"Recorded {len(stages)} stages as up to date in {STATE_FILE.relative_to(ROOT)}")
+        return
+
+    if args.watch:
+        watch(graph, max(1, args.jobs or 1), args.fetch)
+        return
+
+    force = {s.name for s in stages} if args.force and not args.stages else set(args.stages if args.force else [])
+    ok = graph.build(max(1, args.jobs or os.cpu_count() or 1), force, args.fetch, args.dry_run)
+    if not ok:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Encode every form's learnable moves as fixed-width bitsets over the move ID space.
+
+Questions like "which forms learn both Trick Room and Will-O-Wisp in Scarlet
+and Violet" used to walk every pokemon_moves/*.json file. This stage sets bit
+<move ID> in one bitset per (form, game, method), using the move/game/method
+IDs of the learnset_ids.json registry (see build_compact_learnsets.py), so
+learner queries become column tests and bitwise AND/OR/NOT over a NumPy array.
+Learnset spellings that differ from the registry's ("X-scissor") set the bit of
+the registered move, and queries accept either spelling; learnset entries that
+name no registered move are left out.
+
+Output (assets/data/learnset_bitsets.json):
+    {
+      "version": 1,
+      "width": 945,                  # bits per row = number of registered moves
+      "forms": ["Bulbasaur", ...],   # form ID = position (learnset form names)
+      "rows": {"form": [...], "game": [...], "method": [...]},   # one triple per bitset
+      "bits": "<base64>"             # uint8[len(rows) * ceil(width / 8)], row-major
+    }
+Bit m of a row is bit (m % 8) of byte (m // 8), least significant bit first
+(NumPy packbits with bitorder="little"). Game and method IDs index the
+registry's "games" and "methods" lists. Rows are sorted by (form, game, method)
+and only exist for combinations with at least one move.
+
+Usage:
+    from build_learnset_bitsets import LearnsetBitsets
+
+    bitsets = LearnsetBitsets.load()
+    bitsets.learners(["Trick Room", "Will-O-Wisp"], game="Scarlet and Violet")
+    bitsets.learners(["Spore"], none_of=["Sleep Powder"], methods=["level_up"])
+    bitsets.rank(["Stealth Rock", "Rapid Spin", "Defog"], game="Scarlet and Violet")
+
+Run:
+    python scripts/build_learnset_bitsets.py [--benchmark]
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import pathlib
+import sys
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Add scripts directory to path for relative imports
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+
+from asset_writer import AssetWriter
+from build_compact_learnsets import REGISTRY_FILE, IdRegistry
+from build_move_indexes import learn_rows, listed_moves
+from championdex_data import ASSETS_DIR, LEARNSET_DIR
+from json_io import load
+from learnset_loader import load_learnsets
+from move_names import MoveNameIndex
+
+OUT_FILE = ASSETS_DIR / "learnset_bitsets.json"
+
+FORMAT_VERSION = 1
+# Set bits per byte value, for popcounts over packed rows
+POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def build_bitsets(corpus: Dict[str, List[Tuple]], registry: IdRegistry) -> Dict:
+    """corpus maps base name -> learn rows (move, game, method, form, level, tm_id)."""
+    index = MoveNameIndex(registry.tables["moves"])
+    forms: Dict[str, int] = {}
+    cells: Dict[Tuple[int, int, int], set] = {}
+    for base_name in sorted(corpus):
+        for move, game, method, form, _, _ in listed_moves(corpus[base_name], index):
+            try:
+                key = (forms.setdefault(form, len(forms)),
+                       registry.id("games", game), registry.id("methods", method))
+                move_id = registry.id("moves", move)
+            except KeyError as e:
+                raise SystemExit(f"{base_name}: {e} is not in {REGISTRY_FILE.name}; "
+                                 f"run build_compact_learnsets.py first") from e
+            cells.setdefault(key, set()).add(move_id)
+
+    width = len(registry.tables["moves"])
+    keys = sorted(cells)
+    matrix = np.zeros((len(keys), width), dtype=bool)
+    for row, key in enumerate(keys):
+        matrix[row, sorted(cells[key])] = True
+    packed = np.packbits(matrix, axis=1, bitorder="little")
+    return {
+        "version": FORMAT_VERSION,
+        "width": width,
+        "forms": list(forms),
+        "rows": {field: [key[i] for key in keys] for i, field in enumerate(("form", "game", "method"))},
+        "bits": base64.b64encode(packed.tobytes()).decode("ascii"),
+    }
+
+
+class LearnsetBitsets:
+    """Query API over learnset_bitsets.json."""
+
+    def __init__(self, data: Dict, registry: Optional[IdRegistry] = None):
+        if data.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported learnset bitset version: {data.get('version')}")
+        self.registry = registry or IdRegistry.load()
+        self.width: int = data["width"]
+        if self.width > len(self.registry.tables["moves"]):
+            raise ValueError(f"Bitsets cover {self.width} moves but the registry has fewer")
+        self.names = MoveNameIndex(self.registry.tables["moves"])
+        self.forms: List[str] = data["forms"]
+        self.form_index = {name: i for i, name in enumerate(self.forms)}
+        self.row_form = np.array(data["rows"]["form"], dtype=np.intp)
+        self.row_game = np.array(data["rows"]["game"], dtype=np.intp)
+        self.row_method = np.array(data["rows"]["method"], dtype=np.intp)
+        self.bits = np.frombuffer(base64.b64decode(data["bits"]), dtype=np.uint8).reshape(
+            len(self.row_form), -1)
+        self._merged: Dict[Tuple, np.ndarray] = {}
+
+    @classmethod
+    def load(cls, path: pathlib.Path = OUT_FILE) -> "LearnsetBitsets":
+        return cls(load(path))
+
+    def form_bitsets(self, game: Optional[str] = None,
+                     methods: Optional[Iterable[str]] = None) -> np.ndarray:
+        """uint8[forms, bytes]: per form, the OR of its rows for game (any if None) and methods (any if None)."""
+        methods = tuple(sorted(methods)) if methods is not None else None
+        key = (game, methods)
+        if key not in self._merged:
+            selected = np.ones(len(self.row_form), dtype=bool)
+            if game is not None:
+                selected &= self.row_game == self.registry.id("games", game)
+            if methods is not None:
+                selected &= np.isin(self.row_method, [self.registry.id("methods", m) for m in methods])
+            merged = np.zeros((len(self.forms), self.bits.shape[1]), dtype=np.uint8)
+            np.bitwise_or.at(merged, self.row_form[selected], self.bits[selected])
+            self._merged[key] = merged
+        return self._merged[key]
+
+    def move_id(self, move: str) -> int:
+        """Registry ID of a move in any learnset spelling. Raises KeyError for unknown moves."""
+        name = self.names.lookup(move)
+        if name is None:
+            raise KeyError(move)
+        return self.registry.id("moves", name)
+
+    def mask(self, moves: Iterable[str]) -> np.ndarray:
+        """Packed query bitset with the bits of moves set."""
+        bits = np.zeros(self.bits.shape[1] * 8, dtype=bool)
+        bits[[self.move_id(move) for move in moves]] = True
+        return np.packbits(bits, bitorder="little")
+
+    def _columns(self, merged: np.ndarray, moves: Iterable[str]) -> List[np.ndarray]:
+        """bool[forms] per move: bit <move ID> of every form's bitset."""
+        ids = [self.move_id(move) for move in moves]
+        return [(merged[:, m >> 3] >> (m & 7)) & 1 == 1 for m in ids]
+
+    def learns(self, move: str, game: Optional[str] = None,
+               methods: Optional[Iterable[str]] = None) -> np.ndarray:
+        """bool[forms]: which forms can learn move."""
+        return self._columns(self.form_bitsets(game, methods), [move])[0]
+
+    def learners(self, all_of: Sequence[str] = (), any_of: Sequence[str] = (), none_of: Sequence[str] = (),
+                 game: Optional[str] = None, methods: Optional[Iterable[str]] = None) -> List[str]:
+        """Forms that learn every move in all_of, at least one of any_of and none of none_of."""
+        merged = self.form_bitsets(game, methods)
+        selected = merged.any(axis=1)  # forms with any learnset in this game/methods
+        if all_of:
+            selected &= np.logical_and.reduce(self._columns(merged, all_of))
+        if any_of:
+            selected &= np.logical_or.reduce(self._columns(merged, any_of))
+        if none_of:
+            selected &= ~np.logical_or.reduce(self._columns(merged, none_of))
+        return [self.forms[i] for i in np.flatnonzero(selected)]
+
+    def rank(self, moves: Sequence[str], game: Optional[str] = None,
+             methods: Optional[Iterable[str]] = None, limit: int = 10) -> List[Tuple[str, int]]:
+        """(form, number of moves it learns) for the forms learning the most of moves."""
+        counts = POPCOUNT[self.form_bitsets(game, methods) & self.mask(moves)].sum(axis=1, dtype=np.int64)
+        order = np.argsort(-counts, kind="stable")[:limit]
+        return [(self.forms[i], int(counts[i])) for i in order if counts[i]]
+
+    def movepool(self, form: str, game: Optional[str] = None,
+                 methods: Optional[Iterable[str]] = None) -> List[str]:
+        """Move names a form can learn, in move ID order."""
+        row = self.form_bitsets(game, methods)[self.form_index[form]]
+        move_ids = np.flatnonzero(np.unpackbits(row, bitorder="little"))
+        return [self.registry.name("moves", int(m)) for m in move_ids]
+
+    def shared(self, forms: Sequence[str], game: Optional[str] = None,
+               methods: Optional[Iterable[str]] = None) -> List[str]:
+        """Moves every one of forms can learn."""
+        merged = self.form_bitsets(game, methods)
+        common = np.bitwise_and.reduce(merged[[self.form_index[f] for f in forms]], axis=0)
+        return [self.registry.name("moves", int(m))
+                for m in np.flatnonzero(np.unpackbits(common, bitorder="little"))]
+
+
+def _scan(moves: Sequence[str], game: str, index: MoveNameIndex) -> List[str]:
+    """Reference implementation: walk every learnset file, matching moves in any spelling."""
+    wanted = {index.lookup(move) for move in moves}
+    found: Dict[str, set] = {}
+    for base_name, rows in load_learnsets(LEARNSET_DIR, transform=learn_rows).items():
+        for move, row_game, _, form, _, _ in listed_moves(rows, index):
+            if row_game == game and move in wanted:
+                found.setdefault(form, set()).add(move)
+    return [form for form, learned in found.items() if learned == wanted]
+
+
+def benchmark(bitsets: LearnsetBitsets) -> None:
+    queries = [(["Trick Room", "Will-O-Wisp"], "Scarlet and Violet"),
+               (["Stealth Rock", "Rapid Spin"], "Sword and Shield"),
+               (["Swords Dance", "Earthquake", "Roost"], "Scarlet and Violet"),
+               (["X-Scissor"], "Pokémon Legends: Arceus"),  # also spelled "X-scissor" in learnsets
+               (["Baby-Doll Eyes"], "Pokémon Legends: Arceus")]
+    for moves, game in queries:
+        start = time.perf_counter()
+        scanned = _scan(moves, game, bitsets.names)
+        scan = time.perf_counter() - start
+        bitsets.form_bitsets(game)  # merge once, as a session would
+        rounds = 1000
+        start = time.perf_counter()
+        for _ in range(rounds):
+            hits = bitsets.learners(moves, game=game)
+        query = (time.perf_counter() - start) / rounds
+        agree = "match" if set(hits) == set(scanned) else "MISMATCH"
+        print(f"  {' + '.join(moves)} ({game}): {len(hits)} forms, bitsets {query * 1e6:.1f} µs"
+              f" | file scan {scan * 1000:.0f} ms [{agree}]")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build per-game learnset bitsets over the move ID space")
+    parser.add_argument("--benchmark", action="store_true", help="Compare bitset queries with a file scan")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    registry = IdRegistry.load()
+    corpus = load_learnsets(LEARNSET_DIR, transform=learn_rows, strict=True)
+    payload = build_bitsets(corpus, registry)
+    writer = AssetWriter()
+    writer.write_json(OUT_FILE, payload, indent=None)
+    print(f"Encoded {len(payload['rows']['form'])} bitsets of {payload['width']} bits for "
+          f"{len(payload['forms'])} forms: {OUT_FILE.stat().st_size / 1024:.0f} KB "
+          f"in {time.perf_counter() - start:.2f}s")
+    writer.print_summary("learnset bitsets")
+
+    if args.benchmark:
+        benchmark(LearnsetBitsets(payload, registry))
+
+
+if __name__ == "__main__":
+    main()
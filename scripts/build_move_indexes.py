@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Build every move -> Pokémon inverted index from the learnset files in one pass.
+
+Replaces the separate build_moves_pokemon.py and
+generate_moves_by_pokemon_index.py scripts, which each loaded and walked the
+whole assets/data/pokemon_moves corpus. Files are decoded by learnset_loader in
+a process pool and flattened to learn rows there; the indexes are then filled
+from a single walk over those rows.
+
+Inputs:
+- assets/data/pokemon_moves/<Pokemon>.json : form -> gen -> game -> method -> [entries]
+- assets/data/moves.json : canonical move names; learnsets spell some of them
+  with different case ("Double-edge"), which would otherwise become separate
+  moves_pokemon files that collide on case-insensitive filesystems
+
+Outputs:
+- assets/data/moves_pokemon/<Move>.json : game -> method -> [forms]
+- assets/data/moves_by_pokemon.json : move -> game -> form -> [{learnType, level, tmId}]
+- assets/data/moves_by_method/<method>.json : move -> game -> [forms]
+
+Run:
+    python scripts/build_move_indexes.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import re
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Add scripts directory to path for relative imports
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+
+from asset_writer import AssetTransaction
+from championdex_data import ASSETS_DIR, LEARNSET_DIR, MOVE_LEARNERS_DIR, ROOT
+from json_io import load
+from learnset_loader import iter_learnsets
+from move_names import MoveNameIndex
+from validate_assets import ValidationError, compile_validator
+
+MOVES_BY_POKEMON_FILE = ASSETS_DIR / "moves_by_pokemon.json"
+MOVES_BY_METHOD_DIR = ASSETS_DIR / "moves_by_method"
+MOVES_FILE = ASSETS_DIR / "moves.json"
+
+# (move, game, method, form, level, tm_id)
+LearnRow = Tuple[str, str, str, str, str, Optional[str]]
+
+
+def sanitize_filename(name: str) -> str:
+    """Replace characters that are invalid in file names with underscores."""
+    s = name.strip()
+    s = re.sub(r"[\\/:*?\"<>|]", '_', s)
+    return s + '.json'
+
+
+def entry_move_name(entry) -> Optional[str]:
+    if isinstance(entry, dict):
+        # common keys: 'name' or 'move' or 'move_name'
+        return entry.get('name') or entry.get('move') or entry.get('move_name')
+    if isinstance(entry, str):
+        return entry
+    return None
+
+
+def iter_learn_rows(data: Dict) -> Iterator[LearnRow]:
+    """Walk form -> gen -> game -> method -> entries and yield one row per learnable move."""
+    for form_name, form_data in data.items():
+        if not isinstance(form_data, dict):
+            continue
+        for gen_val in form_data.values():
+            if not isinstance(gen_val, dict):
+                continue
+            for game_name, game_data in gen_val.items():
+                if not isinstance(game_data, dict):
+                    continue
+                for method_name, entries in game_data.items():
+                    if not isinstance(entries, list):
+                        continue
+                    for entry in entries:
+                        move_name = entry_move_name(entry)
+                        if not move_name:
+                            continue
+                        level = entry.get('level', '—') if isinstance(entry, dict) else '—'
+                        tm_id = entry.get('tm_id') if isinstance(entry, dict) else None
+                        yield (move_name, game_name, method_name, form_name, level, tm_id)
+
+
+def learn_rows(data: Dict) -> List[LearnRow]:
+    """Flatten one decoded learnset file (runs inside a loader pool worker)."""
+    return list(iter_learn_rows(data))
+
+
+def canonicalize_moves(rows: List[LearnRow], index: MoveNameIndex) -> Dict[str, str]:
+    """Rename each row's move to its moves.json spelling in place; returns {learnset spelling: canonical}."""
+    canonical: Dict[str, str] = {}
+    for i, row in enumerate(rows):
+        move = row[0]
+        if move not in canonical:
+            canonical[move] = index.lookup(move) or move  # Unknown moves keep their spelling
+        if canonical[move] != move:
+            rows[i] = (canonical[move],) + row[1:]
+    return {move: name for move, name in canonical.items() if name != move}
+
+
+def listed_moves(rows: List[LearnRow], index: MoveNameIndex) -> List[LearnRow]:
+    """Rows of moves the index knows, under its spelling; rows naming anything else are dropped."""
+    canonical: Dict[str, Optional[str]] = {}
+    listed = []
+    for row in rows:
+        move = row[0]
+        if move not in canonical:
+            canonical[move] = index.lookup(move)
+        if canonical[move] is not None:
+            listed.append(row if canonical[move] == move else (canonical[move],) + row[1:])
+    return listed
+
+
+def build_indexes(rows: List[LearnRow]) -> Tuple[Dict, Dict, Dict]:
+    """Fill every inverted index from a single pass over the learn rows."""
+    per_move = defaultdict(lambda: defaultdict(lambda: defaultdict(set)))
+    by_pokemon = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
+    by_method = defaultdict(lambda: defaultdict(lambda: defaultdict(set)))
+
+    for move, game, method, form, level, tm_id in rows:
+        per_move[move][game][method].add(form)
+        by_method[method][move][game].add(form)
+        move_info = {'learnType': method, 'level': level}
+        if tm_id is not None:
+            move_info['tmId'] = tm_id
+        by_pokemon[move][game][form].append(move_info)
+
+    moves_pokemon = {
+        move: {game: {method: sorted(forms) for method, forms in methods.items()} for game, methods in games.items()}
+        for move, games in per_move.items()
+    }
+    moves_by_pokemon = {
+        move: {game: dict(forms) for game, forms in games.items()}
+        for move, games in by_pokemon.items()
+    }
+    moves_by_method = {
+        method: {move: {game: sorted(forms) for game, forms in games.items()} for move, games in moves.items()}
+        for method, moves in by_method.items()
+    }
+    return moves_pokemon, moves_by_pokemon, moves_by_method
+
+
+def validate_staged(tx: AssetTransaction) -> None:
+    """Check every changed moves_pokemon file against its schema before the swap."""
+    validate = compile_validator("move_learners.schema.json")
+    for target, staged in tx.staged.items():
+        if target.parent == MOVE_LEARNERS_DIR.resolve():
+            try:
+                validate(load(staged))
+            except ValidationError as e:
+                raise ValidationError(f"{target.name}: {e}") from None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build move -> Pokémon indexes from the learnset files")
+    parser.add_argument("--workers", type=int, default=None, help="Process pool size (default: CPU count)")
+    parser.add_argument("--dry-run", action="store_true", help="Report what would change without writing")
+    args = parser.parse_args()
+
+    if not LEARNSET_DIR.is_dir():
+        raise SystemExit(f"Source directory not found: {LEARNSET_DIR}")
+
+    timings: Dict[str, float] = {}
+    start = time.perf_counter()
+
+    file_count = 0
+    rows: List[LearnRow] = []
+    for _, file_rows in iter_learnsets(LEARNSET_DIR, transform=learn_rows, workers=args.workers):
+        file_count += 1
+        rows.extend(file_rows)
+    timings['load'] = time.perf_counter() - start
+
+    mark = time.perf_counter()
+    renamed = canonicalize_moves(rows, MoveNameIndex(load(MOVES_FILE)))
+    moves_pokemon, moves_by_pokemon, moves_by_method = build_indexes(rows)
+    timings['index'] = time.perf_counter() - mark
+
+    # All three indexes are staged and swapped in together, so a crash never leaves them out of step
+    mark = time.perf_counter()
+    with AssetTransaction(ASSETS_DIR, validate=validate_staged, dry_run=args.dry_run) as tx:
+        for move_name, games in moves_pokemon.items():
+            out_path = MOVE_LEARNERS_DIR / sanitize_filename(move_name)
+            try:
+                tx.write_json(out_path, games, sort_keys=True)
+            except Exception as e:
+                print(f"Failed writing {out_path}: {e}")
+        tx.remove_stale(MOVE_LEARNERS_DIR, '*.json')
+
+        with tx.stream_json_object(MOVES_BY_POKEMON_FILE, sort_keys=True) as stream:
+            for move_name in sorted(moves_by_pokemon):
+                stream.write(move_name, moves_by_pokemon[move_name])
+
+        for method_name, moves in moves_by_method.items():
+            tx.write_json(MOVES_BY_METHOD_DIR / sanitize_filename(method_name), moves, sort_keys=True)
+        tx.remove_stale(MOVES_BY_METHOD_DIR, '*.json')
+    timings['write'] = time.perf_counter() - mark
+
+    print(f"Read {file_count} learnset files ({len(rows)} learn rows)")
+    if renamed:
+        print(f"Merged {len(renamed)} move spellings into moves.json names: "
+              + ", ".join(f"{old} -> {new}" for old, new in sorted(renamed.items())))
+    tx.print_summary(f"{MOVE_LEARNERS_DIR.relative_to(ROOT)} ({len(moves_pokemon)} moves), "
+                     f"{MOVES_BY_POKEMON_FILE.relative_to(ROOT)}, "
+                     f"{MOVES_BY_METHOD_DIR.relative_to(ROOT)} ({len(moves_by_method)} methods)")
+    print("Timing: " + ", ".join(f"{k} {v:.2f}s" for k, v in timings.items())
+          + f", total {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Build a type-ahead name index over Pokémon forms, moves and abilities.
+
+Type-ahead search used to lowercase and scan every name list on each
+keystroke. This stage precomputes normalized aliases for every name, a sorted
+prefix array over them for "starts with" matches and a trigram posting map for
+fuzzy (misspelled) queries.
+
+Aliases are accent-folded and lowercased, with punctuation removed, turned into
+spaces and with spaces removed, so "flabebe", "farfetchd", "farfetch d",
+"type null" and "typenull" all reach their entry. Every word suffix of an
+alias is indexed too ("galarian farfetchd", "x" for "Charizard Mega Charizard X").
+♀/♂ fold to f/m. Names mangled by a cp1252 round-trip in pokemon.json
+("FlabÃ©bÃ©") are repaired as they are loaded, so both the aliases and the
+names search returns are the repaired ones.
+
+Output (assets/data/name_index.json):
+    {
+      "version": 1,
+      "kinds": ["pokemon", "move", "ability"],
+      "docs": ["Bulbasaur", ...],             # doc ID = position; display names
+      "doc_kinds": [0, ...],                  # index into "kinds"
+      "keys": ["abomasnow", ...],             # sorted aliases and alias word suffixes
+      "key_docs": [12, ...],                  # doc ID per key
+      "key_rank": [0, ...],                   # 0 full alias, 1 word suffix
+      "trigrams": {"$ab": [12, 3, ...], ...}  # doc IDs (sorted, delta-encoded) per trigram
+    }
+Trigrams come from the space-free alias padded with "$" on both sides.
+
+Usage:
+    from build_name_index import NameIndex
+
+    index = NameIndex.load()
+    index.search("flabe")                 # prefix matches, fuzzy fill-in
+    index.search("garchomp", kind="pokemon")
+
+Run:
+    python scripts/build_name_index.py [--benchmark]
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import pathlib
+import random
+import re
+import sys
+import time
+import unicodedata
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Add scripts directory to path for relative imports
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+
+from asset_writer import AssetWriter
+from championdex_data import ASSETS_DIR
+from json_io import load
+from pokemon_indexes import repair_mojibake
+
+OUT_FILE = ASSETS_DIR / "name_index.json"
+
+FORMAT_VERSION = 1
+KINDS = ("pokemon", "move", "ability")
+
+_SYMBOLS = {"♀": " f", "♂": " m"}
+_PUNCT = re.compile(r"[^a-z0-9 ]+")
+_SPACES = re.compile(r"\s+")
+
+
+def fold(text: str) -> str:
+    """Accent-fold and lowercase, mapping gender symbols to letters."""
+    for symbol, replacement in _SYMBOLS.items():
+        text = text.replace(symbol, replacement)
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).lower()
+
+
+def normalize_query(text: str) -> str:
+    """Query normalization: fold, drop punctuation, collapse whitespace."""
+    return _SPACES.sub(" ", _PUNCT.sub("", fold(text))).strip()
+
+
+def aliases(name: str) -> Set[str]:
+    folded = fold(name)
+    dropped = _SPACES.sub(" ", _PUNCT.sub("", folded)).strip()
+    spaced = _SPACES.sub(" ", _PUNCT.sub(" ", folded)).strip()
+    return {a for a in (dropped, spaced, dropped.replace(" ", "")) if a}
+
+
+def trigrams(alias: str) -> Set[str]:
+    padded = f"${alias.replace(' ', '')}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def load_names() -> List[Tuple[int, str]]:
+    """(kind ID, repaired display name) for every Pokémon form, move and ability."""
+    pokemon = [p["name"] for p in load(ASSETS_DIR / "pokemon.json")]
+    moves = sorted(load(ASSETS_DIR / "moves.json"))
+    abilities = sorted(load(ASSETS_DIR / "abilities.json"))
+    return [(kind, repair_mojibake(name)) for kind, names in enumerate((pokemon, moves, abilities)) for name in names]
+
+
+def build_index(names: List[Tuple[int, str]]) -> Dict:
+    entries: Set[Tuple[str, int, int]] = set()
+    postings: Dict[str, Set[int]] = defaultdict(set)
+    for doc_id, (_, name) in enumerate(names):
+        for alias in aliases(name):
+            entries.add((alias, doc_id, 0))
+            words = alias.split(" ")
+            for i in range(1, len(words)):
+                entries.add((" ".join(words[i:]), doc_id, 1))
+        for gram in trigrams(normalize_query(name)):
+            postings[gram].add(doc_id)
+
+    # Keep the best rank per (key, doc)
+    best: Dict[Tuple[str, int], int] = {}
+    for key, doc_id, rank in entries:
+        best[(key, doc_id)] = min(rank, best.get((key, doc_id), rank))
+    ordered = sorted(best.items())
+
+    index = {
+        "version": FORMAT_VERSION,
+        "kinds": list(KINDS),
+        "docs": [name for _, name in names],
+        "doc_kinds": [kind for kind, _ in names],
+        "keys": [key for (key, _), _ in ordered],
+        "key_docs": [doc_id for (_, doc_id), _ in ordered],
+        "key_rank": [rank for _, rank in ordered],
+        "trigrams": {},
+    }
+    for gram in sorted(postings):
+        doc_ids = sorted(postings[gram])
+        index["trigrams"][gram] = [d - p for d, p in zip(doc_ids, [0] + doc_ids[:-1])]
+    return index
+
+
+class NameIndex:
+    """Query API over name_index.json."""
+
+    def __init__(self, data: Dict):
+        if data.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported name index version: {data.get('version')}")
+        self.docs: List[str] = data["docs"]
+        self.kinds: List[str] = data["kinds"]
+        self.doc_kinds: List[int] = data["doc_kinds"]
+        self.keys: List[str] = data["keys"]
+        self.key_docs: List[int] = data["key_docs"]
+        self.key_rank: List[int] = data["key_rank"]
+        self.trigrams: Dict[str, List[int]] = {}
+        doc_grams: Counter = Counter()
+        for gram, deltas in data["trigrams"].items():
+            doc_ids, current = [], 0
+            for delta in deltas:
+                current += delta
+                doc_ids.append(current)
+            self.trigrams[gram] = doc_ids
+            doc_grams.update(doc_ids)
+        self.doc_gram_counts = [doc_grams[d] for d in range(len(self.docs))]
+
+    @classmethod
+    def load(cls, path: pathlib.Path = OUT_FILE) -> "NameIndex":
+        return cls(load(path))
+
+    def _kind_ok(self, doc_id: int, kind: Optional[str]) -> bool:
+        return kind is None or self.kinds[self.doc_kinds[doc_id]] == kind
+
+    def prefix(self, query: str, kind: Optional[str] = None, limit: int = 10) -> List[str]:
+        """Names with an alias (or alias word suffix) starting with query, best first."""
+        q = normalize_query(query)
+        if not q:
+            return []
+        lo = bisect.bisect_left(self.keys, q)
+        hi = bisect.bisect_left(self.keys, q + "\x7f", lo)  # keys are [a-z0-9 ] only
+        best: Dict[int, Tuple[int, int, int]] = {}
+        for i in range(lo, hi):
+            doc_id = self.key_docs[i]
+            if not self._kind_ok(doc_id, kind):
+                continue
+            # Whole-name matches before word-suffix matches, then exact, then shorter names
+            score = (self.key_rank[i], 0 if self.keys[i] == q else 1, len(self.docs[doc_id]))
+            if doc_id not in best or score < best[doc_id]:
+                best[doc_id] = score
+        ranked = sorted(best, key=lambda d: (best[d], self.docs[d]))
+        return [self.docs[d] for d in ranked[:limit]]
+
+    def fuzzy(self, query: str, kind: Optional[str] = None, limit: int = 10,
+              threshold: float = 0.3) -> List[str]:
+        """Names ranked by trigram Jaccard similarity to query."""
+        grams = trigrams(normalize_query(query))
+        shared: Counter = Counter()
+        for gram in grams:
+            shared.update(self.trigrams.get(gram, ()))
+        scored = []
+        for doc_id, count in shared.items():
+            if not self._kind_ok(doc_id, kind):
+                continue
+            score = count / (len(grams) + self.doc_gram_counts[doc_id] - count)
+            if score >= threshold:
+                scored.append((-score, self.docs[doc_id]))
+        return [name for _, name in sorted(scored)[:limit]]
+
+    def search(self, query: str, kind: Optional[str] = None, limit: int = 10) -> List[str]:
+        """Prefix matches first, topped up with fuzzy matches."""
+        results = self.prefix(query, kind, limit)
+        if len(results) < limit:
+            seen = set(results)
+            results += [n for n in self.fuzzy(query, kind, limit) if n not in seen][:limit - len(results)]
+        return results
+
+
+def query_log(names: List[str], size: int = 2000, seed: int = 7) -> List[str]:
+    """Synthetic keystroke log: typed prefixes, unaccented spellings and one-letter typos."""
+    rng = random.Random(seed)
+    log = []
+    while len(log) < size:
+        name = normalize_query(rng.choice(names))
+        style = rng.random()
+        if style < 0.6:
+            log.append(name[:rng.randint(1, max(1, len(name)))])
+        elif style < 0.8 or len(name) < 4:
+            log.append(name)
+        else:
+            i = rng.randrange(len(name) - 1)
+            log.append(name[:i] + name[i + 1] + name[i] + name[i + 2:])  # swap adjacent letters
+    return log
+
+
+def _scan(names: List[str], query: str, limit: int = 10) -> List[str]:
+    q = query.lower()
+    return [n for n in names if n.lower().startswith(q) or f" {q}" in n.lower()][:limit]
+
+
+def benchmark(index: NameIndex, log: Iterable[str]) -> None:
+    log = list(log)
+    for label, fn in (("linear scan", lambda q: _scan(index.docs, q)),
+                      ("prefix", index.prefix),
+                      ("search", index.search)):
+        start = time.perf_counter()
+        hits = sum(1 for q in log if fn(q))
+        elapsed = time.perf_counter() - start
+        print(f"  {label:12} {elapsed / len(log) * 1e6:8.1f} µs/query, {hits}/{len(log)} queries with results")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build the Pokémon/move/ability name search index")
+    parser.add_argument("--benchmark", action="store_true", help="Replay a synthetic type-ahead query log")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    names = load_names()
+    payload = build_index(names)
+    writer = AssetWriter()
+    writer.write_json(OUT_FILE, payload, indent=None)
+    print(f"Indexed {len(names)} names ({len(payload['keys'])} keys, {len(payload['trigrams'])} trigrams): "
+          f"{OUT_FILE.stat().st_size / 1024:.0f} KB in {time.perf_counter() - start:.2f}s")
+    writer.print_summary("name index")
+
+    if args.benchmark:
+        benchmark(NameIndex(payload), query_log([name for _, name in names]))
+
+
+if __name__ == "__main__":
+    main()
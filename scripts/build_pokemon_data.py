@@ -6,12 +6,15 @@ Sources:
 
 Outputs:
 - data/pokemon.json : list of Pokémon dicts with number, name, base_name, variant, generation, types, stats
-- data/pokemon_by_number.json : map number -> list of Pokémon (handles variants)
-- data/pokemon_by_name.json : map lowercase name -> Pokémon
-- data/pokemon_by_base_name.json : map lowercase base_name -> list of variants
+- data/pokemon_by_number.json : map number -> list of positions in pokemon.json (handles variants)
+- data/pokemon_by_name.json : map lowercase name -> position in pokemon.json
+- data/pokemon_by_base_name.json : map lowercase base_name -> list of positions of its variants
 
 Run:
-    python scripts/build_pokemon_data.py
+    python scripts/build_pokemon_data.py [--index-format ids|full]
+
+--index-format full writes the old indexes that embed a copy of each entry
+(see pokemon_indexes.py).
 
 Dependencies:
     pip install requests beautifulsoup4
@@ -19,15 +22,23 @@ Dependencies:
 
 from __future__ import annotations
 
-import json
+import argparse
 import pathlib
 import re
+import sys
 from dataclasses import dataclass, asdict
 from typing import Dict, List, Optional, Tuple
 
 import requests
 from bs4 import BeautifulSoup
 
+# Add scripts directory to path for relative imports
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+
+from asset_writer import AssetTransaction
+from json_io import dumps, load
+from pokemon_indexes import INDEX_FILES, INDEX_FORMATS, IndexOrder, build_indexes, previous_order, write_indexes
+
 STATS_URL = "https://pokemondb.net/pokedex/all"
 
 ROOT = pathlib.Path(__file__).resolve().parent.parent
@@ -316,32 +327,26 @@ def build_dataset(stats_map: Dict[Tuple[int, Optional[str]], Tuple[str, Stats, L
     return dataset
 
 
-def write_outputs(pokemon: List[Pokemon]) -> None:
+def validate_outputs(tx: AssetTransaction, index_format: str, order: IndexOrder) -> None:
+    """Check that the staged indexes are exactly the indexes of the staged pokemon.json."""
+    entries = load(tx.staged_path(DATA_DIR / "pokemon.json"))
+    for filename, expected in build_indexes(entries, index_format, order).items():
+        staged = load(tx.staged_path(DATA_DIR / filename))
+        if staged != {str(k): v for k, v in expected.items()}:
+            raise ValueError(f"{filename} does not match pokemon.json")
+
+
+def write_outputs(pokemon: List[Pokemon], index_format: str = "ids") -> None:
+    """Write pokemon.json and its indexes as one transaction: all four files change together or none do."""
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     list_payload = [asdict(p) for p in pokemon]
-    
-    # Group by number to handle variants (multiple entries per number)
-    by_number: Dict[int, List[dict]] = {}
-    for p in pokemon:
-        if p.number not in by_number:
-            by_number[p.number] = []
-        by_number[p.number].append(asdict(p))
-    
-    # Single entry per name (names should be unique)
-    by_name = {p.name.lower(): asdict(p) for p in pokemon}
-    
-    # Also create a map by base_name for hierarchical access
-    by_base_name: Dict[str, List[dict]] = {}
-    for p in pokemon:
-        key = p.base_name.lower()
-        if key not in by_base_name:
-            by_base_name[key] = []
-        by_base_name[key].append(asdict(p))
+    order = previous_order(DATA_DIR)  # Variant order of the indexes being replaced
 
-    (DATA_DIR / "pokemon.json").write_text(json.dumps(list_payload, indent=2), encoding="utf-8")
-    (DATA_DIR / "pokemon_by_number.json").write_text(json.dumps(by_number, indent=2), encoding="utf-8")
-    (DATA_DIR / "pokemon_by_name.json").write_text(json.dumps(by_name, indent=2), encoding="utf-8")
-    (DATA_DIR / "pokemon_by_base_name.json").write_text(json.dumps(by_base_name, indent=2), encoding="utf-8")
+    with AssetTransaction(DATA_DIR, validate=lambda tx: validate_outputs(tx, index_format, order)) as tx:
+        tx.write_bytes(DATA_DIR / "pokemon.json", dumps(list_payload, ensure_ascii=True))
+        # Lookup maps by number, lowercase name and lowercase base_name
+        write_indexes(DATA_DIR, list_payload, index_format, writer=tx, order=order)
+    tx.print_summary(f"pokemon.json + {len(INDEX_FILES)} indexes")
 
 
 def validate_entry_count(stats_map: Dict[Tuple[int, Optional[str]], Tuple[str, Stats, List[str]]], 
@@ -376,6 +381,11 @@ def validate_entry_count(stats_map: Dict[Tuple[int, Optional[str]], Tuple[str, S
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Build the consolidated Pokémon dataset")
+    parser.add_argument("--index-format", choices=INDEX_FORMATS, default="ids",
+                        help="pokemon_by_* values: positions in pokemon.json (ids) or full entry copies (full)")
+    args = parser.parse_args()
+
     print("Fetching stats table...")
     stats_map = parse_stats()
     print(f"Found {len(stats_map)} entries in stats table")
@@ -387,7 +397,7 @@ def main() -> None:
     validate_entry_count(stats_map, pokemon)
     
     print("\nWriting outputs...")
-    write_outputs(pokemon)
+    write_outputs(pokemon, args.index_format)
     print(f"Wrote {len(pokemon)} Pokémon entries to data/")
 
 
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Precompute final stats for every Pokémon form at standard spreads.
+
+stat_calculator.dart / pokemon_stat_calculator.dart recompute final stats for
+every view and simulation tick. This stage broadcasts the base stats in
+pokemon.json against the nature multipliers in natures.json and the standard
+IV/EV spreads at levels 50 and 100 in one NumPy pass, so batch consumers
+(speed tiers, damage matrices, stat filters) read a table instead.
+
+Formulas (Generation III onward, same as pokemon_stat_calculator.dart):
+    HP:     floor((2 x Base + IV + floor(EV / 4)) x Level / 100) + Level + 10   (Shedinja: 1)
+    Others: floor(floor((2 x Base + IV + floor(EV / 4)) x Level / 100 + 5) x Nature)
+Natures only ever scale a stat by 0.9, 1.0 or 1.1, so the table has a nature
+axis over those three multipliers rather than one slice per nature; applied as
+integer percentages (x * 90 // 100), which matches the Dart double arithmetic.
+
+Output (assets/data/stat_table.json):
+    {
+      "version": 1,
+      "forms": ["Bulbasaur", ...],         # form ID = position, same order as pokemon.json
+      "levels": [50, 100],
+      "stats": ["attack", "defense", "sp_atk", "sp_def", "speed"],
+      "spreads": [[0, 0], [0, 252], [31, 0], [31, 252]],   # [IV, EV]
+      "natures": [0.9, 1.0, 1.1],          # hindered, neutral, boosted
+      "hp": "<base64>",                    # uint16 LE [forms][levels][spreads]
+      "values": "<base64>"                 # uint16 LE [forms][levels][stats][spreads][natures]
+    }
+The minimum of a stat is spread [0, 0] with a hindering nature, the maximum is
+spread [31, 252] with a boosting nature.
+
+Usage:
+    from build_stat_table import StatTable
+
+    table = StatTable.load()
+    table.stat("Garchomp", "attack", level=100, nature="Adamant")   # 394
+    table.stat_range("Garchomp", "speed")                           # (96, 169) at level 50
+    table.speed_tiers(level=50)[:3]                                 # fastest max-speed forms
+
+Run:
+    python scripts/build_stat_table.py [--verify]
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import pathlib
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Add scripts directory to path for relative imports
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+
+from asset_writer import AssetWriter
+from championdex_data import ASSETS_DIR
+from json_io import load
+
+POKEMON_JSON = ASSETS_DIR / "pokemon.json"
+NATURES_JSON = ASSETS_DIR / "natures.json"
+OUT_FILE = ASSETS_DIR / "stat_table.json"
+
+FORMAT_VERSION = 1
+LEVELS = (50, 100)
+STATS = ("attack", "defense", "sp_atk", "sp_def", "speed")
+SPREADS = ((0, 0), (0, 252), (31, 0), (31, 252))  # (IV, EV)
+MAX_SPREAD = SPREADS.index((31, 252))
+MIN_SPREAD = SPREADS.index((0, 0))
+
+
+def nature_multipliers(natures: Dict[str, Dict[str, float]]) -> List[float]:
+    """Distinct multipliers used by natures.json, ascending (hindered, neutral, boosted)."""
+    return sorted({float(m) for modifiers in natures.values() for m in modifiers.values()})
+
+
+def compute_tables(base_stats: np.ndarray, multipliers: List[float]) -> Tuple[np.ndarray, np.ndarray]:
+    """HP [forms, levels, spreads] and other stats [forms, levels, stats, spreads, natures].
+
+    base_stats is [forms, 6] with HP in column 0 and STATS order after it.
+    """
+    levels = np.array(LEVELS).reshape(1, -1, 1, 1)
+    ivs = np.array([iv for iv, _ in SPREADS]).reshape(1, 1, 1, -1)
+    evs = np.array([ev for _, ev in SPREADS]).reshape(1, 1, 1, -1)
+    base = base_stats.astype(np.int64)[:, None, :, None]  # [forms, 1, 6, 1]
+    core = ((2 * base + ivs + evs // 4) * levels) // 100   # [forms, levels, 6, spreads]
+
+    hp = core[:, :, 0, :] + levels[:, :, 0, :] + 10
+    hp[base_stats[:, 0] == 1] = 1  # Shedinja
+
+    percents = np.array([round(m * 100) for m in multipliers]).reshape(1, 1, 1, 1, -1)
+    values = ((core[:, :, 1:, :, None] + 5) * percents) // 100
+    return hp, values
+
+
+def _encode(array: np.ndarray) -> str:
+    if array.min(initial=0) < 0 or array.max(initial=0) > 0xFFFF:
+        raise ValueError("Stat value out of uint16 range")
+    return base64.b64encode(array.astype("<u2").tobytes()).decode("ascii")
+
+
+def build_table(pokemon: List[Dict], natures: Dict[str, Dict[str, float]]) -> Dict:
+    base_stats = np.array([[entry["stats"][s] for s in ("hp",) + STATS] for entry in pokemon])
+    multipliers = nature_multipliers(natures)
+    hp, values = compute_tables(base_stats, multipliers)
+    return {
+        "version": FORMAT_VERSION,
+        "forms": [entry["name"] for entry in pokemon],
+        "levels": list(LEVELS),
+        "stats": list(STATS),
+        "spreads": [list(spread) for spread in SPREADS],
+        "natures": multipliers,
+        "hp": _encode(hp),
+        "values": _encode(values),
+    }
+
+
+class StatTable:
+    """Query API over stat_table.json."""
+
+    def __init__(self, data: Dict, natures: Optional[Dict[str, Dict[str, float]]] = None):
+        if data.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported stat table version: {data.get('version')}")
+        self.forms: List[str] = data["forms"]
+        self.form_index = {name: i for i, name in enumerate(self.forms)}
+        self.levels: List[int] = data["levels"]
+        self.stats: List[str] = data["stats"]
+        self.spreads: List[Tuple[int, int]] = [tuple(spread) for spread in data["spreads"]]
+        self.multipliers: List[float] = data["natures"]
+        self.natures = natures if natures is not None else load(NATURES_JSON)
+
+        forms, levels, spreads = len(self.forms), len(self.levels), len(self.spreads)
+        self.hp = np.frombuffer(base64.b64decode(data["hp"]), dtype="<u2").reshape(forms, levels, spreads)
+        self.values = np.frombuffer(base64.b64decode(data["values"]), dtype="<u2").reshape(
+            forms, levels, len(self.stats), spreads, len(self.multipliers))
+
+    @classmethod
+    def load(cls, path: pathlib.Path = OUT_FILE) -> "StatTable":
+        return cls(load(path))
+
+    def _nature_index(self, stat: str, nature: Optional[str]) -> int:
+        multiplier = 1.0 if nature is None else float(self.natures[nature][stat])
+        return self.multipliers.index(multiplier)
+
+    def column(self, stat: str, level: int = 50, iv: int = 31, ev: int = 252,
+               nature: Optional[str] = None) -> np.ndarray:
+        """One stat for every form (indexed by form ID) at a tabulated level and spread."""
+        lvl, spread = self.levels.index(level), self.spreads.index((iv, ev))
+        if stat == "hp":
+            return self.hp[:, lvl, spread]
+        return self.values[:, lvl, self.stats.index(stat), spread, self._nature_index(stat, nature)]
+
+    def stat(self, form: str, stat: str, level: int = 50, iv: int = 31, ev: int = 252,
+             nature: Optional[str] = None) -> int:
+        return int(self.column(stat, level, iv, ev, nature)[self.form_index[form]])
+
+    def stat_range(self, form: str, stat: str, level: int = 50) -> Tuple[int, int]:
+        """(minimum, maximum) of a stat: no IVs/EVs and hindering nature vs. full investment and boosting nature."""
+        form_id, lvl = self.form_index[form], self.levels.index(level)
+        if stat == "hp":
+            return int(self.hp[form_id, lvl, MIN_SPREAD]), int(self.hp[form_id, lvl, MAX_SPREAD])
+        values = self.values[form_id, lvl, self.stats.index(stat)]
+        return int(values[MIN_SPREAD, 0]), int(values[MAX_SPREAD, -1])
+
+    def speed_tiers(self, level: int = 50, iv: int = 31, ev: int = 252,
+                    nature: Optional[str] = None) -> List[Tuple[int, str]]:
+        """(speed, form) for every form, fastest first."""
+        speeds = self.column("speed", level, iv, ev, nature)
+        order = np.argsort(-speeds.astype(np.int64), kind="stable")
+        return [(int(speeds[i]), self.forms[i]) for i in order]
+
+    def filter(self, stat: str, minimum: int, level: int = 50, iv: int = 31, ev: int = 252,
+               nature: Optional[str] = None) -> List[str]:
+        """Forms whose stat reaches minimum at the given spread."""
+        column = self.column(stat, level, iv, ev, nature)
+        return [self.forms[i] for i in np.flatnonzero(column >= minimum)]
+
+
+def _scalar_stat(base: int, stat: str, iv: int, ev: int, level: int, multiplier: float) -> int:
+    core = (2 * base + iv + ev // 4) * level // 100
+    if stat == "hp":
+        return 1 if base == 1 else core + level + 10
+    return int((core + 5) * multiplier // 1)
+
+
+def verify(pokemon: List[Dict], table: StatTable) -> int:
+    """Compare every cell with the per-call formula; return mismatches."""
+    mismatches = 0
+    for form_id, entry in enumerate(pokemon):
+        for lvl, level in enumerate(table.levels):
+            for spread, (iv, ev) in enumerate(table.spreads):
+                expected = _scalar_stat(entry["stats"]["hp"], "hp", iv, ev, level, 1.0)
+                mismatches += int(table.hp[form_id, lvl, spread] != expected)
+                for s, stat in enumerate(table.stats):
+                    for n, multiplier in enumerate(table.multipliers):
+                        expected = _scalar_stat(entry["stats"][stat], stat, iv, ev, level, multiplier)
+                        mismatches += int(table.values[form_id, lvl, s, spread, n] != expected)
+    return mismatches
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Precompute final stats per form at standard spreads")
+    parser.add_argument("--verify", action="store_true", help="Check every cell against the scalar formula")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    pokemon = load(POKEMON_JSON)
+    natures = load(NATURES_JSON)
+    payload = build_table(pokemon, natures)
+    writer = AssetWriter()
+    writer.write_json(OUT_FILE, payload, indent=None)
+    cells = len(pokemon) * len(LEVELS) * len(SPREADS) * (1 + len(STATS) * len(payload["natures"]))
+    print(f"Tabulated {len(pokemon)} forms ({cells} stat values): "
+          f"{OUT_FILE.stat().st_size / 1024:.0f} KB in {time.perf_counter() - start:.2f}s")
+    writer.print_summary("stat table")
+
+    if args.verify:
+        mismatches = verify(pokemon, StatTable(payload, natures))
+        print(f"Verify: {mismatches} mismatches")
+        if mismatches:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Build an inverted index over move and ability description text.
+
+Searching descriptions used to mean a substring scan over every effect string
+in moves.json and abilities.json. This stage tokenizes and stems that
+text once at build time and emits term -> posting lists, so a search is a
+lookup plus a posting-list intersection.
+
+Analyzer (apply the same steps to queries):
+1. NFKD-normalize, drop combining marks (accent folding) and lowercase.
+2. Split on runs of characters other than a-z and 0-9.
+3. Drop stopwords (STOPWORDS) and single characters.
+4. Stem: "ies" -> "y" (words over 4 letters), "sses" -> "ss", otherwise strip a
+   final "s" (not after s, u or i); then strip "ing" or "ed" (undoubling a
+   final doubled consonant other than l, s or z); then strip a final "e".
+   Except for "ies", a suffix is only removed if at least 3 characters remain,
+   but "ing"/"ed" leaving two letters, a vowel then a consonant, become a final
+   "e" instead ("used", "using" -> "use"), so they meet the unsuffixed word.
+
+Output (assets/data/text_index.json):
+    {
+      "version": 1,
+      "moves": {
+        "docs": ["Absorb", ...],              # doc ID = position
+        "terms": {"drain": [3, 1, 14], ...},  # doc IDs, sorted, delta-encoded
+        "positions": {"drain": [[4, 31], [0], [7]], ...}   # only with --positions
+      },
+      "abilities": {...}
+    }
+Move text is effect + detailed_effect + in_depth_effect; ability text is effect.
+Positions count tokens (after stopword removal) across a doc's fields in that order.
+
+Usage:
+    from build_text_index import TextIndex
+
+    index = TextIndex.load()
+    index.search("moves", "lowers target speed")   # every term must match
+    index.phrase("moves", "never misses")          # index built with --positions
+
+Run:
+    python scripts/build_text_index.py [--positions] [--benchmark]
+"""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import re
+import sys
+import time
+import unicodedata
+from collections import defaultdict
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Add scripts directory to path for relative imports
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+
+from asset_writer import AssetWriter
+from championdex_data import ASSETS_DIR, ROOT
+from json_io import load
+from move_text import effect_text
+
+MOVES_JSON = ASSETS_DIR / "moves.json"
+ABILITIES_JSON = ASSETS_DIR / "abilities.json"
+OUT_FILE = ASSETS_DIR / "text_index.json"
+
+FORMAT_VERSION = 1
+MOVE_FIELDS = ("effect", "detailed_effect", "in_depth_effect")
+ABILITY_FIELDS = ("effect",)
+
+STOPWORDS = frozenset("""
+a an and are as at be been but by for from had has have if in into is it its of on or so such than that the
+their them then there these they this to was were when which while will with
+""".split())
+
+_SPLIT = re.compile(r"[^a-z0-9]+")
+_MIN_STEM = 3
+_VOWELS = "aeiou"
+
+
+def fold(text: str) -> str:
+    """Accent-fold and lowercase."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).lower()
+
+
+def stem(word: str) -> str:
+    if word.isdigit():
+        return word
+    if word.endswith("ies") and len(word) > 4:
+        word = word[:-3] + "y"
+    elif word.endswith("sses"):
+        word = word[:-2]
+    elif word.endswith("s") and not word.endswith(("ss", "us", "is")) and len(word) - 1 >= _MIN_STEM:
+        word = word[:-1]
+    for suffix in ("ing", "ed"):
+        if not word.endswith(suffix):
+            continue
+        base = word[:-len(suffix)]
+        if len(base) >= _MIN_STEM:
+            word = base
+            if len(word) > _MIN_STEM and word[-1] == word[-2] and word[-1] not in "aeiolsz":
+                word = word[:-1]
+        elif len(base) == _MIN_STEM - 1 and base[0] in _VOWELS and base[1] not in _VOWELS:
+            word = base + "e"  # "used" -> "use", which keeps its "e" below
+        break
+    if word.endswith("e") and len(word) - 1 >= _MIN_STEM:
+        word = word[:-1]
+    return word
+
+
+def analyze(text: str) -> List[str]:
+    """Turn text into the stemmed terms the index stores, in order."""
+    return [stem(token) for token in _SPLIT.split(fold(text))
+            if len(token) > 1 and token not in STOPWORDS]
+
+
+def iter_documents(kind: str) -> Iterator[Tuple[str, List[str]]]:
+    """Yield (name, [field texts]) for moves or abilities, sorted by name."""
+    path, fields = (MOVES_JSON, MOVE_FIELDS) if kind == "moves" else (ABILITIES_JSON, ABILITY_FIELDS)
+    data = load(path)
+    for name in sorted(data):
+        yield name, [text for text in (effect_text(data[name].get(f)) for f in fields) if text]
+
+
+def build_index(documents: List[Tuple[str, List[str]]], positions: bool = False) -> Dict:
+    postings: Dict[str, Dict[int, List[int]]] = defaultdict(dict)
+    for doc_id, (_, texts) in enumerate(documents):
+        terms = [term for text in texts for term in analyze(text)]
+        for pos, term in enumerate(terms):
+            postings[term].setdefault(doc_id, []).append(pos)
+
+    index: Dict = {"docs": [name for name, _ in documents], "terms": {}}
+    if positions:
+        index["positions"] = {}
+    for term in sorted(postings):
+        doc_ids = sorted(postings[term])
+        index["terms"][term] = [d - p for d, p in zip(doc_ids, [0] + doc_ids[:-1])]
+        if positions:
+            index["positions"][term] = [postings[term][d] for d in doc_ids]
+    return index
+
+
+class TextIndex:
+    """Query API over text_index.json."""
+
+    def __init__(self, data: Dict):
+        if data.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported text index version: {data.get('version')}")
+        self.data = data
+        self._decoded: Dict[Tuple[str, str], List[int]] = {}
+
+    @classmethod
+    def load(cls, path: pathlib.Path = OUT_FILE) -> "TextIndex":
+        return cls(load(path))
+
+    def postings(self, kind: str, term: str) -> List[int]:
+        """Sorted doc IDs containing an (already analyzed) term."""
+        key = (kind, term)
+        if key not in self._decoded:
+            doc_ids, current = [], 0
+            for delta in self.data[kind]["terms"].get(term, []):
+                current += delta
+                doc_ids.append(current)
+            self._decoded[key] = doc_ids
+        return self._decoded[key]
+
+    def search(self, kind: str, query: str, mode: str = "and") -> List[str]:
+        """Names of docs matching all (mode "and") or any (mode "or") query terms."""
+        terms = analyze(query)
+        if not terms:
+            return []
+        lists = sorted((self.postings(kind, t) for t in set(terms)), key=len)
+        if mode == "or":
+            matched = sorted(set().union(*lists))
+        else:
+            matched = set(lists[0])
+            for doc_ids in lists[1:]:
+                matched.intersection_update(doc_ids)
+                if not matched:
+                    break
+            matched = sorted(matched)
+        docs = self.data[kind]["docs"]
+        return [docs[d] for d in matched]
+
+    def phrase(self, kind: str, query: str) -> List[str]:
+        """Names of docs containing the query terms consecutively (needs --positions)."""
+        positions = self.data[kind].get("positions")
+        if positions is None:
+            raise ValueError("Index was built without positions")
+        terms = analyze(query)
+        if not terms:
+            return []
+        candidates: Optional[Dict[int, set]] = None
+        for offset, term in enumerate(terms):
+            hits = {d: {p - offset for p in pos}
+                    for d, pos in zip(self.postings(kind, term), positions.get(term, []))}
+            if candidates is None:
+                candidates = hits
+            else:
+                candidates = {d: starts & hits[d] for d, starts in candidates.items() if d in hits}
+                candidates = {d: starts for d, starts in candidates.items() if starts}
+        docs = self.data[kind]["docs"]
+        return [docs[d] for d in sorted(candidates)]
+
+
+def _scan(documents: List[Tuple[str, List[str]]], query: str) -> List[str]:
+    words = query.lower().split()
+    return [name for name, texts in documents
+            if all(any(w in text.lower() for text in texts) for w in words)]
+
+
+def benchmark(index: TextIndex, documents: Dict[str, List], rounds: int = 50) -> None:
+    queries = [("moves", "restores hp"), ("moves", "lowers target speed"), ("moves", "burn"),
+               ("abilities", "weather"), ("abilities", "immune to ground")]
+    for kind, query in queries:
+        start = time.perf_counter()
+        for _ in range(rounds):
+            hits = index.search(kind, query)
+        indexed = (time.perf_counter() - start) / rounds
+        index._decoded.clear()
+        start = time.perf_counter()
+        for _ in range(rounds):
+            scanned = _scan(documents[kind], query)
+        scan = (time.perf_counter() - start) / rounds
+        print(f"  {kind:9} {query!r:24} index {len(hits):4} hits {indexed * 1000:6.3f} ms"
+              f" | substring scan {len(scanned):4} hits {scan * 1000:6.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build the move/ability text search index")
+    parser.add_argument("--positions", action="store_true", help="Store term positions (enables phrase queries)")
+    parser.add_argument("--benchmark", action="store_true", help="Compare index lookups with substring scans")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    documents = {kind: list(iter_documents(kind)) for kind in ("moves", "abilities")}
+    payload = {"version": FORMAT_VERSION}
+    for kind, docs in documents.items():
+        payload[kind] = build_index(docs, positions=args.positions)
+
+    writer = AssetWriter()
+    writer.write_json(OUT_FILE, payload, indent=None)
+    text_bytes = sum(len(t.encode("utf-8")) for docs in documents.values() for _, texts in docs for t in texts)
+    print(f"Indexed {len(documents['moves'])} moves and {len(documents['abilities'])} abilities "
+          f"({text_bytes / 1024:.0f} KB of text): "
+          + ", ".join(f"{len(payload[k]['terms'])} {k} terms" for k in documents))
+    print(f"{OUT_FILE.relative_to(ROOT)}: {OUT_FILE.stat().st_size / 1024:.0f} KB "
+          f"in {time.perf_counter() - start:.2f}s")
+    writer.print_summary("text index")
+
+    if args.benchmark:
+        benchmark(TextIndex(payload), documents)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Precompute defensive type profiles for every Pokémon form.
+
+The app used to walk type_chart.json for every type a form has each time a
+detail page was shown. This stage loads the chart into an 18x18 NumPy matrix
+(attacking type x defending type) once and computes, for every form in
+pokemon.json, the full 18-entry vector of damage multipliers it takes. Forms
+with an immunity or resist ability (ABILITY_MODIFIERS: Levitate, Flash Fire,
+Thick Fat, ...) also get an ability-adjusted vector per such ability.
+
+Weakness/resistance/immunity lookups become a single array index, and team
+coverage is a sum over rows.
+
+Output (assets/data/type_profiles.json):
+    {
+      "version": 1,
+      "scale": 16,                      # stored byte = multiplier * scale
+      "types": ["Normal", ...],         # attacking type order of each vector
+      "forms": ["Bulbasaur", ...],      # form ID = position, same order as pokemon.json
+      "profiles": "<base64>",           # uint8[len(forms) * 18], row-major
+      "variants": {                     # ability-adjusted rows
+        "abilities": ["Levitate", ...],
+        "forms": [92, ...],             # form ID per row
+        "ability": [0, ...],            # index into "abilities" per row
+        "profiles": "<base64>"          # uint8[rows * 18], row-major
+      }
+    }
+Every multiplier reachable from the chart and the ability table is a multiple
+of 1/16 (e.g. Dry Skin 1.25 x 0.25 = 5/16), so the bytes are exact.
+
+Usage:
+    from build_type_profiles import TypeProfiles
+
+    profiles = TypeProfiles.load()
+    profiles.weaknesses("Bronzong")                # {"Fire": 2.0, "Ground": 2.0, ...}
+    profiles.weaknesses("Bronzong", ability="Levitate")
+    profiles.team_summary(["Garchomp", "Rotom Heat Rotom"])["Ice"]   # {"weak": 1, ...}
+
+Run:
+    python scripts/build_type_profiles.py [--verify]
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import pathlib
+import sys
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Add scripts directory to path for relative imports
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+
+from asset_writer import AssetWriter
+from championdex_data import ASSETS_DIR
+from json_io import load
+
+TYPE_CHART_JSON = ASSETS_DIR / "type_chart.json"
+POKEMON_JSON = ASSETS_DIR / "pokemon.json"
+ABILITIES_JSON = ASSETS_DIR / "abilities.json"
+OUT_FILE = ASSETS_DIR / "type_profiles.json"
+
+FORMAT_VERSION = 1
+SCALE = 16
+
+# Per attacking type multipliers applied on top of the type chart
+ABILITY_MODIFIERS: Dict[str, Dict[str, float]] = {
+    "Levitate": {"Ground": 0},
+    "Earth Eater": {"Ground": 0},
+    "Flash Fire": {"Fire": 0},
+    "Well-Baked Body": {"Fire": 0},
+    "Water Absorb": {"Water": 0},
+    "Storm Drain": {"Water": 0},
+    "Dry Skin": {"Water": 0, "Fire": 1.25},
+    "Volt Absorb": {"Electric": 0},
+    "Lightning Rod": {"Electric": 0},
+    "Motor Drive": {"Electric": 0},
+    "Sap Sipper": {"Grass": 0},
+    "Thick Fat": {"Fire": 0.5, "Ice": 0.5},
+    "Heatproof": {"Fire": 0.5},
+    "Water Bubble": {"Fire": 0.5},
+    "Purifying Salt": {"Ghost": 0.5},
+    "Fluffy": {"Fire": 2},
+}
+# Abilities that depend on the chart result rather than the attacking type
+SUPER_EFFECTIVE_FACTOR = {"Filter": 0.75, "Solid Rock": 0.75, "Prism Armor": 0.75}
+ONLY_SUPER_EFFECTIVE = {"Wonder Guard"}
+
+
+def load_chart(path: pathlib.Path = TYPE_CHART_JSON) -> Tuple[List[str], np.ndarray]:
+    """Type order and the attacking x defending multiplier matrix."""
+    chart = load(path)["typeChart"]
+    types = list(chart)
+    matrix = np.array([[chart[atk][dfn] for dfn in types] for atk in types], dtype=np.float64)
+    return types, matrix
+
+
+def defensive_profiles(matrix: np.ndarray, type_ids: np.ndarray) -> np.ndarray:
+    """(forms, 18) multipliers for forms given as (forms, 2) type IDs, -1 for no second type."""
+    # Column -1 of the padded matrix is all ones, so single-typed forms need no special case
+    padded = np.hstack([matrix, np.ones((len(matrix), 1))])
+    return (padded[:, type_ids[:, 0]] * padded[:, type_ids[:, 1]]).T
+
+
+def ability_adjustments(types: List[str], abilities: Iterable[str]) -> Dict[str, Tuple[np.ndarray, str]]:
+    """ability -> (per attacking type factor vector, rule) for modelled abilities."""
+    index = {name: i for i, name in enumerate(types)}
+    adjustments = {}
+    for ability in abilities:
+        factors = np.ones(len(types))
+        rule = ""
+        if ability in ABILITY_MODIFIERS:
+            for type_name, factor in ABILITY_MODIFIERS[ability].items():
+                factors[index[type_name]] = factor
+        elif ability in SUPER_EFFECTIVE_FACTOR:
+            rule = "super_effective"
+        elif ability in ONLY_SUPER_EFFECTIVE:
+            rule = "only_super_effective"
+        else:
+            continue
+        adjustments[ability] = (factors, rule)
+    return adjustments
+
+
+def apply_ability(profile: np.ndarray, factors: np.ndarray, rule: str, ability: str) -> np.ndarray:
+    adjusted = profile * factors
+    if rule == "super_effective":
+        adjusted = np.where(adjusted > 1, adjusted * SUPER_EFFECTIVE_FACTOR[ability], adjusted)
+    elif rule == "only_super_effective":
+        adjusted = np.where(adjusted > 1, adjusted, 0.0)
+    return adjusted
+
+
+def _encode(rows: np.ndarray) -> str:
+    scaled = rows * SCALE
+    encoded = np.rint(scaled)
+    if not np.array_equal(encoded, scaled) or encoded.max(initial=0) > 255:
+        raise ValueError("Multiplier not representable as a byte at scale 1/16")
+    return base64.b64encode(encoded.astype(np.uint8).tobytes()).decode("ascii")
+
+
+def build_profiles(pokemon: List[Dict], types: List[str], matrix: np.ndarray,
+                   abilities: Iterable[str]) -> Dict:
+    index = {name: i for i, name in enumerate(types)}
+    type_ids = np.full((len(pokemon), 2), -1, dtype=np.intp)
+    for row, entry in enumerate(pokemon):
+        for col, type_name in enumerate(entry["types"][:2]):
+            type_ids[row, col] = index[type_name]
+    profiles = defensive_profiles(matrix, type_ids)
+
+    adjustments = ability_adjustments(types, abilities)
+    ability_names = sorted(adjustments)
+    ability_index = {name: i for i, name in enumerate(ability_names)}
+    variant_forms, variant_abilities, variant_rows = [], [], []
+    for form_id, entry in enumerate(pokemon):
+        form_abilities = entry.get("abilities") or {}
+        names = dict.fromkeys(form_abilities.get("regular", []) + form_abilities.get("hidden", []))
+        for ability in names:
+            if ability not in adjustments:
+                continue
+            adjusted = apply_ability(profiles[form_id], *adjustments[ability], ability)
+            if not np.array_equal(adjusted, profiles[form_id]):
+                variant_forms.append(form_id)
+                variant_abilities.append(ability_index[ability])
+                variant_rows.append(adjusted)
+
+    return {
+        "version": FORMAT_VERSION,
+        "scale": SCALE,
+        "types": types,
+        "forms": [entry["name"] for entry in pokemon],
+        "profiles": _encode(profiles),
+        "variants": {
+            "abilities": ability_names,
+            "forms": variant_forms,
+            "ability": variant_abilities,
+            "profiles": _encode(np.array(variant_rows).reshape(-1, len(types))),
+        },
+    }
+
+
+class TypeProfiles:
+    """Query API over type_profiles.json."""
+
+    def __init__(self, data: Dict):
+        if data.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported type profile version: {data.get('version')}")
+        self.types: List[str] = data["types"]
+        self.forms: List[str] = data["forms"]
+        self.form_index = {name: i for i, name in enumerate(self.forms)}
+        width, scale = len(self.types), float(data["scale"])
+
+        def decode(blob: str) -> np.ndarray:
+            raw = np.frombuffer(base64.b64decode(blob), dtype=np.uint8)
+            return raw.reshape(-1, width).astype(np.float32) / scale
+
+        self.profiles = decode(data["profiles"])
+        variants = data["variants"]
+        rows = decode(variants["profiles"])
+        self.variants: Dict[Tuple[int, str], np.ndarray] = {
+            (form_id, variants["abilities"][ability_id]): rows[i]
+            for i, (form_id, ability_id) in enumerate(zip(variants["forms"], variants["ability"]))
+        }
+
+    @classmethod
+    def load(cls, path: pathlib.Path = OUT_FILE) -> "TypeProfiles":
+        return cls(load(path))
+
+    def vector(self, form: str, ability: Optional[str] = None) -> np.ndarray:
+        """Multiplier per attacking type (in self.types order); abilities without an effect are ignored."""
+        form_id = self.form_index[form]
+        if ability is not None:
+            adjusted = self.variants.get((form_id, ability))
+            if adjusted is not None:
+                return adjusted
+        return self.profiles[form_id]
+
+    def multiplier(self, form: str, attacking_type: str, ability: Optional[str] = None) -> float:
+        return float(self.vector(form, ability)[self.types.index(attacking_type)])
+
+    def _select(self, form: str, ability: Optional[str], mask) -> Dict[str, float]:
+        vector = self.vector(form, ability)
+        return {self.types[i]: float(vector[i]) for i in np.flatnonzero(mask(vector))}
+
+    def weaknesses(self, form: str, ability: Optional[str] = None) -> Dict[str, float]:
+        return self._select(form, ability, lambda v: v > 1)
+
+    def resistances(self, form: str, ability: Optional[str] = None) -> Dict[str, float]:
+        return self._select(form, ability, lambda v: (v > 0) & (v < 1))
+
+    def immunities(self, form: str, ability: Optional[str] = None) -> List[str]:
+        return list(self._select(form, ability, lambda v: v == 0))
+
+    def team_matrix(self, members: Sequence[str], abilities: Optional[Sequence[Optional[str]]] = None) -> np.ndarray:
+        abilities = abilities or [None] * len(members)
+        return np.stack([self.vector(form, ability) for form, ability in zip(members, abilities)])
+
+    def team_summary(self, members: Sequence[str],
+                     abilities: Optional[Sequence[Optional[str]]] = None) -> Dict[str, Dict[str, int]]:
+        """Per attacking type: how many members are weak, resist or are immune."""
+        team = self.team_matrix(members, abilities)
+        counts = {
+            "weak": (team > 1).sum(axis=0),
+            "resist": ((team > 0) & (team < 1)).sum(axis=0),
+            "immune": (team == 0).sum(axis=0),
+        }
+        return {t: {k: int(v[i]) for k, v in counts.items()} for i, t in enumerate(self.types)}
+
+
+def verify(pokemon: List[Dict], chart_path: pathlib.Path, profiles: TypeProfiles) -> int:
+    """Compare every stored vector with a per-type walk of type_chart.json; return mismatches."""
+    chart = load(chart_path)["typeChart"]
+    mismatches = 0
+    for entry in pokemon:
+        expected = []
+        for atk in profiles.types:
+            multiplier = 1.0
+            for dfn in entry["types"]:
+                multiplier *= chart[atk][dfn]
+            expected.append(multiplier)
+        if not np.array_equal(profiles.vector(entry["name"]), np.array(expected, dtype=np.float32)):
+            mismatches += 1
+            print(f"  Mismatch: {entry['name']}")
+    return mismatches
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Precompute defensive type profiles per Pokémon form")
+    parser.add_argument("--verify", action="store_true", help="Check every vector against type_chart.json")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    types, matrix = load_chart()
+    pokemon = load(POKEMON_JSON)
+    payload = build_profiles(pokemon, types, matrix, load(ABILITIES_JSON))
+    writer = AssetWriter()
+    writer.write_json(OUT_FILE, payload, indent=None)
+    variants = payload["variants"]
+    print(f"Profiled {len(payload['forms'])} forms x {len(types)} types, "
+          f"{len(variants['forms'])} ability variants over {len(variants['abilities'])} abilities: "
+          f"{OUT_FILE.stat().st_size / 1024:.0f} KB in {time.perf_counter() - start:.2f}s")
+    writer.print_summary("type profiles")
+
+    if args.verify:
+        mismatches = verify(pokemon, TYPE_CHART_JSON, TypeProfiles(payload))
+        print(f"Verify: {mismatches} mismatches")
+        if mismatches:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
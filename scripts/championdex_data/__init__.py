@@ -0,0 +1,61 @@
+"""
+Lazy, cached access to the ChampionDex dataset.
+
+One loading path for scripts, notebooks and services instead of each script
+building its own paths and decoding whole files at import time. Accessors read
+assets/data on first use, memoize the decoded file and re-read it only after
+its mtime or size changes; per-entity files (learnsets, move learner lists)
+are held in an LRU cache of ENTITY_CACHE_SIZE files. Decoding goes through
+json_io (orjson when installed).
+
+Modules:
+- paths.py     : ROOT, ASSETS_DIR (assets/data), SCRAPE_DIR (data) and the asset subdirectories
+- cache.py     : FileCache, the mtime-checked LRU memo behind every accessor
+- accessors.py : pokemon(), moves(), learnset(base), ... and cache_info()
+
+Usage (with scripts/ on sys.path):
+    from championdex_data import learnset, moves, pokemon_by_name
+
+    pikachu = pokemon_by_name("Pikachu")
+    thunderbolt = moves()["Thunderbolt"]
+    rows = learnset("Pikachu")
+
+Returned objects are shared and must not be edited; use load_copy(name) for a
+private copy of a file you intend to rewrite.
+
+Run (load timings and cache state):
+    python -m championdex_data            # from scripts/
+"""
+
+from .accessors import (
+    DATASET_CACHE,
+    ENTITY_CACHE,
+    ENTITY_CACHE_SIZE,
+    abilities,
+    asset,
+    cache_info,
+    clear_cache,
+    learnset,
+    learnset_names,
+    load_copy,
+    move_learners,
+    moves,
+    natures,
+    pokemon,
+    pokemon_by_base_name,
+    pokemon_by_name,
+    pokemon_by_number,
+    scraped,
+    type_chart,
+)
+from .cache import FileCache
+from .paths import (
+    ASSETS_DIR,
+    BACKDROPS_DIR,
+    IMAGES_DIR,
+    IMAGES_LARGE_DIR,
+    LEARNSET_DIR,
+    MOVE_LEARNERS_DIR,
+    ROOT,
+    SCRAPE_DIR,
+)
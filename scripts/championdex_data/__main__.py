@@ -0,0 +1,32 @@
+"""Print cold and cached load times of the main datasets and the cache state."""
+
+from __future__ import annotations
+
+import time
+
+from . import ENTITY_CACHE_SIZE, abilities, cache_info, learnset, learnset_names, moves, pokemon
+
+
+def main() -> None:
+    names = learnset_names()[:ENTITY_CACHE_SIZE]
+    accessors = {
+        "pokemon()": pokemon,
+        "moves()": moves,
+        "abilities()": abilities,
+        f"learnset() x {len(names)}": lambda: [learnset(name) for name in names],
+    }
+    print(f"{'':24} {'first call':>11} {'cached':>9}")
+    for label, accessor in accessors.items():
+        timings = []
+        for _ in range(2):
+            start = time.perf_counter()
+            accessor()
+            timings.append(time.perf_counter() - start)
+        print(f"{label:24} {timings[0] * 1000:9.1f}ms {timings[1] * 1000:7.1f}ms")
+    for cache, info in cache_info().items():
+        print(f"{cache:9} {info['entries']} entries (max {info['max_entries'] or '-'}), "
+              f"{info['hits']} hits, {info['misses']} misses")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Dataset accessors.
+
+Whole-dataset files (pokemon.json, moves.json, ...) go through an unbounded
+cache: there are a dozen of them and callers come back to them constantly.
+Per-entity files (one learnset per Pokémon, one learner list per move) go
+through an LRU cache of ENTITY_CACHE_SIZE files. Nothing is read until an
+accessor is first called, and every call re-stats its file, so an asset
+rebuilt underneath a running process is picked up on the next call.
+
+Returned objects are shared between callers and must not be edited. Scripts
+that rewrite an asset take a private copy with load_copy().
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+from json_io import load
+from pokemon_indexes import resolve
+
+from .cache import FileCache
+from .paths import ASSETS_DIR, LEARNSET_DIR, MOVE_LEARNERS_DIR, SCRAPE_DIR
+
+ENTITY_CACHE_SIZE = 128  # ~10 MB of decoded learnsets at the average file size
+
+DATASET_CACHE = FileCache()
+ENTITY_CACHE = FileCache(max_entries=ENTITY_CACHE_SIZE)
+
+
+def asset(name: str) -> Any:
+    """Any file in assets/data by name, e.g. asset("type_chart.json")."""
+    return DATASET_CACHE.get(ASSETS_DIR / name)
+
+
+def scraped(name: str) -> Any:
+    """Any file in the scraper output directory (data/) by name."""
+    return DATASET_CACHE.get(SCRAPE_DIR / name)
+
+
+def pokemon() -> List[Dict]:
+    return asset("pokemon.json")
+
+
+def moves() -> Dict[str, Dict]:
+    return asset("moves.json")
+
+
+def abilities() -> Dict[str, Dict]:
+    return asset("abilities.json")
+
+
+def natures() -> Dict[str, Dict]:
+    return asset("natures.json")
+
+
+def type_chart() -> Dict:
+    return asset("type_chart.json")
+
+
+def pokemon_by_name(name: str) -> Optional[Dict]:
+    """The entry with this full name (any case), or None."""
+    position = asset("pokemon_by_name.json").get(name.lower())
+    return None if position is None else resolve(pokemon(), position)
+
+
+def pokemon_by_number(number: int) -> List[Dict]:
+    """Every form with this National Pokédex number."""
+    return resolve(pokemon(), asset("pokemon_by_number.json").get(str(number), []))
+
+
+def pokemon_by_base_name(base_name: str) -> List[Dict]:
+    """Every form of a species by its base name (any case)."""
+    return resolve(pokemon(), asset("pokemon_by_base_name.json").get(base_name.lower(), []))
+
+
+def learnset(base_name: str) -> Dict:
+    """assets/data/pokemon_moves/<base_name>.json. Raises KeyError for unknown names."""
+    try:
+        return ENTITY_CACHE.get(LEARNSET_DIR / f"{base_name}.json")
+    except FileNotFoundError:
+        raise KeyError(base_name) from None
+
+
+def move_learners(move_name: str) -> Dict:
+    """assets/data/moves_pokemon/<move_name>.json. Raises KeyError for unknown moves."""
+    try:
+        return ENTITY_CACHE.get(MOVE_LEARNERS_DIR / f"{move_name}.json")
+    except FileNotFoundError:
+        raise KeyError(move_name) from None
+
+
+def learnset_names() -> List[str]:
+    """Base names that have a learnset file, sorted."""
+    return sorted(p.stem for p in LEARNSET_DIR.glob("*.json"))
+
+
+def load_copy(name: str) -> Any:
+    """A private, freshly decoded copy of an assets/data file, for callers that edit it."""
+    return load(ASSETS_DIR / name)
+
+
+def cache_info() -> Dict[str, Dict[str, Any]]:
+    return {"datasets": DATASET_CACHE.info(), "entities": ENTITY_CACHE.info()}
+
+
+def clear_cache() -> None:
+    DATASET_CACHE.clear()
+    ENTITY_CACHE.clear()
@@ -0,0 +1,71 @@
+"""
+Memoized file loads, invalidated by mtime.
+
+A FileCache keeps each decoded file with the (mtime_ns, size) it was read at.
+get() stats the file and decodes it again only when either changed, so a
+long-running process sees rebuilt assets without restarting. With
+max_entries set, the least recently used files are dropped once the cache
+holds more, which bounds memory for the per-entity directories (~1,000
+learnset files, 16 MB of JSON) however many of them a caller touches.
+"""
+
+from __future__ import annotations
+
+import os
+import pathlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from json_io import load
+
+Decoder = Callable[[pathlib.Path], Any]
+
+
+class FileCache:
+    """Decoded files keyed by path. Safe to share between threads."""
+
+    def __init__(self, max_entries: Optional[int] = None, decode: Decoder = load):
+        self.max_entries = max_entries
+        self.decode = decode
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[Tuple[int, int], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path: pathlib.Path) -> Any:
+        """Decoded contents of path (shared; do not mutate). Raises FileNotFoundError."""
+        key = str(path)
+        st = os.stat(key)
+        stamp = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stamp:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+        # Decode outside the lock so loads of different files overlap. If the file is
+        # replaced meanwhile, the old stamp makes the next get() read it again.
+        data = self.decode(path)
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (stamp, data)
+            self._entries.move_to_end(key)
+            while self.max_entries is not None and len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return data
+
+    def invalidate(self, path: pathlib.Path) -> None:
+        with self._lock:
+            self._entries.pop(str(path), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def info(self) -> Dict[str, Any]:
+        return {"entries": len(self), "max_entries": self.max_entries, "hits": self.hits, "misses": self.misses}
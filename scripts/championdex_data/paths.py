@@ -0,0 +1,25 @@
+"""
+Canonical locations of the dataset files.
+
+Scripts used to derive these from their own __file__, and mixed the two data
+directories without saying which one they meant:
+- ASSETS_DIR (assets/data): the processed dataset the app ships; every build
+  stage reads and writes here.
+- SCRAPE_DIR (data): raw scraper output and reports; the input of the scripts
+  that migrate or merge fields into the assets.
+"""
+
+from __future__ import annotations
+
+import pathlib
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent.parent
+ASSETS_DIR = ROOT / "assets" / "data"
+SCRAPE_DIR = ROOT / "data"
+
+LEARNSET_DIR = ASSETS_DIR / "pokemon_moves"  # <base_name>.json
+MOVE_LEARNERS_DIR = ASSETS_DIR / "moves_pokemon"  # <move name>.json
+
+IMAGES_DIR = ROOT / "assets" / "images" / "pokemon"
+IMAGES_LARGE_DIR = ROOT / "assets" / "images_large" / "pokemon"
+BACKDROPS_DIR = ROOT / "assets" / "images" / "backdrops"
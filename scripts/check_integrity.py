@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Check cross-file references between the data assets.
+
+The schemas (validate_assets.py) check each file on its own; this stage checks
+that the files agree with each other. Every referenced collection is loaded
+once into a hash index (a dict or set), so each check is a single pass over
+the referring file:
+
+- learnset_moves : every move named in pokemon_moves/*.json is a moves.json key.
+  Names that only match after normalization (case, punctuation,
+  "SWSH Only" suffixes; see move_names.py) are warnings, others errors.
+- abilities      : every ability a pokemon.json form lists exists in
+  abilities.json and lists the form in the same slot (regular/hidden), and
+  every Pokémon name abilities.json lists resolves to a form (the same name
+  matching as add_abilities_to_pokemon.py). Forms without abilities, and
+  abilities listed for a form as both regular and hidden (kept as hidden),
+  are warnings.
+- images         : every image, image_shiny, image_large, image_shiny_large and
+  backdrop file name exists on disk. Image directories that are not checked
+  out are reported as skipped.
+- indexes        : every pokemon_by_* index equals the index pokemon_indexes.py
+  would build from pokemon.json.
+
+Output (--report PATH):
+    {
+      "version": 1,
+      "checks": {"learnset_moves": {"checked": 945, "errors": 3, "warnings": 7}, ...},
+      "skipped": {"images": ["assets/images/pokemon is missing"], ...},
+      "issues": [{"check": "learnset_moves", "severity": "error", "code": "unknown_move",
+                  "subject": "Nihil Light", "detail": {"files": ["Zygarde"], "rows": 1}}, ...]
+    }
+
+Run:
+    python scripts/check_integrity.py [--report PATH] [--strict]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import pathlib
+import sys
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Set
+
+# Add scripts directory to path for relative imports
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+
+from add_abilities_to_pokemon import build_pokemon_abilities, match_ability_key
+from asset_writer import AssetWriter
+from build_move_indexes import iter_learn_rows
+from championdex_data import ASSETS_DIR, BACKDROPS_DIR, IMAGES_DIR, IMAGES_LARGE_DIR, LEARNSET_DIR, ROOT
+from json_io import load
+from learnset_loader import load_learnsets
+from move_names import MoveNameIndex
+from pokemon_indexes import build_indexes, previous_order
+
+FORMAT_VERSION = 1
+CHECKS = ("learnset_moves", "abilities", "images", "indexes")
+# pokemon.json field -> directory holding the file it names
+IMAGE_FIELDS = {
+    "image": IMAGES_DIR,
+    "image_shiny": IMAGES_DIR,
+    "image_large": IMAGES_LARGE_DIR,
+    "image_shiny_large": IMAGES_LARGE_DIR,
+    "backdrop": BACKDROPS_DIR,
+}
+
+
+def move_counts(data: Dict) -> Counter:
+    """Learn rows per move name in one learnset file (runs inside a loader pool worker)."""
+    return Counter(row[0] for row in iter_learn_rows(data))
+
+
+class IntegrityReport:
+    """Collects issues and per-check counters."""
+
+    def __init__(self):
+        self.checks: Dict[str, Dict[str, int]] = {c: {"checked": 0, "errors": 0, "warnings": 0} for c in CHECKS}
+        self.skipped: Dict[str, List[str]] = {}
+        self.issues: List[Dict[str, Any]] = []
+
+    def add(self, check: str, severity: str, code: str, subject: str, **detail: Any) -> None:
+        self.checks[check]["errors" if severity == "error" else "warnings"] += 1
+        issue = {"check": check, "severity": severity, "code": code, "subject": subject}
+        if detail:
+            issue["detail"] = detail
+        self.issues.append(issue)
+
+    def skip(self, check: str, reason: str) -> None:
+        self.skipped.setdefault(check, []).append(reason)
+
+    @property
+    def errors(self) -> int:
+        return sum(c["errors"] for c in self.checks.values())
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"version": FORMAT_VERSION, "checks": self.checks, "skipped": self.skipped, "issues": self.issues}
+
+
+def check_learnset_moves(corpus: Dict[str, Counter], moves: Dict[str, Dict], report: IntegrityReport) -> None:
+    rows: Counter = Counter()
+    files: Dict[str, List[str]] = {}
+    for base_name in sorted(corpus):
+        for move, count in corpus[base_name].items():
+            rows[move] += count
+            files.setdefault(move, []).append(base_name)
+    index = MoveNameIndex(moves)
+    for move in sorted(rows):
+        report.checks["learnset_moves"]["checked"] += 1
+        if move in moves:
+            continue
+        canonical = index.lookup(move)
+        if canonical is not None:
+            report.add("learnset_moves", "warning", "move_spelling", move,
+                       canonical=canonical, files=files[move], rows=rows[move])
+        else:
+            report.add("learnset_moves", "error", "unknown_move", move, files=files[move], rows=rows[move])
+
+
+def check_abilities(pokemon: List[Dict], abilities: Dict[str, Dict], report: IntegrityReport) -> None:
+    listed = build_pokemon_abilities(abilities)  # name as abilities.json spells it -> slots
+    matched: Set[str] = set()
+    for entry in pokemon:
+        report.checks["abilities"]["checked"] += 1
+        name = entry["name"]
+        own = entry.get("abilities") or {"regular": [], "hidden": []}
+        key = match_ability_key(entry, listed)
+        if key is None:
+            if own["regular"] or own["hidden"]:
+                report.add("abilities", "error", "form_not_listed", name,
+                           abilities=own["regular"] + own["hidden"])
+            else:
+                report.add("abilities", "warning", "form_without_abilities", name)
+            continue
+        matched.add(key)
+        # The ability pages list some hidden abilities under both slots; pokemon.json keeps them as hidden
+        both = set(listed[key]["regular"]) & set(listed[key]["hidden"])
+        for ability in sorted(both):
+            report.add("abilities", "warning", "listed_in_both_slots", name, ability=ability, listed_as=key)
+        for slot in ("regular", "hidden"):
+            expected = set(listed[key][slot]) - (both if slot == "regular" else set())
+            for ability in own[slot]:
+                if ability not in abilities:
+                    report.add("abilities", "error", "unknown_ability", name, ability=ability, slot=slot)
+                elif ability not in expected:
+                    report.add("abilities", "error", "ability_not_listing_form", name,
+                               ability=ability, slot=slot, listed_as=key)
+            for ability in sorted(expected - set(own[slot])):
+                report.add("abilities", "error", "ability_missing_on_form", name,
+                           ability=ability, slot=slot, listed_as=key)
+    for key in sorted(set(listed) - matched):
+        report.checks["abilities"]["checked"] += 1
+        report.add("abilities", "error", "unknown_pokemon", key,
+                   abilities=listed[key]["regular"] + listed[key]["hidden"])
+
+
+def check_images(pokemon: List[Dict], report: IntegrityReport) -> None:
+    present: Dict[pathlib.Path, Optional[Set[str]]] = {}
+    for directory in sorted(set(IMAGE_FIELDS.values())):
+        if directory.is_dir():
+            present[directory] = set(os.listdir(directory))
+        else:
+            present[directory] = None
+            report.skip("images", f"{directory.relative_to(ROOT)} is missing")
+    for entry in pokemon:
+        for field, directory in IMAGE_FIELDS.items():
+            file_name = entry.get(field)
+            if present[directory] is None:
+                continue
+            report.checks["images"]["checked"] += 1
+            if not file_name:
+                report.add("images", "warning", "no_file_name", entry["name"], field=field)
+            elif file_name not in present[directory]:
+                report.add("images", "error", "missing_file", entry["name"], field=field,
+                           path=str((directory / file_name).relative_to(ROOT)))
+
+
+def check_indexes(pokemon: List[Dict], assets_dir: pathlib.Path, report: IntegrityReport) -> None:
+    for file_name, expected in build_indexes(pokemon, order=previous_order(assets_dir)).items():
+        path = assets_dir / file_name
+        if not path.exists():
+            report.add("indexes", "error", "missing_index", file_name)
+            continue
+        actual = load(path)
+        expected = {str(k): v for k, v in expected.items()}  # JSON object keys are strings
+        for key in sorted(expected.keys() | actual.keys()):
+            report.checks["indexes"]["checked"] += 1
+            if key not in actual:
+                report.add("indexes", "error", "missing_key", file_name, key=key, expected=expected[key])
+            elif key not in expected:
+                report.add("indexes", "error", "stale_key", file_name, key=key, actual=actual[key])
+            elif actual[key] != expected[key]:
+                report.add("indexes", "error", "wrong_positions", file_name, key=key,
+                           expected=expected[key], actual=actual[key])
+
+
+def check_integrity(assets_dir: pathlib.Path = ASSETS_DIR) -> IntegrityReport:
+    report = IntegrityReport()
+    pokemon = load(assets_dir / "pokemon.json")
+    moves = load(assets_dir / "moves.json")
+    corpus = load_learnsets(assets_dir / LEARNSET_DIR.name, transform=move_counts, strict=True)
+    check_learnset_moves(corpus, moves, report)
+    check_abilities(pokemon, load(assets_dir / "abilities.json"), report)
+    check_images(pokemon, report)
+    check_indexes(pokemon, assets_dir, report)
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check cross-file references between data assets")
+    parser.add_argument("--report", type=pathlib.Path, help="Write the issues as JSON")
+    parser.add_argument("--strict", action="store_true", help="Exit non-zero if any error is found")
+    parser.add_argument("--verbose", action="store_true", help="Print every issue, not only errors")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    report = check_integrity()
+    elapsed = time.perf_counter() - start
+    for check, counts in report.checks.items():
+        status = "✓" if not counts["errors"] else "✗"
+        skipped = f" (skipped: {'; '.join(report.skipped[check])})" if check in report.skipped else ""
+        print(f"{status} {check:15} {counts['checked']:6} checked, {counts['errors']} errors, "
+              f"{counts['warnings']} warnings{skipped}")
+    for issue in report.issues:
+        if issue["severity"] == "error" or args.verbose:
+            print(f"    [{issue['severity']}] {issue['check']}/{issue['code']}: {issue['subject']} "
+                  f"{issue.get('detail', '')}")
+    print(f"Checked references in {elapsed:.2f}s: {report.errors} errors, "
+          f"{len(report.issues) - report.errors} warnings")
+    if args.report:
+        writer = AssetWriter()
+        writer.write_json(args.report, report.as_dict())
+        writer.print_summary("integrity report")
+    if args.strict and report.errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -25,6 +25,7 @@ sys.path.insert(0, str(pathlib.Path(__file__).parent))
 from collect_pokemon_moves_serebii import (
     fetch_html, parse_serebii_moves
 )
+from asset_writer import AssetWriter
 
 ROOT = pathlib.Path(__file__).resolve().parent.parent
 DATA_DIR = ROOT / "data"
@@ -92,6 +93,10 @@ def main():
     output_dir = DATA_DIR / "pokemon_moves"
     output_dir.mkdir(exist_ok=True)
     
+    # Each file is written (atomically) as soon as its page is parsed, so an interrupted
+    # run keeps everything fetched so far
+    writer = AssetWriter()
+    
     successful_count = 0
     failed = []
     errors = []
@@ -163,8 +168,7 @@ def main():
                 
                 # Save to file
                 output_file = output_dir / f"{base_name}.json"
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(output_data, f, indent=2, ensure_ascii=False)
+                writer.write_json(output_file, output_data)
                 
                 successful_count += 1
                 print(") ✓")
@@ -185,6 +189,8 @@ def main():
             })
             print(f") ✗ {str(e)[:30]}")
     
+    writer.print_summary("pokemon_moves files")
+    
     # Save failures summary
     if failed or errors:
         failures_file = DATA_DIR / "pokemon_moves_failures.json"
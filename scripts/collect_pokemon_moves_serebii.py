@@ -12,6 +12,7 @@ Outputs:
 import json
 import pathlib
 import re
+import sys
 import time
 from typing import Dict, List, Optional
 
@@ -19,6 +20,12 @@ import requests
 from bs4 import BeautifulSoup
 import unicodedata
 
+# Add scripts directory to path for relative imports
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+
+from asset_writer import AssetWriter
+from move_names import extract_game_designations, remove_game_designations
+
 ROOT = pathlib.Path(__file__).resolve().parent.parent
 DATA_DIR = ROOT / "data"
 POKEMON_JSON = DATA_DIR / "pokemon.json"
@@ -180,63 +187,6 @@ def get_table_type(header_text: str) -> Optional[str]:
     return None
 
 
-def extract_game_designations(move_name: str) -> List[str]:
-    """
-    Extract game designations from a move name.
-    
-    Examples:
-    - "ScreechBDSP Only" -> ["Brilliant Diamond and Shining Pearl"]
-    - "Water PulseSWSH Only" -> ["Sword and Shield"]
-    
-    Returns:
-        List of game names this move applies to
-    """
-    games = []
-    move_lower = move_name.lower()
-    
-    # Check for specific game designations
-    if 'swsh only' in move_lower or 'sword & shield only' in move_lower:
-        games.append('Sword and Shield')
-    if 'bdsp only' in move_lower or 'brilliant diamond shining pearl only' in move_lower:
-        games.append('Brilliant Diamond and Shining Pearl')
-    if 'legends' in move_lower and 'z-a' in move_lower:
-        games.append('Legends: Z-A')
-    if ('scarlet' in move_lower or 'violet' in move_lower) and 'only' in move_lower:
-        games.append('Scarlet and Violet')
-    
-    return games
-
-
-def remove_game_designations(move_name: str) -> str:
-    """
-    Remove game designations from a move name.
-    
-    Examples:
-    - "ScreechBDSP Only" -> "Screech"
-    - "Water PulseSWSH Only" -> "Water Pulse"
-    
-    Returns:
-        Clean move name without game designation
-    """
-    # Remove common game designation patterns
-    patterns = [
-        r'\s*BDSP\s+Only\s*$',
-        r'\s*SWSH\s+Only\s*$',
-        r'\s*Sword\s+&\s+Shield\s+Only\s*$',
-        r'\s*Brilliant\s+Diamond.*?Shining\s+Pearl\s+Only\s*$',
-        r'\s*Isle\s+of\s+Armou?r\s+Only\s*$',
-        r'\s*Crown\s+Tundra\s+Only\s*$',
-        r'\s*Legends:\s+Z-A\s+Only\s*$',
-        r'\s*Scarlet\s+&\s+Violet\s+Only\s*$',
-    ]
-    
-    clean_name = move_name
-    for pattern in patterns:
-        clean_name = re.sub(pattern, '', clean_name, flags=re.IGNORECASE)
-    
-    return clean_name.strip()
-
-
 def parse_level_up_moves(table: BeautifulSoup, is_legends: bool = False, is_pla: bool = False) -> List[Dict]:
     """
     Parse level-up moves from a dextable.
@@ -377,6 +327,11 @@ def parse_egg_or_special_moves(table: BeautifulSoup, game_context: Optional[str]
         move_name = clean_text(cells[0].get_text())
         move_type = clean_text(cells[1].get_text()) if len(cells) > 1 else ''
         
+        # Some pages (Deoxys, Exeggutor) continue the table with a stats block laid out
+        # like move rows: "Base Stats - Total: 600", then "Lv. 100" ranges
+        if move_name.startswith('Base Stats'):
+            break
+        
         if move_name:
             # Check for game designations in move name
             games_for_move = extract_game_designations(move_name)
@@ -823,6 +778,10 @@ def main():
     output_dir = DATA_DIR / "pokemon_moves"
     output_dir.mkdir(exist_ok=True)
     
+    # Each file is written (atomically) as soon as its page is parsed, so an interrupted
+    # run keeps everything fetched so far
+    writer = AssetWriter()
+    
     successful_count = 0
     failed = []  # Track Pokemon that failed (404 or no data found)
     errors = []  # Track Pokemon with errors during processing
@@ -845,8 +804,7 @@ def main():
                 
                 # Save to individual file
                 output_file = output_dir / f"{base_name}.json"
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(output_data, f, indent=2, ensure_ascii=False)
+                writer.write_json(output_file, output_data)
                 
                 successful_count += 1
                 print(f"  ✓ Saved: {', '.join(moves.keys())}")
@@ -889,6 +847,8 @@ def main():
             })
             print(f"  ✗ Error: {e}")
     
+    writer.print_summary("pokemon_moves files")
+    
     # Save failures to a file for later fixing
     if failed or errors:
         failures_file = DATA_DIR / "pokemon_moves_failures.json"
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+Entity-level patches between two snapshots of assets/data.
+
+A data refresh used to mean shipping every changed JSON file whole. `diff`
+compares two snapshot directories entity by entity (Pokémon form, move,
+ability, one game's learnset for one form, ...) and writes a compact, ordered
+patch; `apply` replays it on the old snapshot and verifies every file it
+touches against SHA-256 checksums recorded for both sides.
+
+Granularity:
+- pokemon_moves/<Pokemon>.json : form -> generation -> game (one learnset per game)
+- other JSON objects : top-level key (move, ability, nature, index entry, ...)
+- JSON lists of objects with unique "name" (pokemon.json) : one entity per name
+- anything else (or a file whose formatting cannot be reproduced) : whole file
+
+Patch (JSON, gzip-compressed when the name ends in .gz):
+    {
+      "version": 1,
+      "files": {"<rel path>": {"base": sha256 | null, "target": sha256 | null}},
+      "ops": [
+        {"op": "put_file", "file": f, "data": "<base64>"},
+        {"op": "delete_file", "file": f},
+        {"op": "format", "file": f, "indent": 2, "ascii": false, "newline": false, "shape": "object"},
+        {"op": "set", "file": f, "path": [...], "value": ...},
+        {"op": "del", "file": f, "path": [...]},
+        {"op": "order", "file": f, "path": [...], "keys": [...]}
+      ]
+    }
+Paths address entities; for "named_list" files the first path element is the
+entry name. "format" precedes the entity ops of each file and says how to
+re-encode it; "order" restores key order where additions or a new
+order would otherwise change the bytes.
+
+Run:
+    python scripts/dataset_patch.py diff OLD_DIR NEW_DIR -o update.patch.json.gz
+    python scripts/dataset_patch.py apply update.patch.json.gz BASE_DIR [--out NEW_DIR [--force]]
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import copy
+import fnmatch
+import gzip
+import hashlib
+import json
+import pathlib
+import shutil
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# Add scripts directory to path for relative imports
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+
+from asset_writer import AssetWriter
+from json_io import dumps, loads
+
+PATCH_VERSION = 1
+
+# (glob on the relative path, entity depth); first match wins
+ENTITY_DEPTHS: List[Tuple[str, int]] = [
+    ("pokemon_moves/*.json", 3),
+    ("*.json", 1),
+]
+
+Op = Dict[str, Any]
+
+
+class PatchError(Exception):
+    """Raised when a patch does not apply cleanly."""
+
+
+def sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def snapshot_files(root: pathlib.Path) -> Dict[str, pathlib.Path]:
+    return {p.relative_to(root).as_posix(): p for p in sorted(root.rglob("*"))
+            if p.is_file() and not p.name.startswith(".")}
+
+
+def entity_depth(rel_path: str) -> int:
+    for pattern, depth in ENTITY_DEPTHS:
+        if fnmatch.fnmatch(rel_path, pattern):
+            return depth
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# Encoding
+# ---------------------------------------------------------------------------
+
+FORMATS = [(2, False), (2, True), (4, False), (4, True), (None, False), (None, True)]
+
+
+def encode(doc: Any, fmt: Dict) -> bytes:
+    indent, ascii_only = fmt["indent"], fmt["ascii"]
+    if indent == 4:
+        raw = json.dumps(doc, indent=4, ensure_ascii=ascii_only).encode("utf-8")
+    else:
+        raw = dumps(doc, indent=indent, ensure_ascii=ascii_only)
+    return raw + b"\n" if fmt["newline"] else raw
+
+
+def detect_format(doc: Any, raw: bytes) -> Optional[Dict]:
+    """The encoder settings that reproduce raw from doc byte for byte, if any."""
+    newline = raw.endswith(b"\n")
+    for indent, ascii_only in FORMATS:
+        fmt = {"indent": indent, "ascii": ascii_only, "newline": newline}
+        if encode(doc, fmt) == raw:
+            return fmt
+    return None
+
+
+def to_entities(doc: Any) -> Tuple[str, Any]:
+    """(shape, dict view) used for diffing; lists of uniquely named objects become dicts."""
+    if isinstance(doc, dict):
+        return "object", doc
+    if isinstance(doc, list) and doc and all(isinstance(e, dict) and isinstance(e.get("name"), str) for e in doc):
+        by_name = {e["name"]: e for e in doc}
+        if len(by_name) == len(doc):
+            return "named_list", by_name
+    return "value", doc
+
+
+def from_entities(shape: str, view: Any) -> Any:
+    return list(view.values()) if shape == "named_list" else view
+
+
+# ---------------------------------------------------------------------------
+# Diff
+# ---------------------------------------------------------------------------
+
+def same(a: Any, b: Any) -> bool:
+    """Equal and encoded identically: unlike ==, dict key order counts at every level."""
+    if isinstance(a, dict) and isinstance(b, dict):
+        return list(a) == list(b) and all(same(v, b[k]) for k, v in a.items())
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(same(x, y) for x, y in zip(a, b))
+    return type(a) is type(b) and a == b
+
+
+def diff_node(base: Any, target: Any, file: str, path: List, depth: int, ops: List[Op]) -> None:
+    if depth == 0 or not isinstance(base, dict) or not isinstance(target, dict):
+        if not same(base, target):
+            ops.append({"op": "set", "file": file, "path": path, "value": target})
+        return
+    for key, value in target.items():
+        if key not in base:
+            ops.append({"op": "set", "file": file, "path": path + [key], "value": value})
+        elif not same(base[key], value):
+            diff_node(base[key], value, file, path + [key], depth - 1, ops)
+    for key in base:
+        if key not in target:
+            ops.append({"op": "del", "file": file, "path": path + [key]})
+    # Key order after the sets and deletes above: surviving base keys, then additions
+    applied_order = [k for k in base if k in target] + [k for k in target if k not in base]
+    if applied_order != list(target):
+        ops.append({"op": "order", "file": file, "path": path, "keys": list(target)})
+
+
+def diff_file(rel_path: str, base_raw: bytes, target_raw: bytes) -> List[Op]:
+    depth = entity_depth(rel_path)
+    put = [{"op": "put_file", "file": rel_path, "data": base64.b64encode(target_raw).decode("ascii")}]
+    if depth == 0:
+        return put
+    try:
+        base_doc, target_doc = loads(base_raw), loads(target_raw)
+    except ValueError:
+        return put
+    fmt = detect_format(target_doc, target_raw)
+    base_shape, base_view = to_entities(base_doc)
+    target_shape, target_view = to_entities(target_doc)
+    if fmt is None or target_shape == "value" or base_shape != target_shape:
+        return put
+    ops: List[Op] = []
+    diff_node(base_view, target_view, rel_path, [], depth, ops)
+    format_op = {"op": "format", "file": rel_path, "shape": target_shape, **fmt}
+    entity_ops = [format_op] + ops
+    # Replay the ops on the base (diff_node no longer needs it) and ship the file whole
+    # if they do not reproduce the target byte for byte
+    if encode(from_entities(target_shape, replay(base_view, ops)), fmt) != target_raw:
+        return put
+    # Fall back to shipping the file whole when that is smaller
+    if len(dumps(entity_ops, indent=None)) >= len(dumps(put, indent=None)):
+        return put
+    return entity_ops
+
+
+def diff_snapshots(old_dir: pathlib.Path, new_dir: pathlib.Path) -> Dict:
+    old_files, new_files = snapshot_files(old_dir), snapshot_files(new_dir)
+    files: Dict[str, Dict[str, Optional[str]]] = {}
+    ops: List[Op] = []
+    for rel_path in sorted(set(old_files) | set(new_files)):
+        old_raw = old_files[rel_path].read_bytes() if rel_path in old_files else None
+        new_raw = new_files[rel_path].read_bytes() if rel_path in new_files else None
+        if old_raw == new_raw:
+            continue
+        files[rel_path] = {"base": sha256(old_raw) if old_raw is not None else None,
+                           "target": sha256(new_raw) if new_raw is not None else None}
+        if new_raw is None:
+            ops.append({"op": "delete_file", "file": rel_path})
+        elif old_raw is None:
+            ops.append({"op": "put_file", "file": rel_path, "data": base64.b64encode(new_raw).decode("ascii")})
+        else:
+            ops.extend(diff_file(rel_path, old_raw, new_raw))
+    return {"version": PATCH_VERSION, "files": files, "ops": ops}
+
+
+# ---------------------------------------------------------------------------
+# Apply
+# ---------------------------------------------------------------------------
+
+def _parent(doc: Any, path: List) -> Any:
+    node = doc
+    for key in path[:-1]:
+        node = node[key]
+    return node
+
+
+def replay(view: Any, ops: List[Op]) -> Any:
+    """Apply one file's entity ops to its entity view in place; returns the (possibly replaced) view."""
+    for op in ops:
+        kind, path = op["op"], op["path"]
+        if kind == "set":
+            if not path:
+                view = copy.deepcopy(op["value"])
+            else:
+                _parent(view, path)[path[-1]] = op["value"]
+        elif kind == "del":
+            del _parent(view, path)[path[-1]]
+        elif kind == "order":
+            node = _parent(view, path + [None]) if path else view
+            reordered = {k: node[k] for k in op["keys"]}
+            node.clear()
+            node.update(reordered)
+        else:
+            raise PatchError(f"Unknown op: {kind}")
+    return view
+
+
+def apply_ops(base_dir: pathlib.Path, patch: Dict) -> Dict[str, Optional[bytes]]:
+    """Return {rel path: new bytes or None for deletion} for every file the patch touches."""
+    if patch.get("version") != PATCH_VERSION:
+        raise PatchError(f"Unsupported patch version: {patch.get('version')}")
+    for rel_path, sums in patch["files"].items():
+        path = base_dir / rel_path
+        actual = sha256(path.read_bytes()) if path.is_file() else None
+        if actual != sums["base"]:
+            raise PatchError(f"{rel_path}: base checksum mismatch (is this the right snapshot?)")
+
+    outputs: Dict[str, Optional[bytes]] = {}
+    docs: Dict[str, Tuple[Dict, Any]] = {}  # file -> (format op, entity view)
+    entity_ops: Dict[str, List[Op]] = {}
+    for op in patch["ops"]:
+        file, kind = op["file"], op["op"]
+        if kind == "put_file":
+            outputs[file] = base64.b64decode(op["data"])
+        elif kind == "delete_file":
+            outputs[file] = None
+        elif kind == "format":
+            shape, view = to_entities(loads((base_dir / file).read_bytes()))
+            if shape != op["shape"]:
+                raise PatchError(f"{file}: expected a {op['shape']} document, found {shape}")
+            docs[file] = (op, view)
+            entity_ops[file] = []
+        elif file not in docs:
+            raise PatchError(f"{file}: entity op before its format op")
+        else:
+            entity_ops[file].append(op)
+    for file, (fmt, view) in docs.items():
+        outputs[file] = encode(from_entities(fmt["shape"], replay(view, entity_ops[file])), fmt)
+
+    for rel_path, data in outputs.items():
+        expected = patch["files"][rel_path]["target"]
+        actual = sha256(data) if data is not None else None
+        if actual != expected:
+            raise PatchError(f"{rel_path}: result checksum mismatch")
+    return outputs
+
+
+def apply_patch(patch: Dict, base_dir: pathlib.Path, out_dir: Optional[pathlib.Path] = None,
+                force: bool = False) -> AssetWriter:
+    """Apply patch to base_dir, in place or into a copy at out_dir. Nothing is written unless every file verifies.
+
+    A non-empty out_dir is only replaced with force.
+    """
+    copy_to = out_dir if out_dir is not None and out_dir.resolve() != base_dir.resolve() else None
+    if copy_to is not None and copy_to.exists() and any(copy_to.iterdir()):
+        if not force:
+            raise PatchError(f"{copy_to} exists and is not empty (use --force to replace it)")
+        if base_dir.resolve().is_relative_to(copy_to.resolve()):
+            raise PatchError(f"{copy_to} contains {base_dir}; refusing to replace it")
+    outputs = apply_ops(base_dir, patch)
+    if copy_to is not None:
+        if copy_to.exists():
+            shutil.rmtree(copy_to)
+        shutil.copytree(base_dir, copy_to)
+        base_dir = copy_to
+    writer = AssetWriter()
+    for rel_path, data in outputs.items():
+        path = base_dir / rel_path
+        if data is None:
+            path.unlink()
+            writer.removed.append(path)
+        else:
+            writer.write_bytes(path, data)
+    return writer
+
+
+def read_patch(path: pathlib.Path) -> Dict:
+    raw = path.read_bytes()
+    return loads(gzip.decompress(raw) if path.suffix == ".gz" else raw)
+
+
+def write_patch(patch: Dict, path: pathlib.Path) -> int:
+    raw = dumps(patch, indent=None)
+    if path.suffix == ".gz":
+        raw = gzip.compress(raw, mtime=0)
+    path.write_bytes(raw)
+    return len(raw)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Entity-level patches between assets/data snapshots")
+    sub = parser.add_subparsers(dest="command", required=True)
+    diff_cmd = sub.add_parser("diff", help="Write a patch turning OLD_DIR into NEW_DIR")
+    diff_cmd.add_argument("old_dir", type=pathlib.Path)
+    diff_cmd.add_argument("new_dir", type=pathlib.Path)
+    diff_cmd.add_argument("-o", "--output", type=pathlib.Path, required=True, help="Patch file (.gz to compress)")
+    apply_cmd = sub.add_parser("apply", help="Apply a patch to BASE_DIR")
+    apply_cmd.add_argument("patch", type=pathlib.Path)
+    apply_cmd.add_argument("base_dir", type=pathlib.Path)
+    apply_cmd.add_argument("--out", type=pathlib.Path, help="Write the new snapshot here instead of in place")
+    apply_cmd.add_argument("--force", action="store_true", help="Replace --out if it exists and is not empty")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.command == "diff":
+        patch = diff_snapshots(args.old_dir, args.new_dir)
+        size = write_patch(patch, args.output)
+        changed_bytes = sum((args.new_dir / f).stat().st_size for f, s in patch["files"].items() if s["target"])
+        counts: Dict[str, int] = {}
+        for op in patch["ops"]:
+            counts[op["op"]] = counts.get(op["op"], 0) + 1
+        print(f"{len(patch['files'])} files changed ({changed_bytes / 1024:.0f} KB whole) -> "
+              f"{args.output} {size / 1024:.1f} KB in {time.perf_counter() - start:.2f}s")
+        print("  ops: " + ", ".join(f"{k} {v}" for k, v in sorted(counts.items())))
+    else:
+        try:
+            writer = apply_patch(read_patch(args.patch), args.base_dir, args.out, force=args.force)
+        except PatchError as e:
+            raise SystemExit(f"Patch failed: {e}")
+        writer.print_summary(f"applied {args.patch.name} ({time.perf_counter() - start:.2f}s), checksums verified")
+
+
+if __name__ == "__main__":
+    main()
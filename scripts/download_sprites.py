@@ -134,6 +134,10 @@ def main():
         sys.exit(1)
     with open(data_path, 'r', encoding='utf-8') as f:
         by_number = json.load(f)
+    # Index entries are positions in pokemon.json (older builds embedded full entries)
+    with open(os.path.join(ROOT, 'assets', 'data', 'pokemon.json'), 'r', encoding='utf-8') as f:
+        pokemon_list = json.load(f)
+    by_number = {k: [pokemon_list[e] if isinstance(e, int) else e for e in v] for k, v in by_number.items()}
 
     out_map = {}
     for n in range(5, 1026):
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Export the dataset to a single SQLite database for cross-entity queries.
+
+Loads pokemon.json, moves.json, abilities.json, type_chart.json, natures.json
+and the pokemon_moves learnset corpus into normalized tables, adds covering
+indexes for the common lookups and FTS5 tables over move and ability text, so
+tools can answer questions like "which Fire types learn Will-O-Wisp in Scarlet
+and Violet" with one query instead of loading and looping over the JSON.
+Pokémon names mangled by a cp1252 round-trip in pokemon.json ("Nidoranâ™€")
+are stored repaired, which is also how the learnset files spell them.
+
+Tables:
+- pokemon(id, number, name, base_name, variant, generation, hp .. speed, total, ...)
+- pokemon_types(pokemon_id, slot, type)
+- abilities(id, name, slug, url, effect)
+- pokemon_abilities(pokemon_id, ability_id, hidden)
+- moves(id, name, type, category, power, accuracy, pp, priority, ..., structured_effects)
+- games(id, name), learn_methods(id, name)
+- learnsets(base_name, form, pokemon_id, game_id, method_id, move_id, move_name, level, tm_id)
+- type_effectiveness(attacking, defending, multiplier)
+- natures(name, attack, defense, sp_atk, sp_def, speed)
+- moves_fts(name, effect, detailed_effect, in_depth_effect), abilities_fts(name, effect)
+
+Example:
+    SELECT DISTINCT p.name FROM learnsets l
+    JOIN moves m ON m.id = l.move_id JOIN games g ON g.id = l.game_id
+    JOIN pokemon p ON p.id = l.pokemon_id JOIN pokemon_types t ON t.pokemon_id = p.id
+    WHERE m.name = 'Will-O-Wisp' AND g.name = 'Scarlet and Violet' AND t.type = 'Fire';
+
+    SELECT name FROM moves_fts WHERE moves_fts MATCH 'sleep AND heal';
+
+Run:
+    python scripts/export_sqlite.py [--out data/championdex.sqlite] [--benchmark]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import pathlib
+import sqlite3
+import sys
+import time
+from typing import Dict, Optional
+
+# Add scripts directory to path for relative imports
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+
+from build_move_indexes import iter_learn_rows
+from championdex_data import ASSETS_DIR, LEARNSET_DIR, SCRAPE_DIR
+from json_io import dumps, load
+from learnset_loader import iter_learnsets
+from move_text import effect_text
+from pokemon_indexes import repair_mojibake
+
+DEFAULT_OUT = SCRAPE_DIR / "championdex.sqlite"
+
+STATS = ("hp", "attack", "defense", "sp_atk", "sp_def", "speed", "total")
+NATURE_STATS = ("attack", "defense", "sp_atk", "sp_def", "speed")
+
+SCHEMA = """
+CREATE TABLE pokemon (
+    id INTEGER PRIMARY KEY,            -- position in pokemon.json
+    number INTEGER NOT NULL,
+    name TEXT NOT NULL UNIQUE,
+    base_name TEXT NOT NULL,
+    variant TEXT,
+    generation INTEGER,
+    hp INTEGER, attack INTEGER, defense INTEGER, sp_atk INTEGER, sp_def INTEGER, speed INTEGER, total INTEGER,
+    classification TEXT,
+    capture_rate INTEGER,
+    height_metric TEXT,
+    weight_metric TEXT,
+    image TEXT,
+    image_large TEXT,
+    backdrop TEXT
+);
+CREATE TABLE pokemon_types (
+    pokemon_id INTEGER NOT NULL REFERENCES pokemon(id),
+    slot INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    PRIMARY KEY (pokemon_id, slot)
+) WITHOUT ROWID;
+CREATE TABLE abilities (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    slug TEXT,
+    url TEXT,
+    effect TEXT
+);
+CREATE TABLE pokemon_abilities (
+    pokemon_id INTEGER NOT NULL REFERENCES pokemon(id),
+    ability_id INTEGER NOT NULL REFERENCES abilities(id),
+    hidden INTEGER NOT NULL,
+    PRIMARY KEY (pokemon_id, ability_id, hidden)
+) WITHOUT ROWID;
+CREATE TABLE moves (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    type TEXT,
+    category TEXT,
+    power INTEGER,
+    accuracy INTEGER,
+    pp INTEGER,
+    priority INTEGER,
+    generation INTEGER,
+    makes_contact INTEGER,
+    targets TEXT,
+    effect TEXT,
+    detailed_effect TEXT,
+    in_depth_effect TEXT,
+    structured_effects TEXT            -- JSON array
+);
+CREATE TABLE games (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+CREATE TABLE learn_methods (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+CREATE TABLE learnsets (
+    base_name TEXT NOT NULL,
+    form TEXT NOT NULL,
+    pokemon_id INTEGER NOT NULL REFERENCES pokemon(id),
+    game_id INTEGER NOT NULL REFERENCES games(id),
+    method_id INTEGER NOT NULL REFERENCES learn_methods(id),
+    move_id INTEGER REFERENCES moves(id),        -- NULL when the move name is not in moves.json
+    move_name TEXT NOT NULL,
+    level TEXT,
+    tm_id TEXT
+);
+CREATE TABLE type_effectiveness (
+    attacking TEXT NOT NULL,
+    defending TEXT NOT NULL,
+    multiplier REAL NOT NULL,
+    PRIMARY KEY (attacking, defending)
+) WITHOUT ROWID;
+CREATE TABLE natures (
+    name TEXT PRIMARY KEY,
+    attack REAL, defense REAL, sp_atk REAL, sp_def REAL, speed REAL
+);
+CREATE VIRTUAL TABLE moves_fts USING fts5(
+    name, effect, detailed_effect, in_depth_effect,
+    content='moves', content_rowid='id', tokenize='porter unicode61 remove_diacritics 2'
+);
+CREATE VIRTUAL TABLE abilities_fts USING fts5(
+    name, effect,
+    content='abilities', content_rowid='id', tokenize='porter unicode61 remove_diacritics 2'
+);
+"""
+
+# Created after the bulk insert; each covers the columns its lookup reads
+INDEXES = """
+CREATE INDEX learnsets_by_move ON learnsets(move_id, game_id, method_id, pokemon_id, form, level);
+CREATE INDEX learnsets_by_pokemon ON learnsets(pokemon_id, game_id, method_id, move_id, level, tm_id);
+CREATE INDEX learnsets_by_base ON learnsets(base_name, form, game_id);
+CREATE INDEX pokemon_types_by_type ON pokemon_types(type, pokemon_id);
+CREATE INDEX pokemon_abilities_by_ability ON pokemon_abilities(ability_id, hidden, pokemon_id);
+CREATE INDEX pokemon_by_number ON pokemon(number, id);
+CREATE INDEX pokemon_by_base_name ON pokemon(base_name, id);
+CREATE INDEX moves_by_type ON moves(type, category, power, id);
+""" + "".join(f"CREATE INDEX pokemon_by_{stat} ON pokemon({stat}, id);\n" for stat in STATS)
+
+BENCHMARK_QUERIES = {
+    "learners of Will-O-Wisp in SV": """
+        SELECT DISTINCT l.form FROM learnsets l JOIN moves m ON m.id = l.move_id JOIN games g ON g.id = l.game_id
+        WHERE m.name = 'Will-O-Wisp' AND g.name = 'Scarlet and Violet'""",
+    "Fire types with speed >= 100": """
+        SELECT p.name FROM pokemon p JOIN pokemon_types t ON t.pokemon_id = p.id
+        WHERE t.type = 'Fire' AND p.speed >= 100""",
+    "Pokémon with Levitate": """
+        SELECT p.name FROM pokemon_abilities pa JOIN abilities a ON a.id = pa.ability_id
+        JOIN pokemon p ON p.id = pa.pokemon_id WHERE a.name = 'Levitate'""",
+    "move text search 'sleep heal'": "SELECT name FROM moves_fts WHERE moves_fts MATCH 'sleep AND heal'",
+    "ability text search 'weather'": "SELECT name FROM abilities_fts WHERE abilities_fts MATCH 'weather'",
+}
+
+
+def _as_int(value) -> Optional[int]:
+    return value if isinstance(value, int) and not isinstance(value, bool) else None
+
+
+def _insert(conn: sqlite3.Connection, table: str, row: tuple) -> None:
+    conn.execute(f"INSERT INTO {table} VALUES ({', '.join('?' * len(row))})", row)
+
+
+def _intern(conn: sqlite3.Connection, table: str, cache: Dict[str, int], name: str) -> int:
+    if name not in cache:
+        cache[name] = conn.execute(f"INSERT INTO {table}(name) VALUES (?)", (name,)).lastrowid
+    return cache[name]
+
+
+def export(out_path: pathlib.Path, assets_dir: pathlib.Path = ASSETS_DIR,
+           learnset_dir: pathlib.Path = LEARNSET_DIR) -> Dict[str, int]:
+    """Build the database at out_path (atomically replacing it). Returns row counts per table."""
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = out_path.with_name(f".{out_path.name}.tmp")
+    if tmp_path.exists():
+        tmp_path.unlink()
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript("PRAGMA journal_mode = OFF; PRAGMA synchronous = OFF;")
+        conn.executescript(SCHEMA)
+        with conn:
+            _load(conn, assets_dir, learnset_dir)
+            conn.executescript(INDEXES)
+            conn.execute("INSERT INTO moves_fts(moves_fts) VALUES ('rebuild')")
+            conn.execute("INSERT INTO abilities_fts(abilities_fts) VALUES ('rebuild')")
+        conn.execute("ANALYZE")
+        counts = {
+            table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for (table,) in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND sql NOT LIKE 'CREATE VIRTUAL%'"
+                " AND name NOT LIKE 'sqlite_%' AND name NOT LIKE '%_fts%' ORDER BY name")
+        }
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+    os.replace(tmp_path, out_path)
+    return counts
+
+
+def _load(conn: sqlite3.Connection, assets_dir: pathlib.Path, learnset_dir: pathlib.Path) -> None:
+    pokemon = load(assets_dir / "pokemon.json")
+    pokemon_ids: Dict[str, int] = {}
+    for i, p in enumerate(pokemon):
+        stats = p.get("stats") or {}
+        _insert(conn, "pokemon", (
+            i, p["number"], repair_mojibake(p["name"]), repair_mojibake(p["base_name"]), p.get("variant"),
+            p.get("generation"),
+            *(stats.get(stat) for stat in STATS),
+            p.get("classification"), _as_int(p.get("capture_rate")), p.get("height_metric"),
+            p.get("weight_metric"), p.get("image"), p.get("image_large"), p.get("backdrop"),
+        ))
+        conn.executemany("INSERT INTO pokemon_types VALUES (?, ?, ?)",
+                         [(i, slot, t) for slot, t in enumerate(p.get("types") or [])])
+        pokemon_ids[repair_mojibake(p["name"])] = i
+
+    abilities = load(assets_dir / "abilities.json")
+    ability_ids: Dict[str, int] = {}
+    for i, (name, ability) in enumerate(sorted(abilities.items())):
+        conn.execute("INSERT INTO abilities VALUES (?, ?, ?, ?, ?)",
+                     (i, name, ability.get("slug"), ability.get("url"), ability.get("effect")))
+        ability_ids[name] = i
+    pokemon_abilities = set()
+    for i, p in enumerate(pokemon):
+        for hidden, key in ((0, "regular"), (1, "hidden")):
+            for name in (p.get("abilities") or {}).get(key, []):
+                if name in ability_ids:
+                    pokemon_abilities.add((i, ability_ids[name], hidden))
+    conn.executemany("INSERT INTO pokemon_abilities VALUES (?, ?, ?)", sorted(pokemon_abilities))
+
+    moves = load(assets_dir / "moves.json")
+    move_ids: Dict[str, int] = {}
+    for i, (name, move) in enumerate(sorted(moves.items())):
+        structured = move.get("structuredEffects")
+        _insert(conn, "moves", (
+            i, name, move.get("type"), move.get("category"), _as_int(move.get("power")),
+            _as_int(move.get("accuracy")), _as_int(move.get("pp")), _as_int(move.get("priority")),
+            move.get("generation"), int(bool(move.get("makes_contact"))), move.get("targets"),
+            move.get("effect"), effect_text(move.get("detailed_effect")), effect_text(move.get("in_depth_effect")),
+            dumps(structured, indent=None).decode("utf-8") if structured is not None else None,
+        ))
+        move_ids[name] = i
+    move_ids_folded = {name.lower(): i for name, i in move_ids.items()}
+
+    chart = load(assets_dir / "type_chart.json")["typeChart"]
+    conn.executemany("INSERT INTO type_effectiveness VALUES (?, ?, ?)",
+                     [(atk, dfn, mult) for atk, row in chart.items() for dfn, mult in row.items()])
+
+    natures = load(assets_dir / "natures.json")
+    conn.executemany("INSERT INTO natures VALUES (?, ?, ?, ?, ?, ?)",
+                     [(name, *(mods.get(stat, 1) for stat in NATURE_STATS)) for name, mods in natures.items()])
+
+    game_ids: Dict[str, int] = {}
+    method_ids: Dict[str, int] = {}
+    unknown_forms: Dict[str, int] = {}
+    for base_name, data in iter_learnsets(learnset_dir):
+        rows = []
+        for move, game, method, form, level, tm_id in iter_learn_rows(data):
+            if form not in pokemon_ids:
+                unknown_forms[form] = unknown_forms.get(form, 0) + 1
+                continue
+            move_id = move_ids.get(move, move_ids_folded.get(move.lower()))
+            rows.append((base_name, form, pokemon_ids[form], _intern(conn, "games", game_ids, game),
+                         _intern(conn, "learn_methods", method_ids, method), move_id, move, level, tm_id))
+        conn.executemany("INSERT INTO learnsets VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+    if unknown_forms:
+        raise ValueError("Learnset forms not in pokemon.json: "
+                         + ", ".join(f"{form} ({count} rows)" for form, count in sorted(unknown_forms.items())))
+
+
+def benchmark(db_path: pathlib.Path, rounds: int = 20) -> None:
+    conn = sqlite3.connect(db_path)
+    try:
+        for label, sql in BENCHMARK_QUERIES.items():
+            start = time.perf_counter()
+            for _ in range(rounds):
+                rows = conn.execute(sql).fetchall()
+            elapsed = (time.perf_counter() - start) / rounds
+            print(f"  {label:32} {len(rows):5} rows  {elapsed * 1000:.2f} ms")
+    finally:
+        conn.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export the dataset to SQLite")
+    parser.add_argument("--out", type=pathlib.Path, default=DEFAULT_OUT, help="Database path")
+    parser.add_argument("--benchmark", action="store_true", help="Time a few sample queries after exporting")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    counts = export(args.out)
+    print(f"Wrote {args.out} ({args.out.stat().st_size / 1024 / 1024:.1f} MB) in {time.perf_counter() - start:.2f}s")
+    for table, count in counts.items():
+        print(f"  {table:20} {count:7} rows")
+    if args.benchmark:
+        benchmark(args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,18 @@
 import os
+import sys
 from pathlib import Path
-import json
 
-assets_dir = Path(__file__).parent.parent / "assets" / "images" / "pokemon"
-assets_large_dir = Path(__file__).parent.parent / "assets" / "images_large" / "pokemon"
-pokemon_json_file = Path(__file__).parent.parent / "assets" / "data" / "pokemon.json"
+# Add scripts directory to path for relative imports
+sys.path.insert(0, str(Path(__file__).parent))
 
-with open(pokemon_json_file, "r", encoding="utf-8") as f:
-    pokemon_data = json.load(f)
+from championdex_data import IMAGES_DIR, IMAGES_LARGE_DIR, load_copy
 
-image_assets = [item.name for item in assets_dir.iterdir() if item.is_file()]
+assets_dir = IMAGES_DIR
+assets_large_dir = IMAGES_LARGE_DIR
+
+
+def list_image_assets():
+    return [item.name for item in assets_dir.iterdir() if item.is_file()]
 
 def map_image_assets(pokemon_data, image_assets):
     for pokemon in pokemon_data:
@@ -34,7 +37,7 @@ def map_image_assets(pokemon_data, image_assets):
         else:
             print(f"Could not find image for {base_name} (variant: {variant})")
 
-def copy_image_to_large():
+def copy_image_to_large(pokemon_data):
     for p in pokemon_data:
         if "image" in p and "image_large" not in p:
             p["image_large"] = p["image"]
@@ -69,10 +72,11 @@ def fix_png_extensions():
             print(f'Fixed extension for {img_file.name} to .png')
     
 if __name__ == "__main__":
+    pokemon_data = load_copy("pokemon.json")  # Entries are edited in place below
     # rename_image_files(assets_dir)
     # fix_png_extensions()
-    # map_image_assets(pokemon_data, image_assets)
-    # copy_image_to_large()
+    # map_image_assets(pokemon_data, list_image_assets())
+    # copy_image_to_large(pokemon_data)
     list_missing = []
     list_missing_shiny = []
     list_missing_large = []
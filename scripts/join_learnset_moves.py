@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Join move type, category, power and accuracy onto the learnset move IDs.
+
+Learnset entries from the Serebii scrapers carry "type": "" and no category or
+power, so every learnset screen joined each row back to moves.json at runtime.
+This stage joins moves.json onto the move IDs of the learnset_ids.json registry
+(see build_compact_learnsets.py) once and writes the joined columns as a table
+parallel to them. Learnset spellings resolve to their ID through a hashed index
+that ignores case, punctuation and game-designation suffixes ("Baby-doll
+Eyes", "ScreechBDSP Only"); learnset names that match no move are reported.
+
+Output (assets/data/learnset_move_table.json):
+    {
+      "version": 2,
+      "types": ["Bug", ...],             # enum for the "type" column
+      "categories": ["Physical", ...],   # enum for the "category" column
+      "type": [11, ...],                 # one value per registry move ID, null if unmatched
+      "category": [0, ...],
+      "power": [null, 40, ...],
+      "accuracy": [100, ...],
+      "unmatched": [411, ...]            # IDs of moves since dropped from moves.json
+    }
+
+Usage:
+    from join_learnset_moves import LearnsetMoveTable
+
+    table = LearnsetMoveTable.load()
+    table.info("Baby-doll Eyes")    # {"name": "Baby-Doll Eyes", "type": "Fairy", ...}
+    table.annotate(entries)         # learnset entries with type/category/power/accuracy filled
+
+Run:
+    python scripts/join_learnset_moves.py [--report PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import sys
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+# Add scripts directory to path for relative imports
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+
+from asset_writer import AssetWriter
+from build_compact_learnsets import IdRegistry
+from build_move_indexes import learn_rows
+from championdex_data import ASSETS_DIR, LEARNSET_DIR
+from json_io import load
+from learnset_loader import load_learnsets
+from move_names import MoveNameIndex
+
+MOVES_JSON = ASSETS_DIR / "moves.json"
+OUT_FILE = ASSETS_DIR / "learnset_move_table.json"
+
+FORMAT_VERSION = 2
+JOINED_FIELDS = ("type", "category", "power", "accuracy")
+
+
+def build_table(move_names: List[str], moves: Dict[str, Dict]) -> Dict:
+    """Join moves.json fields onto move_names (registry order)."""
+    types = sorted({m["type"] for m in moves.values() if m.get("type")})
+    categories = sorted({m["category"] for m in moves.values() if m.get("category")})
+    type_ids = {t: i for i, t in enumerate(types)}
+    category_ids = {c: i for i, c in enumerate(categories)}
+
+    table: Dict[str, Any] = {"version": FORMAT_VERSION, "types": types, "categories": categories}
+    columns: Dict[str, List] = {field: [] for field in JOINED_FIELDS}
+    unmatched: List[int] = []
+    for move_id, name in enumerate(move_names):
+        move = moves.get(name, {})
+        if name not in moves:
+            unmatched.append(move_id)
+        columns["type"].append(type_ids.get(move.get("type")))
+        columns["category"].append(category_ids.get(move.get("category")))
+        columns["power"].append(move.get("power"))
+        columns["accuracy"].append(move.get("accuracy"))
+    table.update(columns)
+    table["unmatched"] = unmatched
+    return table
+
+
+class LearnsetMoveTable:
+    """Query API over learnset_move_table.json."""
+
+    def __init__(self, data: Dict, registry: Optional[IdRegistry] = None):
+        if data.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported learnset move table version: {data.get('version')}")
+        self.data = data
+        self.registry = registry or IdRegistry.load()
+        self.names = MoveNameIndex(self.registry.tables["moves"])
+        self.unmatched = set(data["unmatched"])
+
+    @classmethod
+    def load(cls, path: pathlib.Path = OUT_FILE) -> "LearnsetMoveTable":
+        return cls(load(path))
+
+    def info(self, move_name: str) -> Optional[Dict[str, Any]]:
+        """Canonical name and joined fields for a learnset move name; None if unknown or unmatched."""
+        name = self.names.lookup(move_name)
+        move_id = self.registry.index["moves"].get(name) if name is not None else None
+        if move_id is None or move_id in self.unmatched:
+            return None
+        type_id, category_id = self.data["type"][move_id], self.data["category"][move_id]
+        return {
+            "name": name,
+            "type": self.data["types"][type_id] if type_id is not None else None,
+            "category": self.data["categories"][category_id] if category_id is not None else None,
+            "power": self.data["power"][move_id],
+            "accuracy": self.data["accuracy"][move_id],
+        }
+
+    def annotate(self, entries: List[Dict]) -> List[Dict]:
+        """Copies of learnset entries with blank type and missing category/power/accuracy filled in."""
+        annotated = []
+        for entry in entries:
+            info = self.info(entry.get("name", ""))
+            entry = dict(entry)
+            if info is not None:
+                if not entry.get("type"):
+                    entry["type"] = info["type"]
+                for field in ("category", "power", "accuracy"):
+                    entry.setdefault(field, info[field])
+            annotated.append(entry)
+        return annotated
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Join moves.json fields onto learnset move IDs")
+    parser.add_argument("--report", type=pathlib.Path, help="Also write unmatched/renamed names as JSON")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    registry = IdRegistry.load()
+    rows = load_learnsets(LEARNSET_DIR, transform=learn_rows, strict=True)
+    row_counts = Counter(row[0] for file_rows in rows.values() for row in file_rows)
+    missing = sorted(set(load(MOVES_JSON)) - registry.index["moves"].keys())
+    if missing:
+        raise SystemExit(f"Not in learnset_ids.json (run build_compact_learnsets.py first): {', '.join(missing[:10])}")
+
+    move_names = registry.tables["moves"]
+    table = build_table(move_names, load(MOVES_JSON))
+    writer = AssetWriter()
+    writer.write_json(OUT_FILE, table, indent=None)
+
+    names = MoveNameIndex(move_names)
+    resolved = {name: names.lookup(name) for name in row_counts}
+    unmatched = {name: count for name, count in row_counts.items() if resolved[name] is None}
+    renamed = {name: match for name, match in resolved.items() if match not in (None, name)}
+    total_rows = sum(row_counts.values())
+    matched_rows = total_rows - sum(unmatched.values())
+    print(f"Joined {len(move_names) - len(table['unmatched'])}/{len(move_names)} registered moves "
+          f"({matched_rows}/{total_rows} learnset rows) in {time.perf_counter() - start:.2f}s")
+    print(f"  matched after normalization: {len(renamed)} "
+          f"({sum(row_counts[n] for n in renamed)} rows)")
+    for name, count in sorted(unmatched.items(), key=lambda item: (-item[1], item[0])):
+        print(f"  unmatched: {name!r} ({count} rows)")
+    if args.report:
+        writer.write_json(args.report, {"unmatched": unmatched, "renamed": renamed})
+    writer.print_summary("learnset move table")
+
+
+if __name__ == "__main__":
+    main()
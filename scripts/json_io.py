@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Shared JSON codec for reading and writing data assets.
+
+Uses orjson when it is installed and falls back to the stdlib json module
+otherwise. Both backends produce the same bytes as
+``json.dumps(obj, indent=2, ensure_ascii=False)`` (UTF-8, no trailing newline),
+so the output of a build does not depend on which backend is present. Options
+orjson cannot reproduce exactly (ensure_ascii, indents other than 2) always go
+through the stdlib encoder, as do documents containing floats that the two
+backends format differently (exponent notation, magnitudes below 1e-4) and
+sort_keys documents with non-string keys (orjson sorts 10 before 9, the stdlib
+sorts numbers numerically). NaN and Infinity are not valid JSON and are not
+supported.
+
+Usage:
+    from json_io import dump, dumps, load, JsonObjectWriter
+
+    data = load(path)
+    dump(data, path, sort_keys=True)
+
+    with JsonObjectWriter(path) as writer:   # stream a large top-level map
+        for key, value in items:
+            writer.write(key, value)
+
+Run (encoder benchmark and backend equivalence check over assets/data):
+    python scripts/json_io.py
+"""
+
+from __future__ import annotations
+
+import json
+import pathlib
+import re
+import time
+from typing import Any, BinaryIO, Dict, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+PathLike = Union[str, pathlib.Path]
+
+# orjson renders exponents as 1e16 / 1e-7 where the stdlib writes 1e+16 / 1e-07,
+# and small magnitudes as 0.00001 where the stdlib writes 1e-05. The pattern
+# starts with a literal so the scan stays cheap; hits inside strings only cost
+# a stdlib re-encode.
+_EXPONENT = re.compile(rb"e[-+0-9]")
+
+
+def _has_divergent_float(encoded: bytes) -> bool:
+    if b"0.0000" in encoded:
+        return True
+    for match in _EXPONENT.finditer(encoded):
+        if encoded[match.start() - 1:match.start()].isdigit():
+            return True
+    return False
+
+
+def _has_non_str_keys(obj: Any) -> bool:
+    if isinstance(obj, dict):
+        return any(not isinstance(k, str) or _has_non_str_keys(v) for k, v in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_str_keys(v) for v in obj)
+    return False
+
+
+def loads(raw: Union[bytes, str]) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    if isinstance(raw, bytes):
+        raw = raw.decode("utf-8")
+    return json.loads(raw)
+
+
+def load(path: PathLike) -> Any:
+    with open(path, "rb") as fh:
+        return loads(fh.read())
+
+
+def _stdlib_dumps(obj: Any, indent: Optional[int], sort_keys: bool, ensure_ascii: bool) -> bytes:
+    separators = (",", ":") if indent is None else None
+    return json.dumps(
+        obj, indent=indent, sort_keys=sort_keys, ensure_ascii=ensure_ascii, separators=separators
+    ).encode("utf-8")
+
+
+def dumps(obj: Any, indent: Optional[int] = 2, sort_keys: bool = False, ensure_ascii: bool = False) -> bytes:
+    """
+    Serialize to canonical UTF-8 JSON bytes.
+
+    indent=None produces compact output with no whitespace at all.
+    """
+    if (orjson is not None and not ensure_ascii and indent in (2, None)
+            and not (sort_keys and _has_non_str_keys(obj))):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            encoded = orjson.dumps(obj, option=option)
+        except (TypeError, orjson.JSONEncodeError):
+            encoded = None  # e.g. integers wider than 64 bits; the stdlib handles them
+        if encoded is not None and not _has_divergent_float(encoded):
+            return encoded
+    return _stdlib_dumps(obj, indent, sort_keys, ensure_ascii)
+
+
+def dump(obj: Any, path: PathLike, indent: Optional[int] = 2, sort_keys: bool = False,
+         ensure_ascii: bool = False) -> None:
+    with open(path, "wb") as fh:
+        fh.write(dumps(obj, indent=indent, sort_keys=sort_keys, ensure_ascii=ensure_ascii))
+
+
+class JsonObjectWriter:
+    """
+    Stream a top-level JSON object to disk one entry at a time.
+
+    The file is byte-identical to ``dump(dict(entries), path, indent=2)`` for the
+    same key order, but only one value is encoded and held in memory at a time.
+    Callers wanting sorted output must write keys in sorted order; sort_keys
+    only applies to the nested values.
+    """
+
+    def __init__(self, path: PathLike, sort_keys: bool = False):
+        self.path = pathlib.Path(path)
+        self.sort_keys = sort_keys
+        self._fh: Optional[BinaryIO] = None
+        self._count = 0
+
+    def __enter__(self) -> "JsonObjectWriter":
+        self._fh = open(self.path, "wb")
+        self._fh.write(b"{")
+        return self
+
+    def write(self, key: str, value: Any) -> None:
+        encoded_value = dumps(value, sort_keys=self.sort_keys).replace(b"\n", b"\n  ")
+        self._fh.write(b",\n  " if self._count else b"\n  ")
+        self._fh.write(dumps(str(key), indent=None))
+        self._fh.write(b": ")
+        self._fh.write(encoded_value)
+        self._count += 1
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._fh.write(b"\n}" if self._count else b"}")
+        self._fh.close()
+        self._fh = None
+
+
+def main() -> None:
+    """Compare backends on every top-level asset and report encode times."""
+    from championdex_data import ASSETS_DIR  # the package imports this module
+
+    if orjson is None:
+        print("orjson is not installed; only the stdlib encoder is available")
+    totals: Dict[str, float] = {"stdlib": 0.0, "json_io": 0.0}
+    mismatches = []
+    paths = sorted(ASSETS_DIR.glob("*.json"))
+    for path in paths:
+        data = load(path)
+        start = time.perf_counter()
+        expected = _stdlib_dumps(data, 2, False, False)
+        totals["stdlib"] += time.perf_counter() - start
+        start = time.perf_counter()
+        actual = dumps(data)
+        totals["json_io"] += time.perf_counter() - start
+        if actual != expected:
+            mismatches.append(path.name)
+    print(f"Encoded {len(paths)} assets: stdlib {totals['stdlib']:.3f}s, json_io {totals['json_io']:.3f}s")
+    if mismatches:
+        raise SystemExit(f"Backend output differs for: {', '.join(mismatches)}")
+    print("✓ Backends produce identical bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Parallel loader for the assets/data/pokemon_moves learnset corpus.
+
+Reads and decodes the ~1,000 learnset files with a process (or thread) pool,
+decoding through json_io (orjson when it is installed). Results are
+available either as a streaming iterator of (base_name, data) or as one merged
+dict keyed by base name. An optional transform runs inside the worker so
+callers that only need a projection of each file (e.g. flattened learn rows)
+avoid shipping the full decoded tree back to the parent process.
+
+Long-running callers (build_graph.py --watch) can call enable_cache() to keep
+decoded files in memory: later calls only re-read files whose mtime or size
+changed, so editing one learnset re-decodes one file instead of the corpus.
+
+Usage:
+    from learnset_loader import iter_learnsets, load_learnsets
+
+    for base_name, data in iter_learnsets():
+        ...
+    corpus = load_learnsets()
+
+Run (benchmark serial vs. pooled loading):
+    python scripts/learnset_loader.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import pathlib
+import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Add scripts directory to path for relative imports
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+
+from championdex_data import LEARNSET_DIR
+from json_io import loads, orjson
+
+Transform = Callable[[Dict], Any]
+
+CACHE_SERIAL_MAX = 32  # with the cache on, re-read up to this many changed files without a pool
+
+# (path, transform key) -> ((mtime_ns, size), decoded or transformed data); None until enable_cache()
+_cache: Optional[Dict[Tuple[str, Any], Tuple[Tuple[int, int], Any]]] = None
+
+
+def learnset_paths(src_dir: pathlib.Path = LEARNSET_DIR) -> List[pathlib.Path]:
+    return sorted(src_dir.glob("*.json"))
+
+
+def _load_one(path: str, transform: Optional[Transform]) -> Tuple[str, Any, Optional[str]]:
+    base_name = os.path.basename(path)[:-5]
+    try:
+        with open(path, "rb") as fh:
+            data = loads(fh.read())
+        if transform is not None:
+            data = transform(data)
+    except Exception as e:
+        return base_name, None, str(e)
+    return base_name, data, None
+
+
+def enable_cache() -> None:
+    """Keep decoded files between calls. Cached results are shared, so callers must not mutate them."""
+    global _cache
+    if _cache is None:
+        _cache = {}
+
+
+def _transform_key(transform: Optional[Transform]) -> Any:
+    # Stage scripts are re-executed on every watch rebuild, which makes their transforms new
+    # function objects each time; key them by where they are defined instead.
+    code = getattr(transform, "__code__", None)
+    return transform if code is None else (code.co_filename, transform.__qualname__)
+
+
+def _make_executor(workers: Optional[int], threads: bool) -> Executor:
+    if threads:
+        return ThreadPoolExecutor(max_workers=workers)
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def iter_learnsets(
+    src_dir: pathlib.Path = LEARNSET_DIR,
+    transform: Optional[Transform] = None,
+    workers: Optional[int] = None,
+    threads: Optional[bool] = None,
+    strict: bool = False,
+) -> Iterator[Tuple[str, Any]]:
+    """
+    Yield (base_name, data) for every learnset file, in base-name order.
+
+    Args:
+        src_dir: Directory of <base_name>.json learnset files
+        transform: Top-level (picklable) function applied to each decoded file in the worker
+        workers: Pool size (default: CPU count)
+        threads: Use a thread pool instead of a process pool. Defaults to a process
+            pool when a transform is given (decode and transform run in parallel and
+            only the projection is pickled back) and to threads otherwise
+        strict: Raise on unreadable files instead of reporting and skipping them
+    """
+    paths = [str(p) for p in learnset_paths(src_dir)]
+    if not paths:
+        return
+    if threads is None:
+        threads = transform is None
+    if _cache is not None:
+        yield from _iter_cached(paths, transform, workers, threads, strict)
+        return
+    with _make_executor(workers, threads) as pool:
+        results = pool.map(_load_one, paths, [transform] * len(paths), chunksize=1 if threads else 32)
+        for base_name, data, error in results:
+            if _usable(base_name, error, strict):
+                yield base_name, data
+
+
+def _usable(base_name: str, error: Optional[str], strict: bool) -> bool:
+    if error is None:
+        return True
+    if strict:
+        raise ValueError(f"Failed to load {base_name}.json: {error}")
+    print(f"Skipping {base_name}.json: failed to load JSON: {error}")
+    return False
+
+
+def _iter_cached(paths: List[str], transform: Optional[Transform], workers: Optional[int],
+                 threads: bool, strict: bool) -> Iterator[Tuple[str, Any]]:
+    tag = _transform_key(transform)
+    stamps = {}
+    stale = []
+    for path in paths:
+        st = os.stat(path)
+        stamps[path] = (st.st_mtime_ns, st.st_size)
+        entry = _cache.get((path, tag))
+        if entry is None or entry[0] != stamps[path]:
+            stale.append(path)
+    if len(stale) > CACHE_SERIAL_MAX:
+        with _make_executor(workers, threads) as pool:
+            fresh = list(pool.map(_load_one, stale, [transform] * len(stale), chunksize=1 if threads else 32))
+    else:
+        fresh = [_load_one(path, transform) for path in stale]
+    errors = {}
+    for path, (base_name, data, error) in zip(stale, fresh):
+        if error is None:
+            _cache[(path, tag)] = (stamps[path], data)
+        else:
+            _cache.pop((path, tag), None)
+            errors[path] = error
+    for path in paths:
+        base_name = os.path.basename(path)[:-5]
+        if _usable(base_name, errors.get(path), strict):
+            yield base_name, _cache[(path, tag)][1]
+
+
+def load_learnsets(
+    src_dir: pathlib.Path = LEARNSET_DIR,
+    transform: Optional[Transform] = None,
+    workers: Optional[int] = None,
+    threads: Optional[bool] = None,
+    strict: bool = False,
+) -> Dict[str, Any]:
+    """Load the whole corpus into one dict keyed by base name."""
+    return dict(iter_learnsets(src_dir, transform, workers, threads, strict))
+
+
+def _load_serial(src_dir: pathlib.Path) -> Dict[str, Any]:
+    corpus = {}
+    for path in learnset_paths(src_dir):
+        with open(path, "r", encoding="utf-8") as fh:
+            corpus[path.stem] = json.load(fh)
+    return corpus
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark learnset corpus loading")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    timings: Dict[str, float] = {}
+    start = time.perf_counter()
+    serial = _load_serial(LEARNSET_DIR)
+    timings["serial json.load"] = time.perf_counter() - start
+
+    for label, threads in (("thread pool", True), ("process pool", False)):
+        start = time.perf_counter()
+        corpus = load_learnsets(workers=args.workers, threads=threads)
+        timings[label] = time.perf_counter() - start
+        if corpus != serial:
+            raise SystemExit(f"{label} result differs from serial load")
+
+    codec = "orjson" if orjson is not None else "json"
+    print(f"Loaded {len(serial)} learnset files (codec: {codec})")
+    for label, seconds in timings.items():
+        print(f"  {label:18} {seconds:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Split the pokemon_moves learnsets into per-game shards.
+
+Each pokemon_moves/<base>.json bundles every generation and game (SWSH, BDSP,
+PLA, SV, Legends: Z-A) although a session almost always looks at one game.
+This stage writes one shard per (game, base Pokémon) holding only that game,
+plus a manifest saying which shards exist, so a lookup decodes a fraction of
+the bytes. The combined files stay the source of truth; --merge rebuilds them
+from the shards when only the sharded layout is at hand.
+
+A shard keeps the source shape, restricted to one game:
+    {"<form>": {"gen_9": {"Scarlet and Violet": {...methods...}}, "url_gen9": "...", ...}}
+Forms without data for the game are left out. Values that are not per-game
+learnset data (URLs, forms without any game, malformed entries such as the
+unwrapped Flabébé file) are copied into every shard of their base, so merging
+a base's shards restores its combined file exactly.
+
+Outputs (assets/data/pokemon_moves_by_game/):
+- <game dir>/<base>.json : compact JSON shard
+- manifest.json :
+    {
+      "version": 1,
+      "games": [{"name": "Scarlet and Violet", "dir": "scarlet_and_violet",
+                 "files": 700, "bytes": 1234567}, ...],
+      "pokemon": {"Bulbasaur": [0, 3, 4], ...},    # indexes into "games"
+      "unsharded": [...]                            # bases with no per-game data
+    }
+
+Usage:
+    from learnset_shards import load_game_learnset
+
+    load_game_learnset("Garchomp", "Scarlet and Violet")
+
+Run:
+    python scripts/learnset_shards.py [--verify] [--merge OUT_DIR]
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import pathlib
+import re
+import sys
+import time
+import unicodedata
+from typing import Any, Dict, List, Optional, Tuple
+
+# Add scripts directory to path for relative imports
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+
+from asset_writer import AssetWriter
+from championdex_data import ASSETS_DIR, LEARNSET_DIR, ROOT
+from json_io import dumps, load
+from learnset_loader import load_learnsets
+
+SHARD_DIR = ASSETS_DIR / "pokemon_moves_by_game"
+MANIFEST_NAME = "manifest.json"
+
+FORMAT_VERSION = 1
+
+
+def game_dir(game: str) -> str:
+    """Directory name for a game ("Pokémon Legends: Arceus" -> "pokemon_legends_arceus")."""
+    folded = unicodedata.normalize("NFKD", game).encode("ascii", "ignore").decode("ascii")
+    return re.sub(r"[^a-z0-9]+", "_", folded.lower()).strip("_")
+
+
+def _is_game_map(value: Any) -> bool:
+    """True for a generation value: game -> method -> [entries]."""
+    return (isinstance(value, dict) and bool(value)
+            and all(isinstance(g, dict) and all(isinstance(e, list) for e in g.values())
+                    for g in value.values()))
+
+
+def _is_form(value: Any) -> bool:
+    return isinstance(value, dict) and any(_is_game_map(v) for v in value.values())
+
+
+def games_in(data: Dict) -> List[str]:
+    """Games with learnset data in a combined file, in first-seen order."""
+    games: Dict[str, None] = {}
+    for value in data.values():
+        gen_values = [value] if _is_game_map(value) else value.values() if _is_form(value) else ()
+        for gen_value in gen_values:
+            if _is_game_map(gen_value):
+                games.update(dict.fromkeys(gen_value))
+    return list(games)
+
+
+def project(node: Dict, game: str, depth: int = 0) -> Optional[Dict]:
+    """The part of a combined file (depth 0) or form (depth 1) that a game's shard holds."""
+    out: Dict[str, Any] = {}
+    found = False
+    for key, value in node.items():
+        if _is_game_map(value):
+            if game in value:
+                out[key] = {game: value[game]}
+                found = True
+        elif depth == 0 and _is_form(value):
+            form = project(value, game, 1)
+            if form is not None:
+                out[key] = form
+                found = True
+        else:
+            out[key] = value
+    return out if found else None
+
+
+def merge(target: Dict, shard: Dict) -> Dict:
+    """Deep-merge a shard into a combined file being rebuilt."""
+    for key, value in shard.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            merge(target[key], value)
+        else:
+            target[key] = value
+    return target
+
+
+def split_corpus(corpus: Dict[str, Dict]) -> Tuple[Dict[str, Dict[str, Dict]], List[str]]:
+    """(shards {game: {base: shard}}, unsharded bases)."""
+    shards: Dict[str, Dict[str, Dict]] = {}
+    unsharded = []
+    for base_name in sorted(corpus):
+        data = corpus[base_name]
+        games = games_in(data) if isinstance(data, dict) else []
+        if not games:
+            unsharded.append(base_name)
+        for game in games:
+            shards.setdefault(game, {})[base_name] = project(data, game)
+    return shards, unsharded
+
+
+def write_shards(shards: Dict[str, Dict[str, Dict]], unsharded: List[str], out_dir: pathlib.Path,
+                 writer: AssetWriter) -> Dict:
+    games = sorted(shards)
+    manifest: Dict[str, Any] = {"version": FORMAT_VERSION, "games": [], "pokemon": {}, "unsharded": unsharded}
+    for game_id, game in enumerate(games):
+        directory = out_dir / game_dir(game)
+        total = 0
+        for base_name, shard in shards[game].items():
+            payload = dumps(shard, indent=None)
+            writer.write_bytes(directory / f"{base_name}.json", payload)
+            total += len(payload)
+            manifest["pokemon"].setdefault(base_name, []).append(game_id)
+        writer.remove_stale(directory, "*.json")
+        manifest["games"].append({"name": game, "dir": game_dir(game), "files": len(shards[game]), "bytes": total})
+    manifest["pokemon"] = dict(sorted(manifest["pokemon"].items()))
+    writer.write_json(out_dir / MANIFEST_NAME, manifest, indent=None)
+    return manifest
+
+
+@functools.lru_cache(maxsize=4)
+def _manifest(shard_dir: pathlib.Path, mtime_ns: int) -> Dict:
+    return load(shard_dir / MANIFEST_NAME)
+
+
+def load_manifest(shard_dir: pathlib.Path = SHARD_DIR) -> Optional[Dict]:
+    path = shard_dir / MANIFEST_NAME
+    if not path.exists():
+        return None
+    return _manifest(shard_dir, path.stat().st_mtime_ns)
+
+
+def load_game_learnset(base_name: str, game: str, shard_dir: pathlib.Path = SHARD_DIR,
+                       combined_dir: pathlib.Path = LEARNSET_DIR) -> Dict:
+    """One game's learnset for a base Pokémon: its shard, or a projection of the combined file.
+
+    Returns {} when the base has no data for the game.
+    """
+    manifest = load_manifest(shard_dir)
+    if manifest is not None and base_name not in manifest["unsharded"]:
+        game_names = [g["name"] for g in manifest["games"]]
+        if game not in game_names or game_names.index(game) not in manifest["pokemon"].get(base_name, []):
+            return {}
+        return load(shard_dir / game_dir(game) / f"{base_name}.json")
+    # No shards built (or nothing to split): fall back to the combined layout
+    path = combined_dir / f"{base_name}.json"
+    data = load(path) if path.exists() else {}
+    return (project(data, game) if isinstance(data, dict) else None) or {}
+
+
+def merge_shards(base_name: str, shard_dir: pathlib.Path = SHARD_DIR) -> Dict:
+    """Rebuild a base's combined file from its shards."""
+    manifest = load_manifest(shard_dir)
+    if manifest is None:
+        raise FileNotFoundError(f"No {MANIFEST_NAME} in {shard_dir}")
+    combined: Dict = {}
+    for game_id in manifest["pokemon"].get(base_name, []):
+        merge(combined, load(shard_dir / manifest["games"][game_id]["dir"] / f"{base_name}.json"))
+    return combined
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Split pokemon_moves learnsets into per-game shards")
+    parser.add_argument("--out", type=pathlib.Path, default=SHARD_DIR, help="Shard directory")
+    parser.add_argument("--verify", action="store_true", help="Merge every base's shards and compare with its source")
+    parser.add_argument("--merge", type=pathlib.Path, metavar="OUT_DIR",
+                        help="Instead of splitting, rebuild combined <base>.json files from the shards into OUT_DIR")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    writer = AssetWriter()
+    if args.merge:
+        manifest = load_manifest(args.out)
+        if manifest is None:
+            raise SystemExit(f"No {MANIFEST_NAME} in {args.out}; build the shards first")
+        for base_name in manifest["pokemon"]:
+            writer.write_json(args.merge / f"{base_name}.json", merge_shards(base_name, args.out))
+        writer.print_summary("combined learnset files")
+        if manifest["unsharded"]:
+            print(f"Not in the shards (copy from {LEARNSET_DIR.relative_to(ROOT)}): {', '.join(manifest['unsharded'])}")
+        return
+
+    corpus = load_learnsets(LEARNSET_DIR, strict=True)
+    shards, unsharded = split_corpus(corpus)
+    manifest = write_shards(shards, unsharded, args.out, writer)
+
+    if args.verify:
+        for base_name, data in corpus.items():
+            if base_name not in unsharded and merge_shards(base_name, args.out) != data:
+                raise SystemExit(f"Merged shards differ from {base_name}.json")
+        print(f"✓ Merged shards match all {len(corpus) - len(unsharded)} sharded learnsets")
+
+    source_bytes = sum(p.stat().st_size for p in LEARNSET_DIR.glob("*.json"))
+    print(f"Split {len(corpus)} learnsets into {sum(g['files'] for g in manifest['games'])} shards "
+          f"over {len(manifest['games'])} games in {time.perf_counter() - start:.2f}s")
+    for game in manifest["games"]:
+        print(f"  {game['name']:38} {game['files']:5} files {game['bytes'] / 1024 / 1024:6.2f} MB "
+              f"(avg {game['bytes'] / max(game['files'], 1) / 1024:.1f} KB)")
+    print(f"  combined pokemon_moves: {source_bytes / 1024 / 1024:.2f} MB "
+          f"(avg {source_bytes / max(len(corpus), 1) / 1024:.1f} KB)")
+    writer.print_summary("learnset shards")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,16 @@
 import os
+import sys
 from pathlib import Path
-import json
 
+# Add scripts directory to path for relative imports
+sys.path.insert(0, str(Path(__file__).parent))
 
-pokemon_asset = Path(__file__).parent.parent / "assets" / "data" / "pokemon.json"
-pokemon_data_file = Path(__file__).parent.parent / "data" / "pokemon.json"
+from asset_writer import write_json
+from championdex_data import ASSETS_DIR, load_copy, scraped
+
+
+# Fields move from the scraper's data/pokemon.json into the shipped assets/data/pokemon.json
+pokemon_asset = ASSETS_DIR / "pokemon.json"
 
 fields_to_migrate = [
     # "image",
@@ -21,29 +27,32 @@ fields_to_migrate = [
     # "gender_ratio"
 ]
 
-with open(pokemon_asset, "r", encoding="utf-8") as f:
-    pokemon_asset_data = json.load(f)
 
-with open(pokemon_data_file, "r", encoding="utf-8") as f:
-    pokemon_data = json.load(f)
+def main():
+    pokemon_asset_data = load_copy(pokemon_asset.name)
+    pokemon_data = scraped("pokemon.json")
+
+    # Create a mapping from pokemon name to its asset data
+    asset_data_map = {p["name"]: p for p in pokemon_asset_data}
 
-# Create a mapping from pokemon name to its asset data
-asset_data_map = {p["name"]: p for p in pokemon_asset_data}
+    # Migrate fields from pokemon.json in data folder to assets data
+    for pokemon in pokemon_data:
+        name = pokemon["name"]
+        asset_data = asset_data_map.get(name)
+        if not asset_data:
+            print(f"WARNING: No asset data found for {name}")
+            continue
 
-# Migrate fields from pokemon.json in data folder to assets data
-for pokemon in pokemon_data:
-    name = pokemon["name"]
-    asset_data = asset_data_map.get(name)
-    if not asset_data:
-        print(f"WARNING: No asset data found for {name}")
-        continue
+        for field in fields_to_migrate:
+            if field in pokemon:
+                asset_data[field] = pokemon.get(field)
 
-    for field in fields_to_migrate:
-        if field in pokemon:
-            asset_data[field] = pokemon.get(field)
+    # Save the updated asset data back to the file
+    if write_json(pokemon_asset, pokemon_asset_data, ensure_ascii=True):
+        print(f"✅ Successfully migrated fields to {pokemon_asset}")
+    else:
+        print(f"✅ {pokemon_asset} already up to date")
 
 
-# Save the updated asset data back to the file
-with open(pokemon_asset, "w", encoding="utf-8") as f:
-    json.dump(pokemon_asset_data, f, indent=2, ensure_ascii=False)
-    print(f"✅ Successfully migrated fields to {pokemon_asset}")
+if __name__ == "__main__":
+    main()
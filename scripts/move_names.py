@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Move name helpers shared by the Serebii scrapers and the build stages.
+
+Serebii appends game designations to some move names ("ScreechBDSP Only") and
+capitalizes hyphenated names inconsistently ("Baby-doll Eyes", "X-scissor").
+normalize_move_name() folds all of that into one hash key, and MoveNameIndex
+maps any such spelling back to the canonical moves.json name.
+
+Usage:
+    from move_names import MoveNameIndex
+
+    index = MoveNameIndex(moves)          # moves.json dict
+    index.lookup("Water PulseSWSH Only")  # "Water Pulse"
+"""
+
+import re
+import unicodedata
+from typing import Dict, Iterable, List, Optional
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def extract_game_designations(move_name: str) -> List[str]:
+    """
+    Extract game designations from a move name.
+    
+    Examples:
+    - "ScreechBDSP Only" -> ["Brilliant Diamond and Shining Pearl"]
+    - "Water PulseSWSH Only" -> ["Sword and Shield"]
+    
+    Returns:
+        List of game names this move applies to
+    """
+    games = []
+    move_lower = move_name.lower()
+    
+    # Check for specific game designations
+    if 'swsh only' in move_lower or 'sword & shield only' in move_lower:
+        games.append('Sword and Shield')
+    if 'bdsp only' in move_lower or 'brilliant diamond shining pearl only' in move_lower:
+        games.append('Brilliant Diamond and Shining Pearl')
+    if 'legends' in move_lower and 'z-a' in move_lower:
+        games.append('Legends: Z-A')
+    if ('scarlet' in move_lower or 'violet' in move_lower) and 'only' in move_lower:
+        games.append('Scarlet and Violet')
+    
+    return games
+
+
+def remove_game_designations(move_name: str) -> str:
+    """
+    Remove game designations from a move name.
+    
+    Examples:
+    - "ScreechBDSP Only" -> "Screech"
+    - "Water PulseSWSH Only" -> "Water Pulse"
+    
+    Returns:
+        Clean move name without game designation
+    """
+    # Remove common game designation patterns
+    patterns = [
+        r'\s*BDSP\s+Only\s*$',
+        r'\s*SWSH\s+Only\s*$',
+        r'\s*Sword\s+&\s+Shield\s+Only\s*$',
+        r'\s*Brilliant\s+Diamond.*?Shining\s+Pearl\s+Only\s*$',
+        r'\s*Isle\s+of\s+Armou?r\s+Only\s*$',
+        r'\s*Crown\s+Tundra\s+Only\s*$',
+        r'\s*Legends:\s+Z-A\s+Only\s*$',
+        r'\s*Scarlet\s+&\s+Violet\s+Only\s*$',
+    ]
+    
+    clean_name = move_name
+    for pattern in patterns:
+        clean_name = re.sub(pattern, '', clean_name, flags=re.IGNORECASE)
+    
+    return clean_name.strip()
+
+
+def normalize_move_name(move_name: str) -> str:
+    """Hash key for a move name: no game designation, accents, case, spaces or punctuation."""
+    decomposed = unicodedata.normalize("NFKD", remove_game_designations(move_name))
+    folded = "".join(c for c in decomposed if not unicodedata.combining(c)).lower()
+    return _NON_ALNUM.sub("", folded)
+
+
+class MoveNameIndex:
+    """Canonical move names keyed by normalize_move_name()."""
+
+    def __init__(self, names: Iterable[str]):
+        self.canonical: Dict[str, str] = {}
+        self.collisions: Dict[str, List[str]] = {}
+        for name in names:
+            key = normalize_move_name(name)
+            if key in self.canonical and self.canonical[key] != name:
+                self.collisions.setdefault(key, [self.canonical[key]]).append(name)
+                continue
+            self.canonical[key] = name
+
+    def lookup(self, move_name: str) -> Optional[str]:
+        return self.canonical.get(normalize_move_name(move_name))
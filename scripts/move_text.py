@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Text helpers shared by the stages that read move and ability descriptions.
+
+Most effect fields in moves.json and abilities.json are plain strings, but a
+few in_depth_effect values are {"text": ..., <tables>} objects scraped from
+Serebii. effect_text() returns the prose of either form, so export_sqlite.py
+and build_text_index.py store and index the same text.
+
+Usage:
+    from move_text import effect_text
+
+    effect_text(move.get("in_depth_effect"))   # str or None
+"""
+
+from typing import Optional
+
+
+def effect_text(value) -> Optional[str]:
+    """Prose of an effect field; a few in_depth_effect values are {"text": ..., <tables>} objects."""
+    if isinstance(value, dict):
+        value = value.get("text")
+    return value if isinstance(value, str) else None
@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+"""
+Single-load transform pipeline for assets/data/moves.json.
+
+Replaces merge_enhanced_moves.py, normalize_stat_change_effects.py,
+post_normalize_moves.py and replace_newlines_in_detailed_effects.py, which each
+loaded, mutated, backed up and rewrote the whole file. moves.json is now
+loaded once, every registered pass runs over it in order and the result is
+written once (only if something changed), followed by one diff report.
+
+A pass is a function (move_name, move, context) -> {field: new_value}. It must
+not mutate the move; the runner applies the returned updates, and a field is
+marked dirty for that pass only if the new value differs from the current one.
+Returning DELETE removes a field. No pass re-serializes moves to detect changes.
+A pass raises PassFailure when it cannot produce a move's value; the move is
+left as it is and reported, and with --timeout-on-fail the pass stops there
+(later passes still run). --names limits every pass to the given moves.
+
+Passes (in order):
+- merge_enhanced: fields from data/moves_enhanced.json (Serebii)
+- fetch_detailed_effects: detailed_effect from pokemondb.net (network; --fetch only). Fetched text
+  is checkpointed to data/detailed_effects_checkpoint.json every 25 moves and when the run stops, so
+  an interrupted or failed run resumes where it left off; the checkpoint is removed once a complete
+  fetch has been written to moves.json
+- normalize_detailed_effect: punctuation/fraction spacing, glossary removal, per paragraph
+- paragraph_breaks: detailed_effect paragraphs separated by a blank line
+- normalize_stat_changes: StatChangeEffect probability default and canonical 'stats' map
+
+Run:
+    python scripts/moves_pipeline.py [--dry-run] [--fetch] [--only PASS ...] [--report report.json]
+    python scripts/moves_pipeline.py --fetch --names "Thunderbolt,U-turn" --timeout-on-fail
+    python scripts/moves_pipeline.py --list
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import pathlib
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set
+
+# Add scripts directory to path for relative imports
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+
+from asset_writer import write_json
+from championdex_data import ASSETS_DIR, SCRAPE_DIR
+from json_io import dump, load
+from snapshot_store import SnapshotStore
+
+MOVES_JSON = ASSETS_DIR / "moves.json"
+ENHANCED_JSON = SCRAPE_DIR / "moves_enhanced.json"
+FETCH_CHECKPOINT = SCRAPE_DIR / "detailed_effects_checkpoint.json"
+
+DELETE = object()
+
+Updates = Dict[str, Any]
+PassFn = Callable[[str, Dict, Dict], Updates]
+
+
+class PassFailure(Exception):
+    """A pass could not produce a value for one move (e.g. a failed fetch)."""
+
+
+@dataclass(frozen=True)
+class Pass:
+    name: str
+    apply: PassFn
+    description: str
+    fetch: bool = False  # Hits the network; only runs with --fetch
+
+
+PASSES: List[Pass] = []
+
+
+def move_pass(name: str, description: str, fetch: bool = False) -> Callable[[PassFn], PassFn]:
+    """Register a pass; passes run in registration order."""
+    def register(fn: PassFn) -> PassFn:
+        PASSES.append(Pass(name, fn, description, fetch))
+        return fn
+    return register
+
+
+@dataclass
+class PassResult:
+    name: str
+    seconds: float = 0.0
+    # move -> field -> (before, after); before is DELETE when the field was added
+    changes: Dict[str, Dict[str, tuple]] = field(default_factory=dict)
+    failures: Dict[str, str] = field(default_factory=dict)
+    stopped: bool = False  # Stopped at the first failure (--timeout-on-fail)
+
+
+class FetchCheckpoint:
+    """Fetched values by move name, saved every `every` additions and on save()."""
+
+    def __init__(self, path: pathlib.Path, every: int = 25):
+        self.path = path
+        self.every = every
+        self.values: Dict[str, Any] = load(path) if path.exists() else {}
+        self.pending = 0
+
+    def get(self, name: str) -> Any:
+        return self.values.get(name)
+
+    def add(self, name: str, value: Any) -> None:
+        self.values[name] = value
+        self.pending += 1
+        if self.pending >= self.every:
+            self.save()
+
+    def save(self) -> None:
+        if self.pending:
+            write_json(self.path, self.values)
+            self.pending = 0
+
+    def clear(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+
+# ---------------------------------------------------------------------------
+# Passes
+# ---------------------------------------------------------------------------
+
+@move_pass("merge_enhanced", "Merge Serebii fields from data/moves_enhanced.json")
+def merge_enhanced(name: str, move: Dict, context: Dict) -> Updates:
+    enhanced = context["enhanced"].get(name)
+    if not enhanced:
+        return {}
+    updates: Updates = {}
+    if enhanced.get("in_depth_effect"):
+        updates["in_depth_effect"] = enhanced["in_depth_effect"]
+    if enhanced.get("secondary_effect"):
+        updates["secondary_effect"] = enhanced["secondary_effect"]
+    if enhanced.get("effect_rate") is not None:
+        updates["effect_chance"] = enhanced["effect_rate"]
+    if enhanced.get("base_critical_hit_rate"):
+        updates["crit_rate"] = enhanced["base_critical_hit_rate"]
+    # Flatten boolean attributes into the move data
+    for key, value in (enhanced.get("boolean_attributes") or {}).items():
+        updates[key.replace("_details", "")] = value
+    return updates
+
+
+@move_pass("fetch_detailed_effects", "Fetch detailed_effect text from pokemondb.net", fetch=True)
+def fetch_detailed_effects(name: str, move: Dict, context: Dict) -> Updates:
+    from update_moves_detailed_effects import fetch_detailed_effect, slugify
+
+    checkpoint = context["checkpoint"]
+    detailed = checkpoint.get(name)
+    if detailed is not None:
+        return {"detailed_effect": detailed}
+    if "session" not in context:
+        import requests
+        context["session"] = requests.Session()
+    else:
+        time.sleep(context.get("delay", 1.0))
+    slug = slugify(name)
+    detailed = fetch_detailed_effect(slug, context["session"])
+    if detailed is None:
+        raise PassFailure(f"no detailed effect found on pokemondb.net (slug: {slug})")
+    checkpoint.add(name, detailed)
+    return {"detailed_effect": detailed}
+
+
+def normalize_paragraph(text: str) -> str:
+    t = text.replace("⁄", "/")
+    # Ensure space after punctuation if missing
+    t = re.sub(r"([,.;:!?])(?=[A-Za-z0-9])", r"\1 ", t)
+    # Add spaces around fraction tokens lacking spaces
+    t = re.sub(r"(?<!\s)(\d+/\d+)(?!\s)", r" \1 ", t)
+    # Insert space between lowercase/number and CapitalizedWord
+    t = re.sub(r"([a-z0-9])([A-Z][a-z])", r"\1 \2", t)
+    # Remove sentences referencing glossary
+    t = re.sub(r"[^.]*glossary[^.]*\.?", "", t, flags=re.I)
+    # Collapse whitespace
+    return re.sub(r"\s+", " ", t).strip()
+
+
+def _paragraphs(text: str) -> List[str]:
+    return [p for p in re.split(r"\r?\n", text) if p.strip()]
+
+
+@move_pass("normalize_detailed_effect", "Fix spacing and drop glossary references in detailed_effect")
+def normalize_detailed_effect(name: str, move: Dict, context: Dict) -> Updates:
+    text = move.get("detailed_effect")
+    if not isinstance(text, str) or not text:
+        return {}
+    # Normalize each paragraph so the blank-line breaks survive
+    return {"detailed_effect": "\n\n".join(normalize_paragraph(p) for p in _paragraphs(text))}
+
+
+@move_pass("paragraph_breaks", "Separate detailed_effect paragraphs with one blank line")
+def paragraph_breaks(name: str, move: Dict, context: Dict) -> Updates:
+    text = move.get("detailed_effect")
+    if not isinstance(text, str):
+        return {}
+    return {"detailed_effect": "\n\n".join(_paragraphs(text))}
+
+
+STAT_KEYS = {
+    "atk": "attack",
+    "def": "defense",
+    "spa": "spAtk",
+    "spd": "spDef",
+    "spe": "speed",
+    "acc": "accuracy",
+    "eva": "evasion",
+}
+DIRECT_STAT_KEYS = ("accuracy", "evasion", "attack", "defense", "spAtk", "spDef", "speed",
+                    "atk", "def", "spa", "spd", "spe")
+
+
+def canonical_stat_key(key: str) -> str:
+    """Convert stat key variants to canonical form"""
+    return STAT_KEYS.get(key, key)
+
+
+def normalize_stat_change(effect: Dict) -> Dict:
+    """Return the StatChangeEffect with a probability and a single canonical 'stats' map."""
+    normalized = {k: v for k, v in effect.items() if k not in DIRECT_STAT_KEYS}
+    normalized.setdefault("probability", 100)
+    stats_map = {}
+    if isinstance(effect.get("stats"), dict):
+        for key, value in effect["stats"].items():
+            stats_map[canonical_stat_key(key)] = value
+    for key in DIRECT_STAT_KEYS:
+        if key in effect:
+            stats_map[canonical_stat_key(key)] = effect[key]
+    if stats_map:
+        normalized["stats"] = stats_map
+    return normalized
+
+
+@move_pass("normalize_stat_changes", "Normalize StatChangeEffect entries in structuredEffects")
+def normalize_stat_changes(name: str, move: Dict, context: Dict) -> Updates:
+    effects = move.get("structuredEffects")
+    if not isinstance(effects, list):
+        return {}
+    return {"structuredEffects": [
+        normalize_stat_change(e) if isinstance(e, dict) and e.get("type") == "StatChangeEffect" else e
+        for e in effects
+    ]}
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def run_passes(moves: Dict[str, Dict], passes: List[Pass], context: Dict,
+               names: Optional[Set[str]] = None, stop_on_fail: bool = False) -> List[PassResult]:
+    """Apply passes in order, mutating moves in place. Returns what each pass changed.
+
+    names limits every pass to those moves (lower-cased); stop_on_fail ends a
+    pass at its first PassFailure.
+    """
+    results = []
+    for p in passes:
+        result = PassResult(p.name)
+        start = time.perf_counter()
+        for name, move in moves.items():
+            if not isinstance(move, dict) or (names is not None and name.lower() not in names):
+                continue
+            try:
+                updates = p.apply(name, move, context)
+            except PassFailure as e:
+                result.failures[name] = str(e)
+                print(f"  Warning: {p.name}: {name}: {e}")
+                if stop_on_fail:
+                    print(f"  Stopping {p.name} due to --timeout-on-fail")
+                    result.stopped = True
+                    break
+                continue
+            for key, value in updates.items():
+                before = move.get(key, DELETE)
+                if value is before or value == before:
+                    continue
+                if value is DELETE:
+                    del move[key]
+                else:
+                    move[key] = value
+                result.changes.setdefault(name, {})[key] = (before, value)
+        result.seconds = time.perf_counter() - start
+        results.append(result)
+    return results
+
+
+def _report_value(value: Any) -> Any:
+    return None if value is DELETE else value
+
+
+def diff_report(results: List[PassResult]) -> Dict:
+    """Machine-readable report: pass -> move -> field -> {before, after}."""
+    return {
+        r.name: {
+            move: {f: {"before": _report_value(b), "after": _report_value(a)} for f, (b, a) in fields.items()}
+            for move, fields in r.changes.items()
+        }
+        for r in results
+    }
+
+
+def print_report(results: List[PassResult], verbose: bool = False) -> None:
+    for r in results:
+        fields = sorted({f for changed in r.changes.values() for f in changed})
+        detail = f" ({', '.join(fields)})" if fields else ""
+        failed = f", {len(r.failures)} failed{' (stopped)' if r.stopped else ''}" if r.failures else ""
+        print(f"  {r.name:26} {len(r.changes):4} moves changed{failed}{detail}  [{r.seconds * 1000:.0f} ms]")
+        if verbose:
+            for move in sorted(r.changes):
+                print(f"    - {move}: {', '.join(sorted(r.changes[move]))}")
+
+
+def select_passes(only: Optional[List[str]], skip: List[str], fetch: bool) -> List[Pass]:
+    known = {p.name for p in PASSES}
+    unknown = (set(only or []) | set(skip)) - known
+    if unknown:
+        raise SystemExit(f"Unknown pass(es): {', '.join(sorted(unknown))}")
+    selected = []
+    for p in PASSES:
+        if only is not None and p.name not in only:
+            continue
+        if p.name in skip or (p.fetch and not fetch and (only is None or p.name not in only)):
+            continue
+        selected.append(p)
+    return selected
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the moves.json transform passes")
+    parser.add_argument("--input", type=pathlib.Path, default=MOVES_JSON, help="moves.json to transform in place")
+    parser.add_argument("--only", nargs="+", metavar="PASS", help="Run only these passes")
+    parser.add_argument("--skip", nargs="+", metavar="PASS", default=[], help="Skip these passes")
+    parser.add_argument("--fetch", action="store_true", help="Include network passes")
+    parser.add_argument("--delay", type=float, default=1.0, help="Seconds between network requests")
+    parser.add_argument("--names", help="Comma-separated move names to process (case-insensitive)")
+    parser.add_argument("--timeout-on-fail", action="store_true", help="Stop a pass at its first failure")
+    parser.add_argument("--dry-run", action="store_true", help="Report changes without writing")
+    parser.add_argument("--backup", action="store_true",
+                        help="Snapshot the input into the snapshot store (see snapshot_store.py) first")
+    parser.add_argument("--report", type=pathlib.Path, help="Write the before/after diff report as JSON")
+    parser.add_argument("--verbose", "-v", action="store_true", help="List every changed move")
+    parser.add_argument("--list", action="store_true", help="List registered passes and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        for p in PASSES:
+            print(f"{p.name:26} {p.description}{'  [--fetch]' if p.fetch else ''}")
+        return
+
+    passes = select_passes(args.only, args.skip, args.fetch)
+    moves = load(args.input)
+    print(f"Loaded {len(moves)} moves from {args.input}")
+
+    names = None
+    if args.names:
+        names = {n.strip().lower() for n in args.names.split(",") if n.strip()}
+        unknown = names - {name.lower() for name in moves}
+        if unknown:
+            raise SystemExit(f"Unknown move(s): {', '.join(sorted(unknown))}")
+
+    context: Dict[str, Any] = {"delay": args.delay, "enhanced": {}}
+    fetching = any(p.fetch for p in passes)
+    if fetching:
+        context["checkpoint"] = FetchCheckpoint(FETCH_CHECKPOINT)
+        if context["checkpoint"].values:
+            print(f"Resuming from {FETCH_CHECKPOINT} ({len(context['checkpoint'].values)} moves already fetched)")
+    if any(p.name == "merge_enhanced" for p in passes):
+        if ENHANCED_JSON.exists():
+            context["enhanced"] = load(ENHANCED_JSON)
+        else:
+            print(f"Note: {ENHANCED_JSON} not found; merge_enhanced has nothing to merge")
+
+    original = copy.deepcopy(moves) if args.dry_run else None
+    try:
+        results = run_passes(moves, passes, context, names=names, stop_on_fail=args.timeout_on_fail)
+    finally:
+        if fetching:
+            context["checkpoint"].save()
+    print_report(results, verbose=args.verbose)
+
+    if args.report:
+        dump(diff_report(results), args.report)
+        print(f"Diff report written to {args.report}")
+
+    changed = {move for r in results for move in r.changes}
+    if args.dry_run:
+        net = sum(1 for name in changed if moves.get(name) != original.get(name))
+        print(f"Dry-run: {net} moves would change")
+        return
+    if changed and args.backup:
+        snapshot = SnapshotStore().save([args.input], label="moves_pipeline")
+        print(f"Snapshot {snapshot['id']} saved ({snapshot['stored_bytes'] / 1024:.1f} KB new); "
+              f"restore with: python scripts/snapshot_store.py restore {snapshot['id']}")
+    written = write_json(args.input, moves)
+    print(f"{'Wrote' if written else 'Unchanged:'} {args.input} ({len(changed)} moves touched)")
+    if fetching:
+        if any(r.failures for r in results):
+            if context["checkpoint"].values:
+                print(f"Fetched text kept in {FETCH_CHECKPOINT}; re-run to retry the failed moves")
+        else:
+            context["checkpoint"].clear()
+
+
+if __name__ == "__main__":
+    main()
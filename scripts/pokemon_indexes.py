@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Build the pokemon_by_* lookup indexes over a pokemon.json entry list.
+
+The indexes used to embed a full copy of every entry, so the app decoded each
+Pokémon four times at startup. They now map keys to integer positions in the
+pokemon.json that ships alongside them; "full" format keeps the old layout for
+readers that have not moved over.
+
+Outputs (next to the given pokemon.json):
+- pokemon_by_number.json : number -> [positions] (variants share a number)
+- pokemon_by_name.json : lowercase name -> position
+- pokemon_by_base_name.json : lowercase base_name -> [positions]
+
+Keys are built from repaired names: assets/data/pokemon.json spells a few
+names as UTF-8 decoded as cp1252 ("Nidoranâ™€"), but the app looks them up as
+"nidoran♀". Within a number or base name, variants keep the order of the
+index being replaced (new variants follow in pokemon.json order), so
+regenerating an index never reorders the forms the app lists.
+
+Run:
+    python scripts/pokemon_indexes.py [--format ids|full] [DIR]   # default DIR: assets/data
+    python scripts/pokemon_indexes.py --compare [DIR]             # size/decode comparison
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+# Add scripts directory to path for relative imports
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+
+from asset_writer import AssetWriter
+from json_io import dumps, load, loads
+
+INDEX_FORMATS = ("ids", "full")
+INDEX_FILES = ("pokemon_by_number.json", "pokemon_by_name.json", "pokemon_by_base_name.json")
+
+
+# index file -> key -> repaired names in index order
+IndexOrder = Dict[str, Dict[str, List[str]]]
+
+
+def repair_mojibake(name: str) -> str:
+    """Undo UTF-8 text that was decoded as cp1252 (e.g. "Nidoranâ™€" -> "Nidoran♀")."""
+    try:
+        repaired = name.encode("cp1252").decode("utf-8")
+    except (UnicodeEncodeError, UnicodeDecodeError):
+        return name
+    return repaired
+
+
+def previous_order(out_dir: pathlib.Path) -> IndexOrder:
+    """Variant order of the indexes currently in out_dir, read against the pokemon.json beside them."""
+    try:
+        entries = load(out_dir / "pokemon.json")
+    except FileNotFoundError:
+        return {}
+    order: IndexOrder = {}
+    for filename in (INDEX_FILES[0], INDEX_FILES[2]):
+        path = out_dir / filename
+        if not path.exists():
+            continue
+        groups = order[filename] = {}
+        for key, values in load(path).items():
+            names = []
+            for value in values:
+                entry = value if isinstance(value, dict) else entries[value] if value < len(entries) else None
+                if entry is not None:
+                    names.append(repair_mojibake(entry["name"]))
+            groups[key] = names
+    return order
+
+
+def build_indexes(entries: List[dict], index_format: str = "ids",
+                  order: Optional[IndexOrder] = None) -> Dict[str, Any]:
+    """Return {index file name: payload} for the given entry list, variants ordered as in order."""
+    if index_format not in INDEX_FORMATS:
+        raise ValueError(f"Unknown index format: {index_format}")
+    order = order or {}
+    names = [repair_mojibake(entry["name"]) for entry in entries]
+
+    def refs(filename: str, key: Any, positions: List[int]) -> List[Any]:
+        rank = {name: r for r, name in enumerate(order.get(filename, {}).get(str(key), []))}
+        positions = sorted(positions, key=lambda i: rank.get(names[i], len(rank)))
+        return [ref(i) for i in positions]
+
+    def ref(i: int) -> Any:
+        return i if index_format == "ids" else entries[i]
+
+    by_number: Dict[int, List[int]] = {}
+    by_name: Dict[str, Any] = {}
+    by_base_name: Dict[str, List[int]] = {}
+    for i, entry in enumerate(entries):
+        by_number.setdefault(entry["number"], []).append(i)
+        by_name[names[i].lower()] = ref(i)
+        by_base_name.setdefault(repair_mojibake(entry["base_name"]).lower(), []).append(i)
+    by_number = {k: refs(INDEX_FILES[0], k, v) for k, v in by_number.items()}
+    by_base_name = {k: refs(INDEX_FILES[2], k, v) for k, v in by_base_name.items()}
+    return dict(zip(INDEX_FILES, (by_number, by_name, by_base_name)))
+
+
+def resolve(entries: List[dict], value: Any) -> Any:
+    """Turn an index value from either format back into entries."""
+    if isinstance(value, list):
+        return [resolve(entries, v) for v in value]
+    return entries[value] if isinstance(value, int) else value
+
+
+def write_indexes(out_dir: pathlib.Path, entries: List[dict], index_format: str = "ids",
+                  writer: AssetWriter = None, order: Optional[IndexOrder] = None) -> AssetWriter:
+    """Write the indexes, keeping the variant order of the ones being replaced unless order is given."""
+    writer = writer or AssetWriter()
+    if order is None:
+        order = previous_order(out_dir)
+    for filename, payload in build_indexes(entries, index_format, order).items():
+        writer.write_json(out_dir / filename, payload, ensure_ascii=True)
+    return writer
+
+
+def compare_formats(data_dir: pathlib.Path, rounds: int = 5) -> None:
+    """Print encoded size and decode time of pokemon.json plus indexes in each format."""
+    entries = load(data_dir / "pokemon.json")
+    list_bytes = dumps(entries, ensure_ascii=True)
+    print(f"pokemon.json: {len(list_bytes) / 1024:.0f} KB ({len(entries)} entries)")
+    for index_format in INDEX_FORMATS:
+        files = [dumps(payload, ensure_ascii=True) for payload in build_indexes(entries, index_format).values()]
+        timings = {}
+        for label, decode in (("json", json.loads), ("json_io", loads)):
+            start = time.perf_counter()
+            for _ in range(rounds):
+                for raw in [list_bytes] + files:
+                    decode(raw)
+            timings[label] = (time.perf_counter() - start) / rounds
+        sizes = ", ".join(f"{name} {len(raw) / 1024:.0f} KB" for name, raw in zip(INDEX_FILES, files))
+        print(f"  {index_format:4} indexes {sum(map(len, files)) / 1024:.0f} KB ({sizes})")
+        print("       decode list + indexes: " + ", ".join(f"{k} {v * 1000:.1f} ms" for k, v in timings.items()))
+
+
+def main() -> None:
+    from championdex_data import ASSETS_DIR  # the package imports this module
+
+    parser = argparse.ArgumentParser(description="Build pokemon_by_* indexes from pokemon.json")
+    parser.add_argument("data_dir", nargs="?", type=pathlib.Path, default=ASSETS_DIR,
+                        help="Directory containing pokemon.json (default: assets/data)")
+    parser.add_argument("--format", choices=INDEX_FORMATS, default="ids",
+                        help="Index values: positions in pokemon.json (ids) or full entry copies (full)")
+    parser.add_argument("--compare", action="store_true", help="Compare sizes and decode times of both formats")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare_formats(args.data_dir)
+        return
+    entries = load(args.data_dir / "pokemon.json")
+    writer = write_indexes(args.data_dir, entries, args.format)
+    writer.print_summary(f"{args.format} indexes for {len(entries)} entries")
+
+
+if __name__ == "__main__":
+    main()
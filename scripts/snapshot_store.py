@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Content-addressed snapshot store for data assets.
+
+Backups used to be full copies written next to the asset
+(moves_backup_<timestamp>.json, .bak, .bak2, .bak_newlines), so every run
+added another 1.2 MB file to assets/data. A snapshot instead splits each file
+into content-defined chunks, stores every chunk once, zlib-compressed and
+named by its SHA-256, and records the file as a list of chunk hashes in a
+small per-snapshot manifest. A snapshot of a file that changed in a few moves
+only stores the chunks around those moves.
+
+Chunk boundaries fall after lines whose CRC-32 is a multiple of
+BOUNDARY_LINES (between MIN_CHUNK and MAX_CHUNK bytes), so an edit only moves
+the boundaries next to it and the rest of the file dedups against earlier
+snapshots. Lines longer than MAX_CHUNK (compact JSON) are cut at fixed offsets.
+
+Layout (.snapshots/ at the repo root, not committed):
+- objects/<2 hex>/<sha256> : zlib-compressed chunk
+- snapshots/<id>.json :
+    {
+      "version": 1,
+      "id": "20250101-120000-1a2b3c4d",
+      "created": "2025-01-01T12:00:00.123456",
+      "label": "moves_pipeline",
+      "files": {"assets/data/moves.json": {"sha256": "...", "size": 1268431,
+                                           "chunks": ["<sha256>", ...]}},
+      "stored_bytes": 18234           # compressed bytes of chunks new in this snapshot
+    }
+File keys are paths relative to the repo root (absolute for files outside it).
+
+Usage:
+    from snapshot_store import SnapshotStore
+
+    store = SnapshotStore()
+    snapshot = store.save([MOVES_JSON], label="before refresh")
+    store.restore(snapshot["id"])
+
+Run:
+    python scripts/snapshot_store.py save assets/data/moves.json [--label TEXT]
+    python scripts/snapshot_store.py list [PATH]
+    python scripts/snapshot_store.py restore ID [PATH ...] [--to DIR]
+    python scripts/snapshot_store.py prune --keep N
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import os
+import pathlib
+import re
+import sys
+import time
+import zlib
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# Add scripts directory to path for relative imports
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+
+from asset_writer import atomic_write_bytes, content_hash
+from championdex_data import ROOT
+from json_io import dumps, load
+
+STORE_DIR = ROOT / ".snapshots"
+
+FORMAT_VERSION = 1
+MIN_CHUNK = 4 * 1024
+MAX_CHUNK = 64 * 1024
+BOUNDARY_LINES = 256  # ~1 boundary per 256 lines past MIN_CHUNK (~10 KB of indented JSON)
+COMPRESS_LEVEL = 6
+
+_LINE = re.compile(rb"[^\n]*\n|[^\n]+")
+
+
+def chunk_bytes(data: bytes) -> Iterator[bytes]:
+    """Split data into content-defined chunks at line boundaries."""
+    start = 0
+    size = 0
+    for match in _LINE.finditer(data):
+        line_end = match.end()
+        while line_end - start > MAX_CHUNK:
+            yield data[start:start + MAX_CHUNK]
+            start += MAX_CHUNK
+        size = line_end - start
+        if size >= MIN_CHUNK and zlib.crc32(match.group()) % BOUNDARY_LINES == 0:
+            yield data[start:line_end]
+            start = line_end
+            size = 0
+    if start < len(data):
+        yield data[start:]
+
+
+def file_key(path: pathlib.Path) -> str:
+    path = path.resolve()
+    try:
+        return path.relative_to(ROOT).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def key_path(key: str) -> pathlib.Path:
+    return pathlib.Path(key) if os.path.isabs(key) else ROOT / key
+
+
+def _expand(paths: Iterable[pathlib.Path]) -> List[pathlib.Path]:
+    files = []
+    for path in paths:
+        if path.is_dir():
+            files.extend(p for p in sorted(path.rglob("*")) if p.is_file())
+        elif path.is_file():
+            files.append(path)
+        else:
+            raise FileNotFoundError(path)
+    return files
+
+
+class SnapshotStore:
+    """Save, list, restore and prune snapshots under a store directory."""
+
+    def __init__(self, store_dir: pathlib.Path = STORE_DIR):
+        self.store_dir = store_dir
+        self.objects_dir = store_dir / "objects"
+        self.snapshots_dir = store_dir / "snapshots"
+
+    def _object_path(self, digest: str) -> pathlib.Path:
+        return self.objects_dir / digest[:2] / digest
+
+    def _put(self, chunk: bytes) -> Tuple[str, int]:
+        """(digest, compressed bytes written; 0 if the chunk was already stored)."""
+        digest = content_hash(chunk)
+        path = self._object_path(digest)
+        if path.exists():
+            return digest, 0
+        payload = zlib.compress(chunk, COMPRESS_LEVEL)
+        atomic_write_bytes(path, payload)
+        return digest, len(payload)
+
+    def _get(self, digest: str) -> bytes:
+        chunk = zlib.decompress(self._object_path(digest).read_bytes())
+        if content_hash(chunk) != digest:
+            raise ValueError(f"Corrupt snapshot object {digest}")
+        return chunk
+
+    def save(self, paths: Sequence[pathlib.Path], label: str = "") -> Dict[str, Any]:
+        """Snapshot files (directories recursively) and return the snapshot manifest."""
+        files: Dict[str, Dict[str, Any]] = {}
+        stored = 0
+        for path in _expand(paths):
+            data = path.read_bytes()
+            chunks = []
+            for chunk in chunk_bytes(data):
+                digest, written = self._put(chunk)
+                chunks.append(digest)
+                stored += written
+            files[file_key(path)] = {"sha256": content_hash(data), "size": len(data), "chunks": chunks}
+        created = datetime.now()
+        fingerprint = hashlib.sha256(created.isoformat().encode() + dumps(files, indent=None, sort_keys=True))
+        snapshot = {
+            "version": FORMAT_VERSION,
+            "id": f"{created:%Y%m%d-%H%M%S}-{fingerprint.hexdigest()[:8]}",
+            "created": created.isoformat(),
+            "label": label,
+            "files": files,
+            "stored_bytes": stored,
+        }
+        atomic_write_bytes(self.snapshots_dir / f"{snapshot['id']}.json", dumps(snapshot, indent=None))
+        return snapshot
+
+    def snapshots(self, path: Optional[pathlib.Path] = None) -> List[Dict[str, Any]]:
+        """Snapshot manifests, oldest first; only those containing path if given."""
+        if not self.snapshots_dir.is_dir():
+            return []
+        key = file_key(path) if path is not None else None
+        found = []
+        for manifest_path in sorted(self.snapshots_dir.glob("*.json")):
+            snapshot = load(manifest_path)
+            if snapshot.get("version") != FORMAT_VERSION:
+                raise ValueError(f"Unsupported snapshot version in {manifest_path.name}: {snapshot.get('version')}")
+            if key is None or key in snapshot["files"]:
+                found.append(snapshot)
+        return sorted(found, key=lambda s: s["created"])
+
+    def get(self, snapshot_id: str) -> Dict[str, Any]:
+        """A snapshot by id or unique id prefix ("latest" for the newest)."""
+        snapshots = self.snapshots()
+        if snapshot_id == "latest" and snapshots:
+            return snapshots[-1]
+        matches = [s for s in snapshots if s["id"].startswith(snapshot_id)]
+        if len(matches) != 1:
+            raise KeyError(f"{len(matches)} snapshots match {snapshot_id!r}")
+        return matches[0]
+
+    def read(self, snapshot: Dict[str, Any], key: str) -> bytes:
+        entry = snapshot["files"][key]
+        data = b"".join(self._get(digest) for digest in entry["chunks"])
+        if content_hash(data) != entry["sha256"]:
+            raise ValueError(f"{key} in snapshot {snapshot['id']} does not match its checksum")
+        return data
+
+    def restore(self, snapshot_id: str, paths: Sequence[pathlib.Path] = (),
+                dest: Optional[pathlib.Path] = None) -> List[pathlib.Path]:
+        """Write a snapshot's files (all, or those under paths) back in place or below dest."""
+        snapshot = self.get(snapshot_id)
+        prefixes = [file_key(p) for p in paths]
+        restored = []
+        for key in snapshot["files"]:
+            if prefixes and not any(key == p or key.startswith(p.rstrip("/") + "/") for p in prefixes):
+                continue
+            target = dest / key.lstrip("/") if dest is not None else key_path(key)
+            atomic_write_bytes(target, self.read(snapshot, key))
+            restored.append(target)
+        return restored
+
+    def prune(self, keep: int) -> Tuple[int, int]:
+        """Drop all but the newest keep snapshots and the objects only they used. (snapshots, bytes) freed."""
+        snapshots = self.snapshots()
+        dropped = snapshots[:max(len(snapshots) - keep, 0)]
+        for snapshot in dropped:
+            (self.snapshots_dir / f"{snapshot['id']}.json").unlink()
+        live = {d for s in snapshots[len(dropped):] for f in s["files"].values() for d in f["chunks"]}
+        freed = 0
+        for path in self.objects_dir.glob("*/*") if self.objects_dir.is_dir() else ():
+            if path.name not in live:
+                freed += path.stat().st_size
+                path.unlink()
+        return len(dropped), freed
+
+    def stored_bytes(self) -> int:
+        return sum(p.stat().st_size for p in self.objects_dir.glob("*/*")) if self.objects_dir.is_dir() else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Content-addressed snapshots of data assets")
+    sub = parser.add_subparsers(dest="command", required=True)
+    save = sub.add_parser("save", help="Snapshot files or directories")
+    save.add_argument("paths", nargs="+", type=pathlib.Path)
+    save.add_argument("--label", default="", help="Free-text note shown by list")
+    listing = sub.add_parser("list", help="List snapshots, oldest first")
+    listing.add_argument("path", nargs="?", type=pathlib.Path, help="Only snapshots containing this file")
+    restore = sub.add_parser("restore", help="Restore a snapshot (id, id prefix or 'latest')")
+    restore.add_argument("snapshot_id")
+    restore.add_argument("paths", nargs="*", type=pathlib.Path, help="Only these files or directories")
+    restore.add_argument("--to", type=pathlib.Path, help="Restore below this directory instead of in place")
+    prune = sub.add_parser("prune", help="Keep only the newest snapshots")
+    prune.add_argument("--keep", type=int, required=True)
+    args = parser.parse_args()
+
+    store = SnapshotStore()
+    start = time.perf_counter()
+    if args.command == "save":
+        snapshot = store.save(args.paths, args.label)
+        size = sum(f["size"] for f in snapshot["files"].values())
+        chunks = sum(len(f["chunks"]) for f in snapshot["files"].values())
+        print(f"Saved snapshot {snapshot['id']}: {len(snapshot['files'])} files, {size / 1024:.0f} KB in "
+              f"{chunks} chunks, {snapshot['stored_bytes'] / 1024:.1f} KB new in the store "
+              f"({time.perf_counter() - start:.2f}s)")
+    elif args.command == "list":
+        snapshots = store.snapshots(args.path)
+        for snapshot in snapshots:
+            size = sum(f["size"] for f in snapshot["files"].values())
+            print(f"{snapshot['id']}  {len(snapshot['files']):5} files {size / 1024:9.0f} KB  "
+                  f"+{snapshot['stored_bytes'] / 1024:7.1f} KB  {snapshot['label']}")
+        print(f"{len(snapshots)} snapshots, store size {store.stored_bytes() / 1024:.0f} KB")
+    elif args.command == "restore":
+        restored = store.restore(args.snapshot_id, args.paths, args.to)
+        print(f"Restored {len(restored)} files from {store.get(args.snapshot_id)['id']} "
+              f"in {time.perf_counter() - start:.2f}s")
+    elif args.command == "prune":
+        dropped, freed = store.prune(args.keep)
+        print(f"Removed {dropped} snapshots, freed {freed / 1024:.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Split moves.json into a startup summary and on-demand detail shards.
+
+MoveDataService decodes all of moves.json (1.3 MB) at startup, although most
+of it (detailed_effect, z_move_effect, in_depth_effect, the boolean flags) is
+only shown on the move detail screen. This stage writes the fields list and
+battle views need into one small summary file and the rest into shards
+bucketed by move ID, so startup decodes a fraction of the bytes and a detail
+screen reads one shard.
+
+Move IDs come from the learnset_ids.json registry (see
+build_compact_learnsets.py), so a move keeps its bucket across rebuilds.
+
+Outputs:
+- assets/data/moves_summary.json :
+    {
+      "version": 1,
+      "bucket_size": 64,
+      "moves": {"Absorb": {"id": 1, "type": "Grass", "category": "Special", "power": 20,
+                           "accuracy": 100, "pp": 25, "structuredEffects": [...]}, ...}
+    }
+    Summary fields (SUMMARY_FIELDS) are only present when the move has them.
+- assets/data/moves_detail/<bucket>.json : {"Absorb": {<every other field>}, ...}
+  for the moves with id // bucket_size == bucket (file name zero-padded to 3 digits)
+- assets/data/moves_detail/manifest.json :
+    {"version": 1, "bucket_size": 64, "summary_fields": [...],
+     "buckets": [{"file": "000.json", "moves": 41, "bytes": 81234}, ...]}
+
+Usage:
+    from split_moves import load_move, load_summary
+
+    load_summary()["Absorb"]["power"]   # 20
+    load_move("Absorb")                  # the full moves.json entry
+
+Run:
+    python scripts/split_moves.py [--bucket-size N] [--verify]
+"""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# Add scripts directory to path for relative imports
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+
+from asset_writer import AssetWriter
+from build_compact_learnsets import REGISTRY_FILE, IdRegistry
+from championdex_data import ASSETS_DIR
+from json_io import dumps, load
+
+MOVES_JSON = ASSETS_DIR / "moves.json"
+SUMMARY_FILE = ASSETS_DIR / "moves_summary.json"
+DETAIL_DIR = ASSETS_DIR / "moves_detail"
+MANIFEST_FILE = DETAIL_DIR / "manifest.json"
+
+FORMAT_VERSION = 1
+DEFAULT_BUCKET_SIZE = 64
+SUMMARY_FIELDS = ("type", "category", "power", "accuracy", "pp", "priority", "structuredEffects")
+
+
+def bucket_file(bucket: int) -> str:
+    return f"{bucket:03d}.json"
+
+
+def split_moves(moves: Dict[str, Dict], registry: IdRegistry,
+                bucket_size: int = DEFAULT_BUCKET_SIZE) -> Tuple[Dict, Dict[int, Dict]]:
+    """(summary payload, {bucket: detail shard})."""
+    summary: Dict[str, Dict[str, Any]] = {}
+    shards: Dict[int, Dict[str, Dict]] = {}
+    for name in sorted(moves):
+        try:
+            move_id = registry.id("moves", name)
+        except KeyError:
+            raise SystemExit(f"{name!r} is not in {REGISTRY_FILE.name}; run build_compact_learnsets.py first")
+        entry = moves[name]
+        summary[name] = {"id": move_id, **{f: entry[f] for f in SUMMARY_FIELDS if f in entry}}
+        detail = {f: v for f, v in entry.items() if f not in SUMMARY_FIELDS}
+        shards.setdefault(move_id // bucket_size, {})[name] = detail
+    payload = {"version": FORMAT_VERSION, "bucket_size": bucket_size, "moves": summary}
+    return payload, dict(sorted(shards.items()))
+
+
+def write_split(summary: Dict, shards: Dict[int, Dict], writer: AssetWriter,
+                summary_file: pathlib.Path = SUMMARY_FILE, detail_dir: pathlib.Path = DETAIL_DIR) -> Dict:
+    writer.write_json(summary_file, summary, indent=None)
+    buckets: List[Dict[str, Any]] = []
+    for bucket, shard in shards.items():
+        payload = dumps(shard, indent=None)
+        writer.write_bytes(detail_dir / bucket_file(bucket), payload)
+        buckets.append({"file": bucket_file(bucket), "moves": len(shard), "bytes": len(payload)})
+    writer.remove_stale(detail_dir, "[0-9][0-9][0-9].json")
+    manifest = {
+        "version": FORMAT_VERSION,
+        "bucket_size": summary["bucket_size"],
+        "summary_fields": list(SUMMARY_FIELDS),
+        "buckets": buckets,
+    }
+    writer.write_json(detail_dir / MANIFEST_FILE.name, manifest, indent=None)
+    return manifest
+
+
+def load_summary(path: pathlib.Path = SUMMARY_FILE) -> Dict[str, Dict]:
+    payload = load(path)
+    if payload.get("version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported move summary version: {payload.get('version')}")
+    return payload["moves"]
+
+
+def load_move(name: str, summary: Optional[Dict] = None, detail_dir: pathlib.Path = DETAIL_DIR) -> Dict[str, Any]:
+    """The full moves.json entry for a move: its summary row plus its detail shard entry."""
+    summary = summary if summary is not None else load(SUMMARY_FILE)
+    row = dict(summary["moves"][name])
+    move_id = row.pop("id")
+    detail = load(detail_dir / bucket_file(move_id // summary["bucket_size"]))[name]
+    return {**row, **detail}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Split moves.json into a summary and detail shards")
+    parser.add_argument("--bucket-size", type=int, default=DEFAULT_BUCKET_SIZE, help="Move IDs per detail shard")
+    parser.add_argument("--verify", action="store_true", help="Rebuild every move from the outputs and compare")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    moves = load(MOVES_JSON)
+    summary, shards = split_moves(moves, IdRegistry.load(), args.bucket_size)
+    writer = AssetWriter()
+    manifest = write_split(summary, shards, writer)
+
+    if args.verify:
+        mismatched = [name for name in moves if load_move(name, summary) != moves[name]]
+        if mismatched:
+            raise SystemExit(f"Split does not round-trip for: {', '.join(mismatched[:10])}")
+        print(f"✓ Summary + detail rebuild all {len(moves)} moves")
+
+    source_bytes = MOVES_JSON.stat().st_size
+    summary_bytes = SUMMARY_FILE.stat().st_size
+    detail_bytes = sum(b["bytes"] for b in manifest["buckets"])
+    print(f"Split {len(moves)} moves in {time.perf_counter() - start:.2f}s: moves.json {source_bytes / 1024:.0f} KB -> "
+          f"summary {summary_bytes / 1024:.0f} KB ({summary_bytes / source_bytes:.0%}) + "
+          f"{len(shards)} detail shards {detail_bytes / 1024:.0f} KB "
+          f"(avg {detail_bytes / max(len(shards), 1) / 1024:.0f} KB)")
+    writer.print_summary("move split files")
+
+
+if __name__ == "__main__":
+    main()
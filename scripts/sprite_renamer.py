@@ -1,12 +1,13 @@
 from pathlib import Path
 import os
-import json
+import sys
 
-images_dir = Path(__file__).parent.parent / "data" / "images_large"
-pokemon_json_file = Path(__file__).parent.parent / "assets" / "data" / "pokemon_by_number.json"
+# Add scripts directory to path for relative imports
+sys.path.insert(0, str(Path(__file__).parent))
 
-with open(pokemon_json_file, "r", encoding="utf-8") as f:
-    pokemon_data = json.load(f)
+from championdex_data import SCRAPE_DIR, pokemon_by_number
+
+images_dir = SCRAPE_DIR / "images_large"  # Downloaded sprites, one directory per dex number
 
 def rename_sprites(range_start: int, range_end: int):
     for number_dir in images_dir.iterdir():
@@ -15,7 +16,7 @@ def rename_sprites(range_start: int, range_end: int):
         elif not (range_start <= int(number_dir.name) <= range_end):
             continue
 
-        pokemon_list = pokemon_data.get(number_dir.name)
+        pokemon_list = pokemon_by_number(int(number_dir.name))
         if not pokemon_list:
             print(f"No data for {number_dir.name}; skipping")
             continue
@@ -614,14 +615,13 @@ def rename_sprites(range_start: int, range_end: int):
             number_dir.rmdir()
 
 def crop_prefixes(range_start: int, range_end: int):
-    images_dir = Path(__file__).parent.parent / "data" / "images_large"
     for number_dir in images_dir.iterdir():
         if not number_dir.is_dir():
             continue
         elif not (range_start <= int(number_dir.name) <= range_end):
             continue
 
-        pokemon_list = pokemon_data.get(number_dir.name)
+        pokemon_list = pokemon_by_number(int(number_dir.name))
         if not pokemon_list:
             print(f"No data for {number_dir.name}; skipping")
             continue
@@ -0,0 +1,7 @@
+"""Shared setup for the data pipeline tests: run with `python -m pytest scripts/tests`."""
+
+import pathlib
+import sys
+
+# The scripts import each other as top-level modules
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
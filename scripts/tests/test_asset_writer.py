@@ -0,0 +1,158 @@
+"""AssetTransaction commit, rollback and crash recovery."""
+
+import json
+import pathlib
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from asset_writer import STAGING_DIR_NAME, AssetTransaction, AssetWriter, recover_transactions
+
+SCRIPTS_DIR = pathlib.Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def root(tmp_path):
+    (tmp_path / "moves").mkdir()
+    (tmp_path / "moves" / "Tackle.json").write_text('{"power":40}')
+    (tmp_path / "moves" / "Pound.json").write_text('{"power":40}')
+    (tmp_path / "moves" / "Stale.json").write_text('{"power":1}')
+    return tmp_path
+
+
+def snapshot(root: pathlib.Path) -> dict:
+    return {p.relative_to(root).as_posix(): p.read_bytes() for p in sorted(root.rglob("*")) if p.is_file()}
+
+
+def test_writer_skips_unchanged(tmp_path):
+    path = tmp_path / "a.json"
+    writer = AssetWriter()
+    assert writer.write_json(path, {"a": 1})
+    assert not writer.write_json(path, {"a": 1})
+    assert writer.summary() == "1 written, 1 unchanged"
+
+
+def test_commit_applies_writes_and_removals(root):
+    with AssetTransaction(root) as tx:
+        tx.write_json(root / "moves" / "Tackle.json", {"power": 50})
+        tx.write_json(root / "moves" / "Pound.json", {"power": 40}, indent=None)  # same bytes
+        tx.write_json(root / "moves" / "Surf.json", {"power": 90})
+        with tx.stream_json_object(root / "moves.json") as stream:
+            stream.write("Tackle", {"power": 50})
+        tx.remove_stale(root / "moves", "*.json")
+        assert json.loads((root / "moves" / "Tackle.json").read_text()) == {"power": 40}  # not yet visible
+        assert json.loads(tx.staged_path(root / "moves" / "Tackle.json").read_text()) == {"power": 50}
+
+    assert json.loads((root / "moves" / "Tackle.json").read_text()) == {"power": 50}
+    assert json.loads((root / "moves" / "Surf.json").read_text()) == {"power": 90}
+    assert json.loads((root / "moves.json").read_text()) == {"Tackle": {"power": 50}}
+    assert (root / "moves" / "Pound.json").read_text() == '{"power":40}'
+    assert not (root / "moves" / "Stale.json").exists()
+    assert not (root / STAGING_DIR_NAME).exists()
+    assert tx.summary() == "3 written, 1 unchanged, 1 removed"
+
+
+def test_exception_rolls_back(root):
+    before = snapshot(root)
+    with pytest.raises(RuntimeError):
+        with AssetTransaction(root) as tx:
+            tx.write_json(root / "moves" / "Tackle.json", {"power": 50})
+            tx.remove_stale(root / "moves", "Stale.json")
+            raise RuntimeError("stage failed")
+    assert snapshot(root) == before
+    assert not (root / STAGING_DIR_NAME).exists()
+
+
+def test_failed_validation_rolls_back(root):
+    before = snapshot(root)
+
+    def validate(tx: AssetTransaction) -> None:
+        staged = json.loads(tx.staged_path(root / "moves" / "Tackle.json").read_text())
+        if staged["power"] > 45:
+            raise ValueError("power too high")
+
+    with pytest.raises(ValueError, match="power too high"):
+        with AssetTransaction(root, validate=validate) as tx:
+            tx.write_json(root / "moves" / "Tackle.json", {"power": 50})
+    assert snapshot(root) == before
+    assert not (root / STAGING_DIR_NAME).exists()
+
+
+def test_truncated_json_rolls_back(root):
+    before = snapshot(root)
+    with pytest.raises(ValueError, match="not valid JSON"):
+        with AssetTransaction(root) as tx:
+            tx.write_bytes(root / "moves" / "Tackle.json", b'{"power": ')
+    assert snapshot(root) == before
+
+
+def test_write_outside_root_is_rejected(root, tmp_path_factory):
+    outside = tmp_path_factory.mktemp("elsewhere") / "x.json"
+    with pytest.raises(ValueError, match="outside the transaction root"):
+        with AssetTransaction(root) as tx:
+            tx.write_json(outside, {})
+    assert not outside.exists()
+
+
+def crash_in_child(root: pathlib.Path, after_journal: bool) -> None:
+    """Stage two writes and a removal in a child process that dies mid-commit."""
+    code = textwrap.dedent(f"""
+        import os, pathlib, sys
+        sys.path.insert(0, {str(SCRIPTS_DIR)!r})
+        import asset_writer
+
+        root = pathlib.Path({str(root)!r})
+
+        def crash(staging_dir):
+            # Move the first staged file into place, then die before the rest
+            journal = asset_writer.loads((staging_dir / asset_writer.JOURNAL_NAME).read_bytes())
+            relative, target = journal["replace"][0]
+            os.replace(staging_dir / relative, target)
+            os._exit(3)
+
+        asset_writer._apply_journal = crash
+        tx = asset_writer.AssetTransaction(root)
+        tx.write_json(root / "moves" / "Pound.json", {{"power": 41}})
+        tx.write_json(root / "moves" / "Tackle.json", {{"power": 50}})
+        tx.remove_stale(root / "moves", "Stale.json")
+        if {after_journal!r}:
+            tx.commit()
+        os._exit(3)
+    """)
+    result = subprocess.run([sys.executable, "-c", code])
+    assert result.returncode == 3
+
+
+def test_recover_rolls_forward_after_crash_during_commit(root):
+    crash_in_child(root, after_journal=True)
+    # The crash left one file replaced and the other still old
+    assert json.loads((root / "moves" / "Pound.json").read_text()) == {"power": 41}
+    assert json.loads((root / "moves" / "Tackle.json").read_text()) == {"power": 40}
+    assert (root / "moves" / "Stale.json").exists()
+
+    assert recover_transactions(root) == 1
+    assert json.loads((root / "moves" / "Pound.json").read_text()) == {"power": 41}
+    assert json.loads((root / "moves" / "Tackle.json").read_text()) == {"power": 50}
+    assert not (root / "moves" / "Stale.json").exists()
+    assert not (root / STAGING_DIR_NAME).exists()
+
+
+def test_recover_discards_uncommitted_transaction(root):
+    before = snapshot(root)
+    crash_in_child(root, after_journal=False)
+    assert (root / STAGING_DIR_NAME).is_dir()
+    assert snapshot(root) != before  # the leftover staging files
+
+    assert recover_transactions(root) == 1
+    assert snapshot(root) == before
+    assert not (root / STAGING_DIR_NAME).exists()
+
+
+def test_new_transaction_recovers_first(root):
+    crash_in_child(root, after_journal=True)
+    with AssetTransaction(root) as tx:
+        assert json.loads((root / "moves" / "Tackle.json").read_text()) == {"power": 50}
+        tx.write_json(root / "moves" / "Surf.json", {"power": 90})
+    assert sorted(p.name for p in (root / "moves").iterdir()) == ["Pound.json", "Surf.json", "Tackle.json"]
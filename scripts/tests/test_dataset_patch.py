@@ -0,0 +1,112 @@
+"""dataset_patch diff/apply round trips reproduce the new snapshot byte for byte."""
+
+import json
+import pathlib
+import shutil
+
+import pytest
+
+from dataset_patch import PatchError, apply_patch, diff_snapshots, read_patch, write_patch
+
+
+def write(path: pathlib.Path, doc, indent=2, ensure_ascii=False) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(doc, indent=indent, ensure_ascii=ensure_ascii), encoding="utf-8")
+
+
+def learnset(moves):
+    return {"Bulbasaur": {"gen_9": {"Scarlet and Violet": {"level_up": [{"name": m, "level": "1"} for m in moves]}},
+                          "gen_8": {"Sword and Shield": {"tm": [{"name": "Solar Beam", "tm_id": "TM22"}]}}}}
+
+
+# Enough untouched moves that entity ops beat shipping moves.json whole
+FILLER = {f"Move {i}": {"power": i, "pp": 10, "effect": "Inflicts regular damage."} for i in range(40)}
+
+
+@pytest.fixture
+def snapshots(tmp_path):
+    old, new = tmp_path / "old", tmp_path / "new"
+    write(old / "moves.json", {"Tackle": {"power": 40, "pp": 35}, "Pound": {"power": 40}, "Growl": {"power": None},
+                               **FILLER})
+    write(new / "moves.json", {"Growl": {"power": None}, "Tackle": {"power": 40, "pp": 35, "priority": 0},
+                               **FILLER, "Surf": {"power": 90}})
+    write(old / "pokemon.json", [{"name": "Bulbasaur", "number": 1}, {"name": "Flabébé", "number": 669}],
+          ensure_ascii=True)
+    write(new / "pokemon.json", [{"name": "Bulbasaur", "number": 1, "types": ["Grass"]},
+                                 {"name": "Flabébé", "number": 669}], ensure_ascii=True)
+    write(old / "pokemon_moves" / "Bulbasaur.json", learnset(["Tackle", "Growl"]))
+    write(new / "pokemon_moves" / "Bulbasaur.json", learnset(["Growl", "Tackle", "Vine Whip"]))
+    write(old / "natures.json", {"Adamant": {"attack": 1.1}}, indent=None)
+    write(new / "natures.json", {"Bold": {"defense": 1.1}, "Adamant": {"attack": 1.1}}, indent=None)
+    write(old / "abilities.json", {"Overgrow": {}})
+    write(new / "type_chart.json", {"typeChart": {"Fire": {"Grass": 2}}})
+    (old / "notes.txt").write_text("same in both")
+    (new / "notes.txt").write_text("same in both")
+    return old, new
+
+
+def files(root: pathlib.Path) -> dict:
+    return {p.relative_to(root).as_posix(): p.read_bytes() for p in sorted(root.rglob("*")) if p.is_file()}
+
+
+def test_round_trip_in_place(snapshots, tmp_path):
+    old, new = snapshots
+    patch_path = tmp_path / "update.patch.json.gz"
+    write_patch(diff_snapshots(old, new), patch_path)
+    patch = read_patch(patch_path)
+
+    assert set(patch["files"]) == {"moves.json", "pokemon.json", "pokemon_moves/Bulbasaur.json",
+                                   "natures.json", "abilities.json", "type_chart.json"}
+    ops = {op["op"] for op in patch["ops"]}
+    assert {"set", "del", "order", "delete_file", "put_file"} <= ops
+
+    apply_patch(patch, old)
+    assert files(old) == files(new)
+
+
+def test_round_trip_into_out_dir(snapshots, tmp_path):
+    old, new = snapshots
+    before = files(old)
+    out = tmp_path / "out"
+    apply_patch(diff_snapshots(old, new), old, out)
+    assert files(out) == files(new)
+    assert files(old) == before
+
+
+def test_identical_snapshots_give_an_empty_patch(snapshots):
+    old, _ = snapshots
+    patch = diff_snapshots(old, old)
+    assert patch["files"] == {} and patch["ops"] == []
+
+
+def test_wrong_base_is_rejected_untouched(snapshots, tmp_path):
+    old, new = snapshots
+    patch = diff_snapshots(old, new)
+    other = tmp_path / "other"
+    shutil.copytree(old, other)
+    write(other / "moves.json", {"Tackle": {"power": 35}})
+    before = files(other)
+    with pytest.raises(PatchError, match="base checksum mismatch"):
+        apply_patch(patch, other)
+    assert files(other) == before
+
+
+def test_non_empty_out_dir_needs_force(snapshots, tmp_path):
+    old, new = snapshots
+    patch = diff_snapshots(old, new)
+    out = tmp_path / "out"
+    out.mkdir()
+    (out / "keep.txt").write_text("user data")
+    with pytest.raises(PatchError, match="--force"):
+        apply_patch(patch, old, out)
+    assert (out / "keep.txt").exists()
+
+    apply_patch(patch, old, out, force=True)
+    assert files(out) == files(new)
+
+
+def test_out_dir_containing_base_is_refused(snapshots, tmp_path):
+    old, new = snapshots
+    with pytest.raises(PatchError, match="refusing"):
+        apply_patch(diff_snapshots(old, new), old, tmp_path, force=True)
+    assert old.is_dir()
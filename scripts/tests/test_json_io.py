@@ -0,0 +1,90 @@
+"""json_io must produce the stdlib encoder's bytes whichever backend is installed."""
+
+import json
+
+import pytest
+
+import json_io
+from json_io import JsonObjectWriter, dump, dumps
+
+BACKENDS = [
+    pytest.param(None, id="stdlib"),
+    pytest.param(json_io.orjson, id="orjson",
+                 marks=pytest.mark.skipif(json_io.orjson is None, reason="orjson is not installed")),
+]
+
+DOCUMENTS = {
+    "nested": {"Pikachu": {"types": ["Electric"], "stats": {"hp": 35, "speed": 90}, "legendary": False,
+                           "evolves_from": None, "height": 0.4}},
+    "non_ascii": {"Flabébé": "Fée ♀", "Nidoran♂": ["Poison"], "emoji": "✨"},
+    "exponents": {"big": 1e16, "small": 1e-7, "tiny": 0.00001, "plain": 1.5, "neg": -2.5e-5},
+    "wide_int": {"id": 2 ** 70},
+    "empty": {"list": [], "map": {}, "text": ""},
+    "list_root": [{"name": "Bulbasaur", "number": 1}, {"name": "Ivysaur", "number": 2}],
+}
+
+OPTIONS = [
+    {},
+    {"indent": None},
+    {"indent": 4},
+    {"sort_keys": True},
+    {"ensure_ascii": True},
+    {"indent": None, "sort_keys": True},
+]
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request, monkeypatch):
+    monkeypatch.setattr(json_io, "orjson", request.param)
+    return request.param
+
+
+def stdlib_bytes(obj, indent=2, sort_keys=False, ensure_ascii=False) -> bytes:
+    separators = (",", ":") if indent is None else None
+    return json.dumps(obj, indent=indent, sort_keys=sort_keys, ensure_ascii=ensure_ascii,
+                      separators=separators).encode("utf-8")
+
+
+@pytest.mark.parametrize("options", OPTIONS, ids=lambda o: ",".join(f"{k}={v}" for k, v in o.items()) or "default")
+@pytest.mark.parametrize("name", sorted(DOCUMENTS))
+def test_dumps_matches_stdlib(backend, name, options):
+    doc = DOCUMENTS[name]
+    assert dumps(doc, **options) == stdlib_bytes(doc, **options)
+
+
+def test_sort_keys_with_non_str_keys_sorts_numerically(backend):
+    doc = {10: "ten", 9: "nine", 100: {2: "b", 1: "a"}}
+    assert dumps(doc, sort_keys=True) == stdlib_bytes(doc, sort_keys=True)
+    assert list(json.loads(dumps(doc, sort_keys=True))) == ["9", "10", "100"]
+
+
+def test_non_str_keys_unsorted(backend):
+    doc = {1: "a", "b": {2: "c"}}
+    assert dumps(doc) == stdlib_bytes(doc)
+
+
+def test_load_round_trip(backend, tmp_path):
+    path = tmp_path / "doc.json"
+    dump(DOCUMENTS["non_ascii"], path)
+    assert json_io.load(path) == DOCUMENTS["non_ascii"]
+    assert path.read_bytes() == stdlib_bytes(DOCUMENTS["non_ascii"])
+
+
+@pytest.mark.parametrize("sort_keys", [False, True])
+def test_object_writer_matches_dump(backend, tmp_path, sort_keys):
+    doc = {"b": DOCUMENTS["nested"], "a": DOCUMENTS["exponents"], "c": []}
+    streamed, dumped = tmp_path / "streamed.json", tmp_path / "dumped.json"
+    with JsonObjectWriter(streamed, sort_keys=sort_keys) as writer:
+        for key, value in doc.items():
+            writer.write(key, value)
+    dump(doc, dumped, sort_keys=False)
+    expected = dumped.read_bytes() if not sort_keys else stdlib_bytes(
+        {k: json.loads(json.dumps(v, sort_keys=True)) for k, v in doc.items()})
+    assert streamed.read_bytes() == expected
+
+
+def test_empty_object_writer(backend, tmp_path):
+    path = tmp_path / "empty.json"
+    with JsonObjectWriter(path):
+        pass
+    assert path.read_bytes() == stdlib_bytes({})
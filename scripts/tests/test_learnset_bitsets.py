@@ -0,0 +1,83 @@
+"""Learnset bitset queries agree across the learnset spellings of a move."""
+
+import pytest
+
+from build_compact_learnsets import IdRegistry
+from build_learnset_bitsets import LearnsetBitsets, build_bitsets
+from build_move_indexes import learn_rows
+
+SV, PLA = "Scarlet and Violet", "Pokémon Legends: Arceus"
+
+
+def learnset(form, games):
+    return {form: {"gen_9": {game: {method: [{"name": m, "level": "1"} for m in moves]
+                                    for method, moves in methods.items()}
+                             for game, methods in games.items()}}}
+
+
+@pytest.fixture(scope="module")
+def registry():
+    return IdRegistry({
+        "moves": ["Baby-Doll Eyes", "Screech", "Tackle", "X-Scissor"],
+        "games": [PLA, SV],
+        "gens": ["gen_9"],
+        "methods": ["egg", "level_up"],
+    })
+
+
+@pytest.fixture(scope="module")
+def bitsets(registry):
+    corpus = {
+        "Scyther": learn_rows(learnset("Scyther", {
+            SV: {"level_up": ["X-scissor", "Tackle"]},
+            PLA: {"level_up": ["X-Scissor", "Nihil Light"]},
+        })),
+        "Zubat": learn_rows(learnset("Zubat", {
+            SV: {"level_up": ["ScreechBDSP Only", "Tackle"], "egg": ["Baby-doll Eyes"]},
+        })),
+        "Eevee": learn_rows(learnset("Eevee", {
+            SV: {"level_up": ["Baby-Doll Eyes", "Tackle"]},
+            PLA: {"level_up": ["Baby-Doll Eyes"]},
+        })),
+    }
+    return LearnsetBitsets(build_bitsets(corpus, registry), registry)
+
+
+@pytest.mark.parametrize("spelling", ["X-Scissor", "X-scissor", "x scissor"])
+def test_spellings_resolve_to_the_same_move(bitsets, spelling):
+    assert bitsets.move_id(spelling) == bitsets.move_id("X-Scissor")
+    assert bitsets.learners([spelling]) == ["Scyther"]
+    assert bitsets.learns(spelling).tolist() == [form == "Scyther" for form in bitsets.forms]
+
+
+def test_learnset_only_spellings_set_the_registered_bit(bitsets):
+    assert bitsets.learners(["Screech"]) == ["Zubat"]
+    assert sorted(bitsets.learners(["Baby-Doll Eyes"])) == ["Eevee", "Zubat"]
+    assert bitsets.learners(["Baby-doll Eyes"], methods=["egg"]) == ["Zubat"]
+
+
+def test_unlisted_moves_are_left_out(bitsets):
+    assert bitsets.movepool("Scyther", game=PLA) == ["X-Scissor"]
+    with pytest.raises(KeyError):
+        bitsets.move_id("Nihil Light")
+
+
+def test_learner_filters(bitsets):
+    assert sorted(bitsets.learners(["Tackle"], game=SV)) == ["Eevee", "Scyther", "Zubat"]
+    assert bitsets.learners(["Tackle"], game=PLA) == []
+    assert bitsets.learners(["Tackle"], none_of=["Baby-Doll Eyes"]) == ["Scyther"]
+    assert sorted(bitsets.learners(any_of=["Screech", "X-scissor"])) == ["Scyther", "Zubat"]
+    assert bitsets.learners(game=PLA) == ["Eevee", "Scyther"]
+
+
+def test_rank_and_shared(bitsets):
+    assert bitsets.rank(["Tackle", "Screech", "Baby-Doll Eyes"], game=SV) == [("Zubat", 3), ("Eevee", 2),
+                                                                               ("Scyther", 1)]
+    assert bitsets.shared(["Scyther", "Zubat", "Eevee"], game=SV) == ["Tackle"]
+    assert bitsets.movepool("Zubat", methods=["level_up"]) == ["Screech", "Tackle"]
+
+
+def test_game_missing_from_registry_is_rejected(registry):
+    corpus = {"Mew": learn_rows(learnset("Mew", {"Sword and Shield": {"level_up": ["Tackle"]}}))}
+    with pytest.raises(SystemExit, match="Sword and Shield"):
+        build_bitsets(corpus, registry)
@@ -0,0 +1,90 @@
+"""Snapshot store save, restore and prune."""
+
+import json
+
+import pytest
+
+from snapshot_store import SnapshotStore, chunk_bytes
+
+
+def moves_doc(changed: int = -1) -> dict:
+    return {f"Move {i}": {"power": i % 250, "pp": 5 + i % 35, "accuracy": 100 - i % 30,
+                          "effect": f"Deals damage; effect #{i * 7919 % 10007}."
+                                    + (" Changed." if i == changed else "")}
+            for i in range(3000)}
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    root = tmp_path / "data"
+    root.mkdir()
+    (root / "moves.json").write_text(json.dumps(moves_doc(), indent=2))
+    (root / "natures.json").write_text(json.dumps({"Adamant": {"attack": 1.1}}))
+    return root
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SnapshotStore(tmp_path / "store")
+
+
+def test_chunks_reassemble(data_dir):
+    data = (data_dir / "moves.json").read_bytes()
+    chunks = list(chunk_bytes(data))
+    assert len(chunks) > 3
+    assert b"".join(chunks) == data
+
+
+def test_unchanged_chunks_are_stored_once(store, data_dir):
+    first = store.save([data_dir], label="first")
+    assert set(first["files"]) == {(data_dir / "moves.json").as_posix(), (data_dir / "natures.json").as_posix()}
+
+    (data_dir / "moves.json").write_text(json.dumps(moves_doc(changed=1500), indent=2))
+    second = store.save([data_dir], label="second")
+    assert 0 < second["stored_bytes"] < first["stored_bytes"] / 3
+    assert store.stored_bytes() == first["stored_bytes"] + second["stored_bytes"]
+    assert [s["label"] for s in store.snapshots()] == ["first", "second"]
+    assert store.get("latest")["id"] == second["id"]
+    assert store.get(first["id"][:-2])["id"] == first["id"]
+
+
+def test_restore_in_place_and_to_dest(store, data_dir, tmp_path):
+    original = (data_dir / "moves.json").read_bytes()
+    snapshot = store.save([data_dir])
+    (data_dir / "moves.json").write_text("{}")
+    (data_dir / "natures.json").write_text("{}")
+
+    restored = store.restore(snapshot["id"], paths=[data_dir / "moves.json"])
+    assert restored == [data_dir / "moves.json"]
+    assert (data_dir / "moves.json").read_bytes() == original
+    assert (data_dir / "natures.json").read_text() == "{}"
+
+    dest = tmp_path / "restored"
+    store.restore("latest", dest=dest)
+    copy = dest / str(data_dir).lstrip("/")
+    assert (copy / "moves.json").read_bytes() == original
+    assert json.loads((copy / "natures.json").read_text()) == {"Adamant": {"attack": 1.1}}
+
+
+def test_prune_keeps_the_newest(store, data_dir):
+    first = store.save([data_dir])
+    (data_dir / "moves.json").write_text(json.dumps(moves_doc(changed=10), indent=2))
+    second = store.save([data_dir])
+    before = store.stored_bytes()
+
+    dropped, freed = store.prune(keep=1)
+    assert dropped == 1 and freed > 0
+    assert store.stored_bytes() == before - freed
+    with pytest.raises(KeyError):
+        store.get(first["id"])
+
+    expected = (data_dir / "moves.json").read_bytes()
+    (data_dir / "moves.json").unlink()
+    store.restore(second["id"])
+    assert (data_dir / "moves.json").read_bytes() == expected
+    assert store.prune(keep=1) == (0, 0)
+
+
+def test_unknown_snapshot(store):
+    with pytest.raises(KeyError):
+        store.get("latest")
@@ -1,19 +1,12 @@
 #!/usr/bin/env python3
 """
-Fetch detailed move effect descriptions from pokemondb.net and add them
-to the moves JSON as a new field `detailed_effect`.
+Fetch detailed move effect descriptions from pokemondb.net.
 
-Usage:
-  python scripts/update_moves_detailed_effects.py --input assets/data/moves.json
-
-This script overwrites the input file by default and creates a backup
-with the `.bak` suffix.
+Used by the fetch_detailed_effects pass of moves_pipeline.py and by
+fetch_move_preview.py. To refresh `detailed_effect` in moves.json:
+  python scripts/moves_pipeline.py --fetch --only fetch_detailed_effects normalize_detailed_effect paragraph_breaks
 """
-import argparse
-import json
 import re
-import time
-from typing import Iterable
 
 import requests
 from bs4 import BeautifulSoup
@@ -59,7 +52,7 @@ def fetch_detailed_effect(slug: str, session: requests.Session) -> str | None:
                 # ensure spacing around replacement to avoid word joins
                 frac.replace_with(f" {new_text} ")
             else:
-                frac.replace_with(f" {frac.get_text(strip=True).replace("⁄", "/")} ")
+                frac.replace_with(f" {frac.get_text(strip=True).replace('⁄', '/')} ")
 
         # Replace <br> tags with a newline placeholder to preserve paragraph breaks
 
@@ -113,66 +106,3 @@ def fetch_detailed_effect(slug: str, session: requests.Session) -> str | None:
     # Join paragraphs with a single newline between them to preserve paragraph breaks
     return "\n".join(paragraphs)
 
-
-def iter_moves(data) -> Iterable[tuple[object, str]]:
-    # yield (move_obj, move_name) for either dict mapping or list
-    if isinstance(data, dict):
-        for key, val in data.items():
-            # if value is a dict containing a name field, prefer it
-            if isinstance(val, dict) and "name" in val and val["name"]:
-                yield val, val["name"]
-            else:
-                yield val, key
-    elif isinstance(data, list):
-        for item in data:
-            if isinstance(item, dict):
-                name = item.get("name") or item.get("move") or item.get("identifier")
-                if name:
-                    yield item, name
-    else:
-        return
-
-
-def main():
-    p = argparse.ArgumentParser(description="Update moves.json with detailed_effect from pokemondb.net")
-    p.add_argument("--input", required=True, help="Path to moves.json to update")
-    p.add_argument("--backup", action="store_true", help="Create a .bak backup of the input file")
-    p.add_argument("--delay", type=float, default=1.0, help="Seconds to sleep between requests (default: 1.0)")
-    p.add_argument("--timeout-on-fail", action="store_true", help="Stop on first fetch failure")
-    args = p.parse_args()
-
-    with open(args.input, "r", encoding="utf-8") as fh:
-        data = json.load(fh)
-
-    if args.backup:
-        with open(args.input + ".bak", "w", encoding="utf-8") as fh:
-            json.dump(data, fh, ensure_ascii=False, indent=2)
-
-    session = requests.Session()
-    total = 0
-    updated = 0
-
-    for move_obj, move_name in iter_moves(data):
-        total += 1
-        slug = slugify(move_name)
-        print(f"[{total}] Fetching: {move_name} -> {slug}")
-        detailed = fetch_detailed_effect(slug, session)
-        if detailed is None:
-            print(f"  Warning: no detailed effect found for '{move_name}' (slug: {slug})")
-            if args.timeout_on_fail:
-                print("Stopping due to --timeout-on-fail")
-                break
-        else:
-            move_obj["detailed_effect"] = detailed
-            updated += 1
-        time.sleep(args.delay)
-
-    # Write back to file
-    with open(args.input, "w", encoding="utf-8") as fh:
-        json.dump(data, fh, ensure_ascii=False, indent=2)
-
-    print(f"Done. Processed {total} moves, updated {updated} with `detailed_effect`.\n")
-
-
-if __name__ == "__main__":
-    main()
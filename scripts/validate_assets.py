@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Validate the data assets against the JSON Schemas in scripts/schemas/.
+
+Scrapers and mappers rewrite pokemon.json, moves.json and the learnset
+corpus in place, and a malformed entry used to surface only as a crash in the
+app. This stage checks every asset against a draft-07 schema, compiling each
+schema once per worker into a validator function and spreading the ~1,700
+files over a process pool. The first error of each file is reported with its
+JSON path and the run exits non-zero if any file fails.
+
+Schemas are compiled with fastjsonschema (see requirements.txt).
+
+The structuredEffects list in moves.schema.json is open: any effect needs a
+"type" string, and the types the battle simulation reads (StatChangeEffect,
+StatusConditionEffect, ...) have hand-written schemas in definitions/effects
+that require the fields the app uses and reject unknown ones. Add a schema
+there when the app starts reading a new effect type.
+
+Usage:
+    from validate_assets import ValidationError, compile_validator
+
+    validate = compile_validator("pokemon.schema.json")
+    validate(load(path))    # raises ValidationError
+
+Run:
+    python scripts/validate_assets.py [--workers N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import pathlib
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import fastjsonschema
+
+# Add scripts directory to path for relative imports
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+
+from championdex_data import ASSETS_DIR
+from json_io import load
+
+SCHEMA_DIR = pathlib.Path(__file__).resolve().parent / "schemas"
+
+# (schema reference, glob under assets/data); "file#/definitions/x" selects one definition
+TARGETS: Tuple[Tuple[str, str], ...] = (
+    ("pokemon.schema.json", "pokemon.json"),
+    ("moves.schema.json", "moves.json"),
+    ("abilities.schema.json", "abilities.json"),
+    ("pokemon_indexes.schema.json#/definitions/by_name", "pokemon_by_name.json"),
+    ("pokemon_indexes.schema.json#/definitions/by_number", "pokemon_by_number.json"),
+    ("pokemon_indexes.schema.json#/definitions/by_base_name", "pokemon_by_base_name.json"),
+    ("learnset.schema.json", "pokemon_moves/*.json"),
+    ("move_learners.schema.json", "moves_pokemon/*.json"),
+)
+
+Validator = Callable[[Any], None]
+
+
+class ValidationError(ValueError):
+    """An asset does not match its schema; the message starts with the JSON path."""
+
+
+def load_schema(ref: str) -> Dict:
+    """The schema document for "file" or "file#/definitions/name"."""
+    file_name, _, fragment = ref.partition("#")
+    schema = load(SCHEMA_DIR / file_name)
+    if fragment:
+        return {"definitions": schema.get("definitions", {}), "$ref": f"#{fragment}"}
+    return schema
+
+
+@functools.lru_cache(maxsize=None)
+def compile_validator(ref: str) -> Validator:
+    """Validator for a schema reference, compiled once per process."""
+    compiled = fastjsonschema.compile(load_schema(ref))
+
+    def validate(value: Any) -> None:
+        try:
+            compiled(value)
+        except fastjsonschema.JsonSchemaException as e:
+            raise ValidationError(str(e)) from e
+    return validate
+
+
+def _validate_file(ref: str, path: str) -> Tuple[str, Optional[str]]:
+    try:
+        compile_validator(ref)(load(path))
+    except ValidationError as e:
+        return path, str(e)
+    except ValueError as e:  # undecodable JSON
+        return path, f"invalid JSON: {e}"
+    return path, None
+
+
+def validate_assets(assets_dir: pathlib.Path = ASSETS_DIR, workers: Optional[int] = None) -> Dict[str, Dict]:
+    """{glob: {"files", "bytes", "errors": {relative path: message}}} for every target."""
+    jobs: List[Tuple[str, str, str]] = []
+    report: Dict[str, Dict] = {}
+    for ref, pattern in TARGETS:
+        paths = sorted(assets_dir.glob(pattern))
+        report[pattern] = {"files": len(paths), "bytes": sum(p.stat().st_size for p in paths), "errors": {}}
+        jobs.extend((ref, str(p), pattern) for p in paths)
+    # Largest files first so the single big documents do not finish last
+    jobs.sort(key=lambda job: -pathlib.Path(job[1]).stat().st_size)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(_validate_file, [j[0] for j in jobs], [j[1] for j in jobs], chunksize=16)
+        for (_, _, pattern), (path, error) in zip(jobs, results):
+            if error is not None:
+                report[pattern]["errors"][str(pathlib.Path(path).relative_to(assets_dir))] = error
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Validate data assets against scripts/schemas")
+    parser.add_argument("--workers", type=int, help="Process pool size (default: CPU count)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    report = validate_assets(workers=args.workers)
+    elapsed = time.perf_counter() - start
+    failed = 0
+    for pattern, result in report.items():
+        status = "✓" if not result["errors"] else "✗"
+        print(f"{status} {pattern:28} {result['files']:5} files {result['bytes'] / 1024 / 1024:7.2f} MB"
+              f"  {len(result['errors'])} invalid")
+        for path, error in sorted(result["errors"].items()):
+            print(f"    {path}: {error}")
+        failed += len(result["errors"])
+    total_files = sum(r["files"] for r in report.values())
+    total_bytes = sum(r["bytes"] for r in report.values())
+    print(f"Validated {total_files} files ({total_bytes / 1024 / 1024:.1f} MB) in {elapsed:.2f}s")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()